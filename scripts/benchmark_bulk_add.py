@@ -0,0 +1,69 @@
+"""
+Benchmark inserting new table models with session.add_all() and commit() against
+session.bulk_add(), with and without returning the generated primary keys.
+
+Run with:
+
+    python scripts/benchmark_bulk_add.py
+"""
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, delete
+
+number = 50_000
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    age: Optional[int] = None
+    created_at: datetime
+
+
+def create_heroes() -> List[Hero]:
+    now = datetime.now()
+    return [
+        Hero(
+            name=f"Hero {i}",
+            secret_name=f"Secret {i}",
+            age=i if i % 2 else None,
+            created_at=now,
+        )
+        for i in range(number)
+    ]
+
+
+def measure(label: str, engine: Any, insert: Callable[[Session, List[Hero]], Any]):
+    heroes = create_heroes()
+    with Session(engine) as session:
+        session.exec(delete(Hero))
+        session.commit()
+        start = time.perf_counter()
+        insert(session, heroes)
+        session.commit()
+        elapsed = time.perf_counter() - start
+    print(f"{label:>28}: {elapsed:.2f} s")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        SQLModel.metadata.create_all(engine)
+        print(f"Inserting {number} models")
+        measure("add_all", engine, lambda session, heroes: session.add_all(heroes))
+        measure("bulk_add", engine, lambda session, heroes: session.bulk_add(heroes))
+        measure(
+            "bulk_add(return_defaults)",
+            engine,
+            lambda session, heroes: session.bulk_add(heroes, return_defaults=True),
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
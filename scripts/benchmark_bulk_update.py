@@ -0,0 +1,65 @@
+"""
+Benchmark changing the status of many rows, loading the models and setting the
+attribute against session.bulk_update() with the primary keys.
+
+Run with:
+
+    python scripts/benchmark_bulk_update.py
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+number = 50_000
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    status: str = "active"
+
+
+def update_models(session: Session, ids: List[int], status: str) -> None:
+    for start in range(0, len(ids), 500):
+        statement = select(Hero).where(Hero.id.in_(ids[start : start + 500]))
+        for hero in session.exec(statement):
+            hero.status = status
+
+
+def update_rows(session: Session, ids: List[int], status: str) -> None:
+    session.bulk_update(Hero, [{"id": id, "status": status} for id in ids])
+
+
+def measure(
+    label: str, engine: Any, update: Callable[[Session, List[int], str], Any]
+) -> None:
+    ids = list(range(1, number + 1, 2))
+    with Session(engine) as session:
+        start = time.perf_counter()
+        update(session, ids, label)
+        session.commit()
+        elapsed = time.perf_counter() - start
+    print(f"{label:>12}: {elapsed:.2f} s")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.bulk_add(
+                Hero(name=f"Hero {i}", secret_name=f"Secret {i}") for i in range(number)
+            )
+            session.commit()
+        print(f"Updating the status of {number // 2} of {number} rows")
+        measure("models", engine, update_models)
+        measure("bulk_update", engine, update_rows)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
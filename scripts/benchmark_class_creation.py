@@ -0,0 +1,83 @@
+"""
+Benchmark creating a few hundred generated table models, as done when importing
+the models of a large application, and count how many times the SQLAlchemy
+column of each field is built and the time spent building them.
+
+Run with:
+
+    python scripts/benchmark_class_creation.py
+"""
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import Column, String
+
+from sqlmodel_v2_beta import Field, SQLModel
+from sqlmodel_v2_beta import main as sqlmodel_main
+from sqlmodel_v2_beta.main import default_registry
+
+number = 300
+repeat = 5
+
+field_types = [str, int, float, bool, datetime, Decimal, Optional[str], Optional[int]]
+
+
+def create_models() -> None:
+    for i in range(number):
+        annotations: Dict[str, Any] = {"id": Optional[int], "code": str}
+        namespace: Dict[str, Any] = {
+            "__annotations__": annotations,
+            "id": Field(default=None, primary_key=True),
+            "code": Field(sa_column=lambda: Column(String(20), unique=True)),
+        }
+        for j, field_type in enumerate(field_types):
+            annotations[f"field_{j}"] = field_type
+            namespace[f"field_{j}"] = Field(default=None, index=j % 2 == 0)
+        type(f"Model{i}", (SQLModel,), namespace, table=True)
+
+
+def count_columns() -> Tuple[int, float]:
+    original = sqlmodel_main.get_column_from_field
+    calls = 0
+    elapsed = 0.0
+
+    def get_column_from_field(field: Any) -> Any:
+        nonlocal calls, elapsed
+        calls += 1
+        start = time.perf_counter()
+        column = original(field)
+        elapsed += time.perf_counter() - start
+        return column
+
+    sqlmodel_main.get_column_from_field = get_column_from_field
+    try:
+        create_models()
+    finally:
+        sqlmodel_main.get_column_from_field = original
+        SQLModel.metadata.clear()
+        default_registry.dispose()
+    return calls, elapsed
+
+
+def main() -> None:
+    fields = number * (len(field_types) + 2)
+    print(f"Creating {number} table models with {fields} fields, best of {repeat}")
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        create_models()
+        best = min(best, time.perf_counter() - start)
+        SQLModel.metadata.clear()
+        default_registry.dispose()
+    print(f"{'total':>18}: {best:.3f} s ({best / number * 1000:.2f} ms/model)")
+    columns, columns_time = count_columns()
+    print(f"{'columns per field':>18}: {columns / fields:.1f}")
+    # Deriving the column types and options from the fields, and creating the
+    # columns, it's all that a cache of the derived columns could save
+    print(f"{'building columns':>18}: {columns_time:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
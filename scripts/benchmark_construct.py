@@ -0,0 +1,53 @@
+"""
+Benchmark trusted construction of table models against validated construction.
+
+Run with:
+
+    python scripts/benchmark_construct.py
+"""
+import time
+from typing import Any, Callable, List, Optional
+
+from sqlmodel_v2_beta import Field, SQLModel
+
+number = 100_000
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: Optional[int] = Field(default=None, index=True)
+
+
+rows = [
+    {"name": f"Hero {i}", "secret_name": f"Secret {i}", "age": i % 100}
+    for i in range(number)
+]
+
+
+def measure(label: str, build: Callable[[], List[Any]]) -> float:
+    start = time.perf_counter()
+    heroes = build()
+    elapsed = time.perf_counter() - start
+    assert len(heroes) == number
+    print(f"{label:>26}: {elapsed:.3f} s ({elapsed / number * 1_000_000:.2f} µs/row)")
+    return elapsed
+
+
+def main() -> None:
+    print(f"Building {number} Hero instances")
+    validated = measure("Hero(**row)", lambda: [Hero(**row) for row in rows])
+    measure("Hero.model_validate_many", lambda: Hero.model_validate_many(rows))
+    measure(
+        "Hero.model_construct(**row)",
+        lambda: [Hero.model_construct(**row) for row in rows],
+    )
+    trusted = measure(
+        "Hero.model_construct_many", lambda: Hero.model_construct_many(rows)
+    )
+    print(f"{'speedup':>26}: {validated / trusted:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Benchmark calling create_all() at startup on a database that already has the tables
+of a few hundred models, against create_all_if_changed(), counting the statements
+sent to the database. It's measured with the local SQLite database, and adding a
+simulated network round trip to each statement, as with a database server.
+
+Run with:
+
+    python scripts/benchmark_create_all.py
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import event
+
+from sqlmodel_v2_beta import Field, SQLModel, create_all_if_changed, create_engine
+
+number = 300
+repeat = 5
+round_trip = 0.001
+
+
+def create_models() -> None:
+    for i in range(number):
+        annotations: Dict[str, Any] = {"id": Optional[int], "name": str}
+        namespace: Dict[str, Any] = {
+            "__annotations__": annotations,
+            "id": Field(default=None, primary_key=True),
+            "name": Field(index=True),
+        }
+        type(f"Model{i}", (SQLModel,), namespace, table=True)
+
+
+def measure(label: str, engine: Any, create: Callable[[], Any]) -> None:
+    statements = 0
+
+    def count(*args: Any) -> None:
+        nonlocal statements
+        statements += 1
+
+    def wait(*args: Any) -> None:
+        time.sleep(round_trip)
+
+    results = []
+    for listener in (None, wait):
+        if listener:
+            event.listen(engine, "before_cursor_execute", listener)
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            create()
+            best = min(best, time.perf_counter() - start)
+        if listener:
+            event.remove(engine, "before_cursor_execute", listener)
+        results.append(f"{best * 1000:.1f} ms")
+    event.listen(engine, "before_cursor_execute", count)
+    create()
+    event.remove(engine, "before_cursor_execute", count)
+    local, with_round_trips = results
+    print(
+        f"{label:>22}: {local}, {with_round_trips} with round trips, "
+        f"{statements} statements"
+    )
+
+
+def main() -> None:
+    create_models()
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        create_all_if_changed(engine)
+        print(f"Creating the tables of {number} models again, best of {repeat}")
+        print(f"Round trip: {round_trip * 1000:.0f} ms")
+        measure("create_all", engine, lambda: SQLModel.metadata.create_all(engine))
+        measure("create_all_if_changed", engine, lambda: create_all_if_changed(engine))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
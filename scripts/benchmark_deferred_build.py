@@ -0,0 +1,89 @@
+"""
+Benchmark creating a few hundred generated table models with and without
+model_config["defer_build"], the time and the memory they keep allocated, as done
+when starting an application that imports all its models but uses only some.
+
+Run with:
+
+    python scripts/benchmark_deferred_build.py
+"""
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy.orm import configure_mappers
+
+from sqlmodel_v2_beta import Field, SQLModel
+from sqlmodel_v2_beta.main import default_registry
+
+number = 300
+repeat = 5
+
+field_types = [str, int, float, bool, datetime, Decimal, Optional[str], Optional[int]]
+
+
+def create_models(defer_build: bool) -> List[Any]:
+    models = []
+    for i in range(number):
+        annotations: Dict[str, Any] = {"id": Optional[int]}
+        namespace: Dict[str, Any] = {
+            "__annotations__": annotations,
+            "id": Field(default=None, primary_key=True),
+        }
+        for j, field_type in enumerate(field_types):
+            annotations[f"field_{j}"] = field_type
+            namespace[f"field_{j}"] = Field(default=None, index=j % 2 == 0)
+        models.append(
+            type(
+                f"Model{i}",
+                (SQLModel,),
+                namespace,
+                table=True,
+                defer_build=defer_build,
+            )
+        )
+    return models
+
+
+def measure(defer_build: bool) -> Tuple[float, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        create_models(defer_build)
+        best = min(best, time.perf_counter() - start)
+        SQLModel.metadata.clear()
+        default_registry.dispose()
+    gc.collect()
+    tracemalloc.start()
+    models = create_models(defer_build)
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    SQLModel.metadata.clear()
+    default_registry.dispose()
+    return best, memory / 1024 / 1024
+
+
+def main() -> None:
+    print(f"Creating {number} table models, best of {repeat}")
+    eager_time, eager_memory = measure(defer_build=False)
+    deferred_time, deferred_memory = measure(defer_build=True)
+    print(f"{'eager':>10}: {eager_time:.3f} s, {eager_memory:.1f} MiB")
+    print(f"{'deferred':>10}: {deferred_time:.3f} s, {deferred_memory:.1f} MiB")
+    print(f"{'speedup':>10}: {eager_time / deferred_time:.2f}x")
+
+    models = create_models(defer_build=True)
+    # Configured on first use too, with or without defer_build
+    configure_mappers()
+    start = time.perf_counter()
+    models[0](field_0="first")
+    first = time.perf_counter() - start
+    print(f"{'first use':>10}: {first * 1000:.2f} ms to build one deferred model")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark loading a list of models by primary key, calling session.get() for each
+one against a single session.get_many() call.
+
+Run with:
+
+    python scripts/benchmark_get_many.py
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, insert
+
+number = 10_000
+lookups = 500
+repeat = 5
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+
+
+def measure(
+    label: str, engine: Any, load: Callable[[Session, List[int]], Any]
+) -> float:
+    ids = list(range(1, number + 1, number // lookups))
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            load(session, ids)
+            best = min(best, time.perf_counter() - start)
+    print(f"{label:>10}: {best * 1000:.1f} ms")
+    return best
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.execute(
+                insert(Hero), [{"name": f"Hero {i}"} for i in range(number)]
+            )
+            session.commit()
+        print(f"Loading {lookups} heroes by primary key, best of {repeat}")
+        get = measure(
+            "get", engine, lambda session, ids: [session.get(Hero, id) for id in ids]
+        )
+        get_many = measure(
+            "get_many", engine, lambda session, ids: session.get_many(Hero, ids)
+        )
+        print(f"{'speedup':>10}: {get / get_many:.1f}x")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
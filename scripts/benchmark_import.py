@@ -0,0 +1,44 @@
+"""
+Benchmark the import time of sqlmodel_v2_beta in new interpreters: importing the
+package alone, importing only SQLModel and Field, and importing all the names it
+exports (what importing the package did before the names were loaded lazily).
+
+Run with:
+
+    python scripts/benchmark_import.py
+"""
+import subprocess
+import sys
+
+repeat = 10
+
+code = """
+import time
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(label: str, statement: str) -> float:
+    times = []
+    for _ in range(repeat):
+        output = subprocess.check_output(
+            [sys.executable, "-c", code.format(statement=statement)]
+        )
+        times.append(float(output))
+    best = min(times)
+    print(f"{label:>28}: {best * 1000:.1f} ms")
+    return best
+
+
+def main() -> None:
+    print(f"Importing sqlmodel_v2_beta in a new interpreter, best of {repeat}")
+    package = measure("import sqlmodel_v2_beta", "import sqlmodel_v2_beta")
+    measure("import SQLModel, Field", "from sqlmodel_v2_beta import SQLModel, Field")
+    everything = measure("import *", "from sqlmodel_v2_beta import *")
+    print(f"{'package speedup':>28}: {everything / package:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Micro-benchmark for constructing table model instances with SQLModel.__init__.
+
+Compares the current constructor with the previous implementation, that copied
+__dict__ before validation, rebuilt it merging both dicts afterwards and computed
+the non-field keys of the input data on every call.
+
+Run with:
+
+    python scripts/benchmark_init.py
+"""
+import timeit
+from typing import Any, Optional
+
+from sqlmodel_v2_beta import Field, SQLModel
+
+number = 200_000
+repeat = 5
+
+
+def legacy_init(self: Any, **data: Any) -> None:
+    old_dict = self.__dict__.copy()
+    super(SQLModel, self).__init__(**data)
+    self.__dict__ = {**old_dict, **self.__dict__}
+    non_pydantic_keys = data.keys() - self.model_fields
+    for key in non_pydantic_keys:
+        if key in self.__sqlmodel_relationships__:
+            setattr(self, key, data[key])
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: Optional[int] = Field(default=None, index=True)
+
+
+class LegacyHero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: Optional[int] = Field(default=None, index=True)
+
+    __init__ = legacy_init
+
+
+def measure(label: str, model: Any) -> float:
+    def build() -> None:
+        model(name="Deadpond", secret_name="Dive Wilson", age=48)
+
+    best = min(timeit.repeat(build, number=number, repeat=repeat))
+    per_instance = best / number * 1_000_000
+    print(f"{label:>8}: {per_instance:.3f} µs per instance")
+    return per_instance
+
+
+def main() -> None:
+    print(f"Building {number} Hero instances, best of {repeat}")
+    before = measure("before", LegacyHero)
+    after = measure("after", Hero)
+    print(f"{'speedup':>8}: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
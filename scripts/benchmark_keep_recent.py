@@ -0,0 +1,69 @@
+"""
+Benchmark a worker with a long-lived session that looks up models by primary key,
+most of them from a small set of frequently used ones, without keeping them, with
+the default identity map against keep_recent, measuring the time and the models
+found in the session.
+
+Run with:
+
+    python scripts/benchmark_keep_recent.py
+"""
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, List, Optional
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine
+
+number = 100_000
+lookups = 100_000
+hot_number = 2000
+recent = 5000
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    age: int = 0
+
+
+def run_worker(engine: Any, ids: List[int], keep_recent: Optional[int]) -> None:
+    start = time.perf_counter()
+    ages = 0
+    with Session(engine, keep_recent=keep_recent) as session:
+        for hero_id in ids:
+            hero = session.get(Hero, hero_id)
+            assert hero is not None
+            ages += hero.age
+        elapsed = time.perf_counter() - start
+        stats = session.identity_map_stats
+    print(
+        f"{str(keep_recent):>12}: {elapsed:.2f} s, {stats.size} models in "
+        f"the session, {stats.hits} found, {stats.released} released"
+    )
+
+
+def main() -> None:
+    rng = random.Random(0)
+    ids = [
+        rng.randint(1, hot_number) if rng.random() < 0.9 else rng.randint(1, number)
+        for _ in range(lookups)
+    ]
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.bulk_add(
+                Hero(name=f"Hero {i}", secret_name=f"Secret {i}") for i in range(number)
+            )
+            session.commit()
+        print(f"Looking up {lookups} of {number} models")
+        run_worker(engine, ids, None)
+        run_worker(engine, ids, recent)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
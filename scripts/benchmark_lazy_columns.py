@@ -0,0 +1,66 @@
+"""
+Benchmark loading wide table models from the database, with and without
+model_config["lazy_load_columns"], reading only a couple of the columns.
+
+Run with:
+
+    python scripts/benchmark_lazy_columns.py
+"""
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Type
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+number = 20_000
+columns = 40
+repeat = 3
+
+
+def create_model(name: str, lazy: bool) -> Type[SQLModel]:
+    annotations: Dict[str, Any] = {"id": Optional[int]}
+    namespace: Dict[str, Any] = {
+        "__annotations__": annotations,
+        "id": Field(default=None, primary_key=True),
+    }
+    for i in range(columns):
+        annotations[f"column_{i}"] = datetime
+        namespace[f"column_{i}"] = Field(default_factory=datetime.now)
+    return type(name, (SQLModel,), namespace, table=True, lazy_load_columns=lazy)
+
+
+Eager = create_model("Eager", lazy=False)
+Lazy = create_model("Lazy", lazy=True)
+
+
+def measure(label: str, engine: Any, model: Type[SQLModel]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        with Session(engine) as session:
+            start = time.perf_counter()
+            for item in session.exec(select(model)):
+                getattr(item, "column_0")
+                getattr(item, "column_1")
+            best = min(best, time.perf_counter() - start)
+    print(f"{label:>8}: {best:.3f} s ({best / number * 1_000_000:.2f} µs/row)")
+    return best
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        for model in (Eager, Lazy):
+            session.add_all(model() for _ in range(number))
+        session.commit()
+    print(
+        f"Loading {number} rows with {columns} DateTime columns, "
+        f"reading 2 of them, best of {repeat}"
+    )
+    eager = measure("eager", engine, Eager)
+    lazy = measure("lazy", engine, Lazy)
+    print(f"{'speedup':>8}: {eager / lazy:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
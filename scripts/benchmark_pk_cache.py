@@ -0,0 +1,62 @@
+"""
+Benchmark requests looking up a few rows of a small table with session.get(), each
+one with its own session, for a model without and with model_config["pk_cache"].
+
+Run with:
+
+    python scripts/benchmark_pk_cache.py
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Type
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine
+
+number = 50
+requests = 5000
+lookups = 3
+
+
+class Team(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    headquarters: str
+
+
+class CachedTeam(SQLModel, table=True, pk_cache={"max_size": 1000, "ttl": 60}):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    headquarters: str
+
+
+def measure(label: str, engine: Any, model: Type[Any]) -> None:
+    start = time.perf_counter()
+    for i in range(requests):
+        with Session(engine) as session:
+            for j in range(lookups):
+                team = session.get(model, (i + j) % number + 1)
+                team.name
+    elapsed = time.perf_counter() - start
+    print(f"{label:>9}: {elapsed:.2f} s")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            for model in (Team, CachedTeam):
+                session.bulk_add(
+                    model(name=f"Team {i}", headquarters=f"Tower {i}")
+                    for i in range(number)
+                )
+            session.commit()
+        print(f"{requests} requests with {lookups} lookups each, {number} rows")
+        measure("get", engine, Team)
+        measure("pk_cache", engine, CachedTeam)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
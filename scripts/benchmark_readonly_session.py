@@ -0,0 +1,72 @@
+"""
+Benchmark read requests loading many models, with a Session against a
+ReadOnlySession, each one running a few queries, committing the transaction and
+then reading the models, as when the response is built after the commit.
+
+Run with:
+
+    python scripts/benchmark_readonly_session.py
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional, Type
+
+from sqlmodel_v2_beta import (
+    Field,
+    ReadOnlySession,
+    Session,
+    SQLModel,
+    create_engine,
+    select,
+)
+
+number = 10_000
+requests = 20
+page_size = 1000
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    age: Optional[int] = None
+
+
+def handle_request(engine: Any, session_class: Type[Session], page: int) -> int:
+    with session_class(engine) as session:
+        statement = select(Hero).offset(page * page_size).limit(page_size)
+        heroes = session.exec(statement).all()
+        # More queries, each one autoflushes with a Session
+        for hero in heroes[:100]:
+            session.get(Hero, hero.id)
+        session.commit()
+        return sum(len(hero.name) for hero in heroes)
+
+
+def measure(label: str, engine: Any, session_class: Type[Session]) -> None:
+    start = time.perf_counter()
+    for i in range(requests):
+        handle_request(engine, session_class, i % (number // page_size))
+    elapsed = time.perf_counter() - start
+    print(f"{label:>16}: {elapsed:.2f} s")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.bulk_add(
+                Hero(name=f"Hero {i}", secret_name=f"Secret {i}", age=i)
+                for i in range(number)
+            )
+            session.commit()
+        print(f"{requests} requests loading {page_size} models each")
+        measure("Session", engine, Session)
+        measure("ReadOnlySession", engine, ReadOnlySession)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Benchmark requests repeating the same few select() statements, each one with its
+own session, without a cache and with a ResultCache shared by the sessions.
+
+Run with:
+
+    python scripts/benchmark_result_cache.py
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlmodel_v2_beta import (
+    Field,
+    ResultCache,
+    Session,
+    SQLModel,
+    create_engine,
+    select,
+)
+
+number = 10_000
+requests = 2000
+distinct_statements = 20
+page_size = 50
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    secret_name: str
+    age: Optional[int] = Field(default=None, index=True)
+
+
+def measure(label: str, engine: Any, result_cache: Optional[ResultCache]) -> None:
+    start = time.perf_counter()
+    for i in range(requests):
+        with Session(engine, result_cache=result_cache) as session:
+            statement = (
+                select(Hero)
+                .where(Hero.age >= i % distinct_statements)
+                .order_by(Hero.age)
+                .limit(page_size)
+            )
+            for hero in session.exec(statement):
+                hero.name
+    elapsed = time.perf_counter() - start
+    print(f"{label:>8}: {elapsed:.2f} s")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.bulk_add(
+                Hero(name=f"Hero {i}", secret_name=f"Secret {i}", age=i % 100)
+                for i in range(number)
+            )
+            session.commit()
+        print(
+            f"{requests} requests, {distinct_statements} distinct statements "
+            f"loading {page_size} models"
+        )
+        measure("no cache", engine, None)
+        measure("cache", engine, ResultCache())
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
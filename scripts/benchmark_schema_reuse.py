@@ -0,0 +1,66 @@
+"""
+Benchmark creating subclasses that don't add fields, like HeroCreate(HeroBase) in
+the FastAPI tutorial, reusing the schema of the parent against generating it again,
+and the memory they keep allocated.
+
+Run with:
+
+    python scripts/benchmark_schema_reuse.py
+"""
+import gc
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+from sqlmodel_v2_beta import Field, SQLModel
+from sqlmodel_v2_beta import main as sqlmodel_main
+
+number = 300
+repeat = 5
+
+
+class HeroBase(SQLModel):
+    name: str = Field(index=True)
+    secret_name: str
+    age: Optional[int] = Field(default=None, index=True)
+    born: Optional[datetime] = None
+    tags: List[str] = []
+
+
+def create_models() -> List[Any]:
+    return [type(f"HeroCreate{i}", (HeroBase,), {}) for i in range(number)]
+
+
+def measure() -> Tuple[float, float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        create_models()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    models = create_models()
+    gc.collect()
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del models
+    return best, memory / 1024 / 1024
+
+
+def main() -> None:
+    print(f"Creating {number} subclasses without new fields, best of {repeat}")
+    reused_time, reused_memory = measure()
+    original = sqlmodel_main._get_schema_parent
+    sqlmodel_main._get_schema_parent = lambda bases, class_dict: None
+    try:
+        generated_time, generated_memory = measure()
+    finally:
+        sqlmodel_main._get_schema_parent = original
+    print(f"{'generated':>10}: {generated_time:.3f} s, {generated_memory:.1f} MiB")
+    print(f"{'reused':>10}: {reused_time:.3f} s, {reused_memory:.1f} MiB")
+    print(f"{'speedup':>10}: {generated_time / reused_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Benchmark serializing table models loaded from the database to JSON, with the
+per-class serializer used by SQLModel.model_dump_json_many() against calling
+model_dump_json() on each instance.
+
+Run with:
+
+    python scripts/benchmark_serialize.py
+"""
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+number = 100_000
+repeat = 5
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(index=True)
+    secret_name: str
+    age: Optional[int] = Field(default=None, index=True)
+    created_at: datetime = Field(default_factory=datetime.now)
+
+
+def measure(label: str, dump: Callable[[], bytes]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        dump()
+        best = min(best, time.perf_counter() - start)
+    print(f"{label:>26}: {best:.3f} s ({best / number * 1_000_000:.2f} µs/row)")
+    return best
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(
+            Hero(name=f"Hero {i}", secret_name=f"Secret {i}", age=i % 100)
+            for i in range(number)
+        )
+        session.commit()
+
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero)).all()
+        print(
+            f"Serializing {number} Hero instances loaded from the DB, best of {repeat}"
+        )
+        current = measure(
+            "model_dump_json()",
+            lambda: b"["
+            + b",".join(hero.model_dump_json().encode() for hero in heroes)
+            + b"]",
+        )
+        compiled = measure(
+            "Hero.model_dump_json_many", lambda: Hero.model_dump_json_many(heroes)
+        )
+        print(f"{'speedup':>26}: {current / compiled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark inserting or updating models by a unique field, half of them already in
+the database, loading the existing ones and updating them through the session against
+session.upsert().
+
+Run with:
+
+    python scripts/benchmark_upsert.py
+"""
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, List, Optional
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, delete, select
+
+number = 20_000
+
+
+class Hero(SQLModel, table=True):
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str = Field(unique=True)
+    secret_name: str
+    age: Optional[int] = None
+
+
+def create_heroes(start: int, age: int) -> List[Hero]:
+    return [
+        Hero(name=f"Hero {i}", secret_name=f"Secret {i}", age=age)
+        for i in range(start, start + number)
+    ]
+
+
+def merge_heroes(session: Session, heroes: List[Hero]) -> None:
+    names = [hero.name for hero in heroes]
+    existing = {}
+    for start in range(0, len(names), 500):
+        statement = select(Hero).where(Hero.name.in_(names[start : start + 500]))
+        existing.update((hero.name, hero) for hero in session.exec(statement))
+    for hero in heroes:
+        current = existing.get(hero.name)
+        if current is None:
+            session.add(hero)
+        else:
+            current.secret_name = hero.secret_name
+            current.age = hero.age
+
+
+def measure(label: str, engine: Any, upsert: Callable[[Session, List[Hero]], Any]):
+    with Session(engine) as session:
+        session.exec(delete(Hero))
+        session.bulk_add(create_heroes(0, age=1))
+        session.commit()
+    heroes = create_heroes(number // 2, age=2)
+    with Session(engine) as session:
+        start = time.perf_counter()
+        upsert(session, heroes)
+        session.commit()
+        elapsed = time.perf_counter() - start
+    print(f"{label:>8}: {elapsed:.2f} s")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'database.db'}")
+        SQLModel.metadata.create_all(engine)
+        print(f"Inserting or updating {number} models, half of them new")
+        measure("session", engine, merge_heroes)
+        measure(
+            "upsert",
+            engine,
+            lambda session, heroes: session.upsert(heroes, conflict_on=["name"]),
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,138 +1,312 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
 __version__ = "0.0.11"
 
-# Re-export from SQLAlchemy
-from sqlalchemy.engine import create_mock_engine as create_mock_engine
-from sqlalchemy.engine import engine_from_config as engine_from_config
-from sqlalchemy.inspection import inspect as inspect
-from sqlalchemy.schema import BLANK_SCHEMA as BLANK_SCHEMA
-from sqlalchemy.schema import DDL as DDL
-from sqlalchemy.schema import CheckConstraint as CheckConstraint
-from sqlalchemy.schema import Column as Column
-from sqlalchemy.schema import ColumnDefault as ColumnDefault
-from sqlalchemy.schema import Computed as Computed
-from sqlalchemy.schema import Constraint as Constraint
-from sqlalchemy.schema import DefaultClause as DefaultClause
-from sqlalchemy.schema import FetchedValue as FetchedValue
-from sqlalchemy.schema import ForeignKey as ForeignKey
-from sqlalchemy.schema import ForeignKeyConstraint as ForeignKeyConstraint
-from sqlalchemy.schema import Identity as Identity
-from sqlalchemy.schema import Index as Index
-from sqlalchemy.schema import MetaData as MetaData
-from sqlalchemy.schema import PrimaryKeyConstraint as PrimaryKeyConstraint
-from sqlalchemy.schema import Sequence as Sequence
-from sqlalchemy.schema import Table as Table
-from sqlalchemy.schema import UniqueConstraint as UniqueConstraint
-from sqlalchemy.sql import LABEL_STYLE_DEFAULT as LABEL_STYLE_DEFAULT
-from sqlalchemy.sql import (
-    LABEL_STYLE_DISAMBIGUATE_ONLY as LABEL_STYLE_DISAMBIGUATE_ONLY,
-)
-from sqlalchemy.sql import LABEL_STYLE_NONE as LABEL_STYLE_NONE
-from sqlalchemy.sql import (
-    LABEL_STYLE_TABLENAME_PLUS_COL as LABEL_STYLE_TABLENAME_PLUS_COL,
-)
-from sqlalchemy.sql import Subquery as Subquery
-from sqlalchemy.sql import alias as alias
-from sqlalchemy.sql import all_ as all_
-from sqlalchemy.sql import and_ as and_
-from sqlalchemy.sql import any_ as any_
-from sqlalchemy.sql import asc as asc
-from sqlalchemy.sql import between as between
-from sqlalchemy.sql import bindparam as bindparam
-from sqlalchemy.sql import case as case
-from sqlalchemy.sql import cast as cast
-from sqlalchemy.sql import collate as collate
-from sqlalchemy.sql import column as column
-from sqlalchemy.sql import delete as delete
-from sqlalchemy.sql import desc as desc
-from sqlalchemy.sql import distinct as distinct
-from sqlalchemy.sql import except_ as except_
-from sqlalchemy.sql import except_all as except_all
-from sqlalchemy.sql import exists as exists
-from sqlalchemy.sql import extract as extract
-from sqlalchemy.sql import false as false
-from sqlalchemy.sql import func as func
-from sqlalchemy.sql import funcfilter as funcfilter
-from sqlalchemy.sql import insert as insert
-from sqlalchemy.sql import intersect as intersect
-from sqlalchemy.sql import intersect_all as intersect_all
-from sqlalchemy.sql import join as join
-from sqlalchemy.sql import lambda_stmt as lambda_stmt
-from sqlalchemy.sql import lateral as lateral
-from sqlalchemy.sql import literal as literal
-from sqlalchemy.sql import literal_column as literal_column
-from sqlalchemy.sql import modifier as modifier
-from sqlalchemy.sql import not_ as not_
-from sqlalchemy.sql import null as null
-from sqlalchemy.sql import nulls_first as nulls_first
-from sqlalchemy.sql import nulls_last as nulls_last
-from sqlalchemy.sql import nullsfirst as nullsfirst
-from sqlalchemy.sql import nullslast as nullslast
-from sqlalchemy.sql import or_ as or_
-from sqlalchemy.sql import outerjoin as outerjoin
-from sqlalchemy.sql import outparam as outparam
-from sqlalchemy.sql import over as over
-from sqlalchemy.sql import table as table
-from sqlalchemy.sql import tablesample as tablesample
-from sqlalchemy.sql import text as text
-from sqlalchemy.sql import true as true
-from sqlalchemy.sql import tuple_ as tuple_
-from sqlalchemy.sql import type_coerce as type_coerce
-from sqlalchemy.sql import union as union
-from sqlalchemy.sql import union_all as union_all
-from sqlalchemy.sql import update as update
-from sqlalchemy.sql import values as values
-from sqlalchemy.sql import within_group as within_group
-from sqlalchemy.types import ARRAY as ARRAY
-from sqlalchemy.types import BIGINT as BIGINT
-from sqlalchemy.types import BINARY as BINARY
-from sqlalchemy.types import BLOB as BLOB
-from sqlalchemy.types import BOOLEAN as BOOLEAN
-from sqlalchemy.types import CHAR as CHAR
-from sqlalchemy.types import CLOB as CLOB
-from sqlalchemy.types import DATE as DATE
-from sqlalchemy.types import DATETIME as DATETIME
-from sqlalchemy.types import DECIMAL as DECIMAL
-from sqlalchemy.types import FLOAT as FLOAT
-from sqlalchemy.types import INT as INT
-from sqlalchemy.types import INTEGER as INTEGER
-from sqlalchemy.types import JSON as JSON
-from sqlalchemy.types import NCHAR as NCHAR
-from sqlalchemy.types import NUMERIC as NUMERIC
-from sqlalchemy.types import NVARCHAR as NVARCHAR
-from sqlalchemy.types import REAL as REAL
-from sqlalchemy.types import SMALLINT as SMALLINT
-from sqlalchemy.types import TEXT as TEXT
-from sqlalchemy.types import TIME as TIME
-from sqlalchemy.types import TIMESTAMP as TIMESTAMP
-from sqlalchemy.types import VARBINARY as VARBINARY
-from sqlalchemy.types import VARCHAR as VARCHAR
-from sqlalchemy.types import BigInteger as BigInteger
-from sqlalchemy.types import Boolean as Boolean
-from sqlalchemy.types import Date as Date
-from sqlalchemy.types import DateTime as DateTime
-from sqlalchemy.types import Enum as Enum
-from sqlalchemy.types import Float as Float
-from sqlalchemy.types import Integer as Integer
-from sqlalchemy.types import Interval as Interval
-from sqlalchemy.types import LargeBinary as LargeBinary
-from sqlalchemy.types import Numeric as Numeric
-from sqlalchemy.types import PickleType as PickleType
-from sqlalchemy.types import SmallInteger as SmallInteger
-from sqlalchemy.types import String as String
-from sqlalchemy.types import Text as Text
-from sqlalchemy.types import Time as Time
-from sqlalchemy.types import TypeDecorator as TypeDecorator
-from sqlalchemy.types import Unicode as Unicode
-from sqlalchemy.types import UnicodeText as UnicodeText
+# The names are imported on first access (PEP 562), importing the package only
+# loads the modules of the names used, the imports are kept for type checkers
+if TYPE_CHECKING:
+    # Re-export from SQLAlchemy
+    from sqlalchemy.engine import create_mock_engine as create_mock_engine
+    from sqlalchemy.engine import engine_from_config as engine_from_config
+    from sqlalchemy.inspection import inspect as inspect
+    from sqlalchemy.schema import BLANK_SCHEMA as BLANK_SCHEMA
+    from sqlalchemy.schema import DDL as DDL
+    from sqlalchemy.schema import CheckConstraint as CheckConstraint
+    from sqlalchemy.schema import Column as Column
+    from sqlalchemy.schema import ColumnDefault as ColumnDefault
+    from sqlalchemy.schema import Computed as Computed
+    from sqlalchemy.schema import Constraint as Constraint
+    from sqlalchemy.schema import DefaultClause as DefaultClause
+    from sqlalchemy.schema import FetchedValue as FetchedValue
+    from sqlalchemy.schema import ForeignKey as ForeignKey
+    from sqlalchemy.schema import ForeignKeyConstraint as ForeignKeyConstraint
+    from sqlalchemy.schema import Identity as Identity
+    from sqlalchemy.schema import Index as Index
+    from sqlalchemy.schema import MetaData as MetaData
+    from sqlalchemy.schema import PrimaryKeyConstraint as PrimaryKeyConstraint
+    from sqlalchemy.schema import Sequence as Sequence
+    from sqlalchemy.schema import Table as Table
+    from sqlalchemy.schema import UniqueConstraint as UniqueConstraint
+    from sqlalchemy.sql import LABEL_STYLE_DEFAULT as LABEL_STYLE_DEFAULT
+    from sqlalchemy.sql import (
+        LABEL_STYLE_DISAMBIGUATE_ONLY as LABEL_STYLE_DISAMBIGUATE_ONLY,
+    )
+    from sqlalchemy.sql import LABEL_STYLE_NONE as LABEL_STYLE_NONE
+    from sqlalchemy.sql import (
+        LABEL_STYLE_TABLENAME_PLUS_COL as LABEL_STYLE_TABLENAME_PLUS_COL,
+    )
+    from sqlalchemy.sql import Subquery as Subquery
+    from sqlalchemy.sql import alias as alias
+    from sqlalchemy.sql import all_ as all_
+    from sqlalchemy.sql import and_ as and_
+    from sqlalchemy.sql import any_ as any_
+    from sqlalchemy.sql import asc as asc
+    from sqlalchemy.sql import between as between
+    from sqlalchemy.sql import bindparam as bindparam
+    from sqlalchemy.sql import case as case
+    from sqlalchemy.sql import cast as cast
+    from sqlalchemy.sql import collate as collate
+    from sqlalchemy.sql import column as column
+    from sqlalchemy.sql import delete as delete
+    from sqlalchemy.sql import desc as desc
+    from sqlalchemy.sql import distinct as distinct
+    from sqlalchemy.sql import except_ as except_
+    from sqlalchemy.sql import except_all as except_all
+    from sqlalchemy.sql import exists as exists
+    from sqlalchemy.sql import extract as extract
+    from sqlalchemy.sql import false as false
+    from sqlalchemy.sql import func as func
+    from sqlalchemy.sql import funcfilter as funcfilter
+    from sqlalchemy.sql import insert as insert
+    from sqlalchemy.sql import intersect as intersect
+    from sqlalchemy.sql import intersect_all as intersect_all
+    from sqlalchemy.sql import join as join
+    from sqlalchemy.sql import lambda_stmt as lambda_stmt
+    from sqlalchemy.sql import lateral as lateral
+    from sqlalchemy.sql import literal as literal
+    from sqlalchemy.sql import literal_column as literal_column
+    from sqlalchemy.sql import modifier as modifier
+    from sqlalchemy.sql import not_ as not_
+    from sqlalchemy.sql import null as null
+    from sqlalchemy.sql import nulls_first as nulls_first
+    from sqlalchemy.sql import nulls_last as nulls_last
+    from sqlalchemy.sql import nullsfirst as nullsfirst
+    from sqlalchemy.sql import nullslast as nullslast
+    from sqlalchemy.sql import or_ as or_
+    from sqlalchemy.sql import outerjoin as outerjoin
+    from sqlalchemy.sql import outparam as outparam
+    from sqlalchemy.sql import over as over
+    from sqlalchemy.sql import table as table
+    from sqlalchemy.sql import tablesample as tablesample
+    from sqlalchemy.sql import text as text
+    from sqlalchemy.sql import true as true
+    from sqlalchemy.sql import tuple_ as tuple_
+    from sqlalchemy.sql import type_coerce as type_coerce
+    from sqlalchemy.sql import union as union
+    from sqlalchemy.sql import union_all as union_all
+    from sqlalchemy.sql import update as update
+    from sqlalchemy.sql import values as values
+    from sqlalchemy.sql import within_group as within_group
+    from sqlalchemy.types import ARRAY as ARRAY
+    from sqlalchemy.types import BIGINT as BIGINT
+    from sqlalchemy.types import BINARY as BINARY
+    from sqlalchemy.types import BLOB as BLOB
+    from sqlalchemy.types import BOOLEAN as BOOLEAN
+    from sqlalchemy.types import CHAR as CHAR
+    from sqlalchemy.types import CLOB as CLOB
+    from sqlalchemy.types import DATE as DATE
+    from sqlalchemy.types import DATETIME as DATETIME
+    from sqlalchemy.types import DECIMAL as DECIMAL
+    from sqlalchemy.types import FLOAT as FLOAT
+    from sqlalchemy.types import INT as INT
+    from sqlalchemy.types import INTEGER as INTEGER
+    from sqlalchemy.types import JSON as JSON
+    from sqlalchemy.types import NCHAR as NCHAR
+    from sqlalchemy.types import NUMERIC as NUMERIC
+    from sqlalchemy.types import NVARCHAR as NVARCHAR
+    from sqlalchemy.types import REAL as REAL
+    from sqlalchemy.types import SMALLINT as SMALLINT
+    from sqlalchemy.types import TEXT as TEXT
+    from sqlalchemy.types import TIME as TIME
+    from sqlalchemy.types import TIMESTAMP as TIMESTAMP
+    from sqlalchemy.types import VARBINARY as VARBINARY
+    from sqlalchemy.types import VARCHAR as VARCHAR
+    from sqlalchemy.types import BigInteger as BigInteger
+    from sqlalchemy.types import Boolean as Boolean
+    from sqlalchemy.types import Date as Date
+    from sqlalchemy.types import DateTime as DateTime
+    from sqlalchemy.types import Enum as Enum
+    from sqlalchemy.types import Float as Float
+    from sqlalchemy.types import Integer as Integer
+    from sqlalchemy.types import Interval as Interval
+    from sqlalchemy.types import LargeBinary as LargeBinary
+    from sqlalchemy.types import Numeric as Numeric
+    from sqlalchemy.types import PickleType as PickleType
+    from sqlalchemy.types import SmallInteger as SmallInteger
+    from sqlalchemy.types import String as String
+    from sqlalchemy.types import Text as Text
+    from sqlalchemy.types import Time as Time
+    from sqlalchemy.types import TypeDecorator as TypeDecorator
+    from sqlalchemy.types import Unicode as Unicode
+    from sqlalchemy.types import UnicodeText as UnicodeText
+
+    # Extensions and modifications of SQLAlchemy in SQLModel
+    from .engine.create import create_engine as create_engine
+
+    # Export SQLModel specifics (equivalent to Pydantic)
+    from .main import Field as Field
+    from .main import Relationship as Relationship
+    from .main import SQLModel as SQLModel
+    from .main import register_sqlalchemy_type as register_sqlalchemy_type
+    from .orm.cache import ResultCache as ResultCache
+    from .orm.session import ReadOnlySession as ReadOnlySession
+    from .orm.session import Session as Session
+    from .sql.expression import col as col
+    from .sql.expression import select as select
+    from .sql.schema import create_all_if_changed as create_all_if_changed
+    from .sql.sqltypes import AutoString as AutoString
+
+_lazy_imports: Dict[str, Tuple[str, ...]] = {
+    "sqlalchemy.engine": (
+        "create_mock_engine",
+        "engine_from_config",
+    ),
+    "sqlalchemy.inspection": ("inspect",),
+    "sqlalchemy.schema": (
+        "BLANK_SCHEMA",
+        "DDL",
+        "CheckConstraint",
+        "Column",
+        "ColumnDefault",
+        "Computed",
+        "Constraint",
+        "DefaultClause",
+        "FetchedValue",
+        "ForeignKey",
+        "ForeignKeyConstraint",
+        "Identity",
+        "Index",
+        "MetaData",
+        "PrimaryKeyConstraint",
+        "Sequence",
+        "Table",
+        "UniqueConstraint",
+    ),
+    "sqlalchemy.sql": (
+        "LABEL_STYLE_DEFAULT",
+        "LABEL_STYLE_DISAMBIGUATE_ONLY",
+        "LABEL_STYLE_NONE",
+        "LABEL_STYLE_TABLENAME_PLUS_COL",
+        "Subquery",
+        "alias",
+        "all_",
+        "and_",
+        "any_",
+        "asc",
+        "between",
+        "bindparam",
+        "case",
+        "cast",
+        "collate",
+        "column",
+        "delete",
+        "desc",
+        "distinct",
+        "except_",
+        "except_all",
+        "exists",
+        "extract",
+        "false",
+        "func",
+        "funcfilter",
+        "insert",
+        "intersect",
+        "intersect_all",
+        "join",
+        "lambda_stmt",
+        "lateral",
+        "literal",
+        "literal_column",
+        "modifier",
+        "not_",
+        "null",
+        "nulls_first",
+        "nulls_last",
+        "nullsfirst",
+        "nullslast",
+        "or_",
+        "outerjoin",
+        "outparam",
+        "over",
+        "table",
+        "tablesample",
+        "text",
+        "true",
+        "tuple_",
+        "type_coerce",
+        "union",
+        "union_all",
+        "update",
+        "values",
+        "within_group",
+    ),
+    "sqlalchemy.types": (
+        "ARRAY",
+        "BIGINT",
+        "BINARY",
+        "BLOB",
+        "BOOLEAN",
+        "CHAR",
+        "CLOB",
+        "DATE",
+        "DATETIME",
+        "DECIMAL",
+        "FLOAT",
+        "INT",
+        "INTEGER",
+        "JSON",
+        "NCHAR",
+        "NUMERIC",
+        "NVARCHAR",
+        "REAL",
+        "SMALLINT",
+        "TEXT",
+        "TIME",
+        "TIMESTAMP",
+        "VARBINARY",
+        "VARCHAR",
+        "BigInteger",
+        "Boolean",
+        "Date",
+        "DateTime",
+        "Enum",
+        "Float",
+        "Integer",
+        "Interval",
+        "LargeBinary",
+        "Numeric",
+        "PickleType",
+        "SmallInteger",
+        "String",
+        "Text",
+        "Time",
+        "TypeDecorator",
+        "Unicode",
+        "UnicodeText",
+    ),
+    ".engine.create": ("create_engine",),
+    ".main": (
+        "Field",
+        "Relationship",
+        "SQLModel",
+        "register_sqlalchemy_type",
+    ),
+    ".orm.cache": ("ResultCache",),
+    ".orm.session": ("ReadOnlySession", "Session"),
+    ".sql.expression": (
+        "col",
+        "select",
+    ),
+    ".sql.schema": ("create_all_if_changed",),
+    ".sql.sqltypes": ("AutoString",),
+}
+_module_by_name = {
+    name: module for module, names in _lazy_imports.items() for name in names
+}
+__all__ = list(_module_by_name)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _module_by_name[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name, __name__), name)
+    # Cache it, the next accesses don't go through __getattr__
+    globals()[name] = value
+    return value
 
-# Extensions and modifications of SQLAlchemy in SQLModel
-from .engine.create import create_engine as create_engine
 
-# Export SQLModel specifics (equivalent to Pydantic)
-from .main import Field as Field
-from .main import Relationship as Relationship
-from .main import SQLModel as SQLModel
-from .orm.session import Session as Session
-from .sql.expression import col as col
-from .sql.expression import select as select
-from .sql.sqltypes import AutoString as AutoString
+def __dir__() -> List[str]:
+    return sorted({*globals(), *__all__})
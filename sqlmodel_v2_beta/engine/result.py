@@ -1,7 +1,11 @@
-from typing import Generic, Iterator, Optional, Sequence, Tuple, TypeVar
+from typing import Any, Generic, Iterator, Optional, Sequence, Tuple, TypeVar
 
+from pydantic_core import to_json
 from sqlalchemy.engine.result import Result as _Result
 from sqlalchemy.engine.result import ScalarResult as _ScalarResult
+from typing_extensions import Literal
+
+from ..main import SQLModel, _get_json_serializers, _serializable_values
 
 _T = TypeVar("_T")
 
@@ -34,6 +38,60 @@ class ScalarResult(_ScalarResult[_T], Generic[_T]):
     def one(self) -> _T:
         return super().one()
 
+    def iter_json(
+        self,
+        format: Literal["array", "ndjson"] = "array",
+        chunk_size: int = 1000,
+    ) -> Iterator[bytes]:
+        """
+        Iterate over the results encoded as JSON, in chunks of bytes with up to
+        `chunk_size` rows each, serialized as they are fetched.
+
+        With `format="array"` the chunks form a single JSON array, with
+        `format="ndjson"` each row is a JSON document in its own line.
+
+        It can be used directly as the content of a FastAPI `StreamingResponse`.
+        To also load the models from the database in chunks, instead of all at once,
+        execute the statement with the `yield_per` execution option.
+        """
+        if format not in ("array", "ndjson"):
+            raise ValueError(f"Unsupported JSON format: {format!r}")
+        if format == "ndjson":
+            for partition in self.partitions(chunk_size):
+                yield _dump_json_lines(partition)
+            return
+        prefix = b"["
+        for partition in self.partitions(chunk_size):
+            yield prefix + _dump_json_array_items(partition)
+            prefix = b","
+        yield b"]" if prefix == b"," else b"[]"
+
 
 class Result(_Result[Tuple[_T]], Generic[_T]):
     ...
+
+
+def _dump_json_array_items(rows: Sequence[Any]) -> bytes:
+    model = type(rows[0])
+    if issubclass(model, SQLModel) and all(type(row) is model for row in rows):
+        values = _serializable_values(model, rows)
+        # Strip the brackets, the chunks form a single array
+        return _get_json_serializers(model).list_serializer.to_json(values)[1:-1]
+    return b",".join(_dump_json_row(row) for row in rows)
+
+
+def _dump_json_lines(rows: Sequence[Any]) -> bytes:
+    model = type(rows[0])
+    if issubclass(model, SQLModel) and all(type(row) is model for row in rows):
+        values = _serializable_values(model, rows)
+        to_json_item = _get_json_serializers(model).item_serializer.to_json
+        return b"".join([to_json_item(value) + b"\n" for value in values])
+    return b"".join([_dump_json_row(row) + b"\n" for row in rows])
+
+
+def _dump_json_row(row: Any) -> bytes:
+    if isinstance(row, SQLModel):
+        model = type(row)
+        (value,) = _serializable_values(model, [row])
+        return _get_json_serializers(model).item_serializer.to_json(value)
+    return to_json(row)
@@ -1,4 +1,15 @@
-from typing import Any, Dict, Mapping, Optional, Sequence, Type, TypeVar, Union
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Type,
+    TypeVar,
+    Union,
+)
 
 from sqlalchemy import util
 from sqlalchemy.ext.asyncio import AsyncSession as _AsyncSession
@@ -11,7 +22,7 @@ from sqlalchemy.util.concurrency import greenlet_spawn
 from sqlmodel_v2_beta.sql.base import Executable
 
 from ...engine.result import ScalarResult
-from ...orm.session import Session
+from ...orm.session import Session, UpsertResult
 from ...sql.expression import Select
 
 _T = TypeVar("_T")
@@ -68,3 +79,54 @@ class AsyncSession(_AsyncSession):
             bind_arguments=bind_arguments,
             **kw,
         )
+
+    async def get_many(
+        self, entity: Type[_T], idents: Iterable[Any]
+    ) -> List[Optional[_T]]:
+        return await greenlet_spawn(self.sync_session.get_many, entity, idents)
+
+    async def bulk_add(
+        self,
+        instances: Iterable[Any],
+        *,
+        return_defaults: bool = False,
+        batch_size: int = 1000,
+    ) -> None:
+        await greenlet_spawn(
+            self.sync_session.bulk_add,
+            instances,
+            return_defaults=return_defaults,
+            batch_size=batch_size,
+        )
+
+    async def upsert(
+        self,
+        instances: Iterable[Any],
+        *,
+        conflict_on: Optional[Sequence[str]] = None,
+        update: Optional[Sequence[str]] = None,
+        batch_size: int = 1000,
+    ) -> UpsertResult:
+        return await greenlet_spawn(
+            self.sync_session.upsert,
+            instances,
+            conflict_on=conflict_on,
+            update=update,
+            batch_size=batch_size,
+        )
+
+    async def bulk_update(
+        self,
+        entity: Type[Any],
+        rows: Iterable[Any],
+        *,
+        key: Union[str, Sequence[str], None] = None,
+        batch_size: int = 1000,
+    ) -> Optional[int]:
+        return await greenlet_spawn(
+            self.sync_session.bulk_update,
+            entity,
+            rows,
+            key=key,
+            batch_size=batch_size,
+        )
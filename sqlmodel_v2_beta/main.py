@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import dataclasses
+import functools
 import ipaddress
 import sys
 import types
@@ -16,8 +18,11 @@ from typing import (
     ClassVar,
     Dict,
     ForwardRef,
+    Generator,
+    Iterable,
     List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
     Set,
@@ -26,28 +31,63 @@ from typing import (
     TypeVar,
     Union,
     cast,
+    overload,
 )
 
 import pydantic
 from annotated_types import MaxLen
-from pydantic import BaseModel, EmailStr, ImportString, Json, NameEmail
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    EmailStr,
+    ImportString,
+    Json,
+    NameEmail,
+    SerializerFunctionWrapHandler,
+    model_serializer,
+)
+from pydantic._internal._config import ConfigWrapper
+from pydantic._internal._core_utils import get_type_ref
 from pydantic._internal._fields import PydanticGeneralMetadata
 from pydantic._internal._model_construction import ModelMetaclass
 from pydantic._internal._repr import Representation
+from pydantic._internal._utils import smart_deepcopy
 from pydantic.fields import FieldInfo as PydanticFieldInfo
-from pydantic_core import PydanticUndefined, PydanticUndefinedType
+from pydantic_core import (
+    CoreConfig,
+    CoreSchema,
+    ErrorDetails,
+    PydanticUndefined,
+    PydanticUndefinedType,
+    SchemaSerializer,
+    SchemaValidator,
+    ValidationError,
+    core_schema,
+)
 from sqlalchemy import JSON, Boolean, Column, Date, DateTime
 from sqlalchemy import Enum as sa_Enum
 from sqlalchemy import Float, ForeignKey, Integer, Interval, Numeric, inspect
-from sqlalchemy.orm import RelationshipProperty, declared_attr, registry, relationship
+from sqlalchemy.orm import (
+    RelationshipProperty,
+    configure_mappers,
+    declared_attr,
+    registry,
+    relationship,
+)
 from sqlalchemy.orm.attributes import set_attribute
 from sqlalchemy.orm.decl_api import DeclarativeMeta
-from sqlalchemy.orm.instrumentation import is_instrumented
+from sqlalchemy.orm.instrumentation import (
+    ClassManager,
+    is_instrumented,
+    manager_of_class,
+)
 from sqlalchemy.orm.properties import MappedColumn
+from sqlalchemy.orm.state import InstanceState
 from sqlalchemy.sql import false, true
 from sqlalchemy.sql.schema import DefaultClause, MetaData
-from sqlalchemy.sql.sqltypes import LargeBinary, Time
+from sqlalchemy.sql.sqltypes import LargeBinary, SchemaType, Time
 
+from .orm.strategies import use_lazy_column_loading
 from .sql.sqltypes import GUID, AutoString
 from .typing import SQLModelConfig
 
@@ -56,11 +96,12 @@ if sys.version_info >= (3, 8):
 else:
     from typing_extensions import get_args, get_origin
 
-from typing_extensions import Annotated, _AnnotatedAlias
+from typing_extensions import Annotated, Literal, _AnnotatedAlias
 
 _T = TypeVar("_T")
 NoArgAnyCallable = Callable[[], Any]
 NoneType = type(None)
+IncEx = Union[Set[int], Set[str], Dict[int, Any], Dict[str, Any], None]
 
 
 def __dataclass_transform__(
@@ -75,6 +116,7 @@ def __dataclass_transform__(
 
 class FieldInfo(PydanticFieldInfo):
     nullable: Union[bool, PydanticUndefinedType]
+    sa_column_from_lambda: Optional[Column]  # type: ignore
 
     def __init__(self, default: Any = PydanticUndefined, **kwargs: Any) -> None:
         primary_key = kwargs.pop("primary_key", False)
@@ -105,6 +147,7 @@ class FieldInfo(PydanticFieldInfo):
         self.sa_column = sa_column
         self.sa_column_args = sa_column_args
         self.sa_column_kwargs = sa_column_kwargs
+        self.sa_column_from_lambda = None
 
 
 class RelationshipInfo(Representation):
@@ -173,9 +216,10 @@ def Field(
     schema_extra: Optional[Dict[str, Any]] = None,
 ) -> Any:
     current_schema_extra = schema_extra or {}
+    sa_column_from_lambda: Optional[Column] = None  # type: ignore
     if default is PydanticUndefined:
         if isinstance(sa_column, types.FunctionType):  # lambda
-            sa_column_ = sa_column()
+            sa_column_ = sa_column_from_lambda = sa_column()
         else:
             sa_column_ = sa_column
 
@@ -230,6 +274,8 @@ def Field(
         json_schema_extra=current_schema_extra,
         **current_schema_extra,
     )
+    # Used by the first table that needs the column, instead of calling it again
+    field_info.sa_column_from_lambda = sa_column_from_lambda
     return field_info
 
 
@@ -297,18 +343,14 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
             **dict_for_pydantic,
             "__weakref__": None,
             "__sqlmodel_relationships__": relationships,
+            "__sqlmodel_relationship_keys__": frozenset(relationships),
             "__annotations__": pydantic_annotations,
         }
         # Duplicate logic from Pydantic to filter config kwargs because if they are
         # passed directly including the registry Pydantic will pass them over to the
         # superclass causing an error
-        allowed_config_kwargs: Set[str] = {
-            key
-            for key in dir(SQLModelConfig)
-            if not (
-                key.startswith("__") and key.endswith("__")
-            )  # skip dunder methods and attributes
-        }
+        # The SQLModel specific ones (e.g. table) are read from kwargs below
+        allowed_config_kwargs: Set[str] = set(ConfigDict.__annotations__)
         pydantic_kwargs = kwargs.copy()
         config_kwargs = {
             key: pydantic_kwargs.pop(key)
@@ -333,9 +375,28 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
                         )  # So we can check for nullable
                         value.default = None
 
+            lazy_load_columns = kwargs.get(
+                "lazy_load_columns",
+                class_dict.get("model_config", {}).get("lazy_load_columns", False),
+            )
+            if lazy_load_columns:
+                # Also when serialized in another model, that reads __dict__ directly
+                dict_used["__sqlmodel_serialize_lazy_columns__"] = model_serializer(
+                    mode="wrap"
+                )(_serialize_lazy_columns)
+
+        # Subclasses that only rename a model (e.g. HeroCreate(HeroBase)) reuse the
+        # schema of the parent instead of generating the same one again
+        schema_parent = None
+        if not original_annotations and not relationships and not kwargs:
+            schema_parent = _get_schema_parent(bases, class_dict)
+        if schema_parent is not None:
+            config_kwargs["defer_build"] = True
         new_cls: Type["SQLModelMetaclass"] = super().__new__(
             cls, name, bases, dict_used, **config_kwargs
         )
+        if schema_parent is not None:
+            _reuse_parent_schema(new_cls, schema_parent)
         new_cls.__annotations__ = {
             **relationship_annotations,
             **pydantic_annotations,
@@ -364,6 +425,12 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
             # that's very specific about SQLModel, so let's have another config that
             # other future tools based on Pydantic can use.
             new_cls.model_config["read_from_attributes"] = True
+            config_lazy_load_columns = get_config("lazy_load_columns")
+            if config_lazy_load_columns is not PydanticUndefined:
+                new_cls.model_config["lazy_load_columns"] = config_lazy_load_columns
+            config_pk_cache = get_config("pk_cache")
+            if config_pk_cache is not PydanticUndefined:
+                new_cls.model_config["pk_cache"] = config_pk_cache
 
         config_registry = get_config("registry")
         if config_registry is not PydanticUndefined:
@@ -392,7 +459,11 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
         if cls.model_config.get("table", False) and not base_is_table:
             dict_used = dict_.copy()
             for field_name, field_value in cls.model_fields.items():
-                dict_used[field_name] = get_column_from_field(field_value)
+                # Reuse the column built in __new__
+                col = cls.__dict__.get(field_name)
+                if not isinstance(col, Column):
+                    col = get_column_from_field(field_value)
+                dict_used[field_name] = col
             for rel_name, rel_info in cls.__sqlmodel_relationships__.items():
                 if rel_info.sa_relationship:
                     # There's a SQLAlchemy relationship declared, that takes precedence
@@ -435,8 +506,12 @@ class SQLModelMetaclass(ModelMetaclass, DeclarativeMeta):
                 dict_used[rel_name] = rel_value
                 setattr(cls, rel_name, rel_value)  # Fix #315
             DeclarativeMeta.__init__(cls, classname, bases, dict_used, **kw)
+            if cls.model_config.get("lazy_load_columns", False):
+                use_lazy_column_loading(inspect(cls))
         else:
             ModelMetaclass.__init__(cls, classname, bases, dict_, **kw)
+        setattr(cls, "__sqlmodel_field_names__", frozenset(cls.model_fields))
+        setattr(cls, "__sqlmodel_setattr_dispatch__", _build_setattr_dispatch(cls))
 
 
 def _is_optional_or_union(type_: Optional[type]) -> bool:
@@ -483,49 +558,119 @@ def get_sqlalchemy_type(field: FieldInfo) -> Any:
     metadata = _get_field_metadata(field)
     if type_ is None:
         raise ValueError("Missing field type")
-    if issubclass(type_, str) or type_ in (EmailStr, NameEmail, ImportString):
-        max_length = getattr(metadata, "max_length", None)
-        if max_length:
-            return AutoString(length=max_length)
-        return AutoString
-    if issubclass(type_, float):
-        return Float
-    if issubclass(type_, bool):
-        return Boolean
-    if issubclass(type_, int):
-        return Integer
-    if issubclass(type_, datetime):
-        return DateTime
-    if issubclass(type_, date):
-        return Date
-    if issubclass(type_, timedelta):
-        return Interval
-    if issubclass(type_, time):
-        return Time
-    if issubclass(type_, Enum):
-        return sa_Enum(type_)
-    if issubclass(type_, bytes):
-        return LargeBinary
-    if issubclass(type_, Decimal):
-        return Numeric(
-            precision=getattr(metadata, "max_digits", None),
-            scale=getattr(metadata, "decimal_places", None),
-        )
-    if issubclass(type_, ipaddress.IPv4Address):
-        return AutoString
-    if issubclass(type_, ipaddress.IPv4Network):
-        return AutoString
-    if issubclass(type_, ipaddress.IPv6Address):
-        return AutoString
-    if issubclass(type_, ipaddress.IPv6Network):
-        return AutoString
-    if issubclass(type_, Path):
-        return AutoString
-    if issubclass(type_, uuid.UUID):
-        return GUID
-    if issubclass(type_, Json):
-        return JSON
-    raise ValueError(f"The field {field.title} has no matching SQLAlchemy type")
+    sa_type = _resolve_sqlalchemy_type(type_, metadata)
+    if sa_type is None:
+        raise ValueError(f"The field {field.title} has no matching SQLAlchemy type")
+    return sa_type
+
+
+SQLAlchemyTypeFactory = Callable[[Any, Any], Any]
+
+# Python type -> function returning the SQLAlchemy type of the columns, called with
+# the annotation and the field metadata (e.g. with max_length)
+_sqlalchemy_type_factories: Dict[Any, SQLAlchemyTypeFactory] = {}
+# Caches, cleared when a type is registered
+_resolved_type_factories: Dict[Any, Optional[SQLAlchemyTypeFactory]] = {}
+_resolved_sqlalchemy_types: Dict[Tuple[Any, Any], Any] = {}
+
+
+def register_sqlalchemy_type(
+    py_type: Any, sa_type_factory: SQLAlchemyTypeFactory
+) -> None:
+    """
+    Use the SQLAlchemy type returned by `sa_type_factory(annotation, metadata)` for
+    the columns of fields annotated with `py_type` or a subclass of it.
+    """
+    _sqlalchemy_type_factories[py_type] = sa_type_factory
+    _resolved_type_factories.clear()
+    _resolved_sqlalchemy_types.clear()
+
+
+def _get_type_factory(type_: Any) -> Optional[SQLAlchemyTypeFactory]:
+    try:
+        return _resolved_type_factories[type_]
+    except KeyError:
+        pass
+    factory = None
+    # The first registered class in the MRO wins, e.g. bool before int
+    for base in getattr(type_, "__mro__", (type_,)):
+        factory = _sqlalchemy_type_factories.get(base)
+        if factory is not None:
+            break
+    _resolved_type_factories[type_] = factory
+    return factory
+
+
+def _resolve_sqlalchemy_type(type_: Any, metadata: Any) -> Any:
+    key = (type_, _get_metadata_key(metadata))
+    try:
+        sa_type = _resolved_sqlalchemy_types[key]
+    except KeyError:
+        factory = _get_type_factory(type_)
+        if factory is None:
+            return None
+        sa_type = factory(type_, metadata)
+        _resolved_sqlalchemy_types[key] = sa_type
+    except TypeError:
+        # Unhashable annotation or metadata
+        factory = _get_type_factory(type_)
+        return None if factory is None else factory(type_, metadata)
+    if isinstance(sa_type, SchemaType):
+        # Schema types (e.g. Enum) are bound to their column and table
+        return sa_type.copy()
+    return sa_type
+
+
+def _get_metadata_key(metadata: Any) -> Any:
+    if metadata is _NO_FIELD_METADATA or not hasattr(metadata, "__dict__"):
+        return metadata
+    return (type(metadata), tuple(sorted(vars(metadata).items())))
+
+
+def _sqlalchemy_type(sa_type: Any) -> SQLAlchemyTypeFactory:
+    return lambda type_, metadata: sa_type
+
+
+def _string_type(type_: Any, metadata: Any) -> Any:
+    max_length = getattr(metadata, "max_length", None)
+    if max_length:
+        return AutoString(length=max_length)
+    return AutoString
+
+
+def _enum_type(type_: Any, metadata: Any) -> Any:
+    return sa_Enum(type_)
+
+
+def _numeric_type(type_: Any, metadata: Any) -> Any:
+    return Numeric(
+        precision=getattr(metadata, "max_digits", None),
+        scale=getattr(metadata, "decimal_places", None),
+    )
+
+
+for _py_type in (str, EmailStr, NameEmail, ImportString):
+    register_sqlalchemy_type(_py_type, _string_type)
+for _py_type, _sa_type in (
+    (float, Float),
+    (bool, Boolean),
+    (int, Integer),
+    (datetime, DateTime),
+    (date, Date),
+    (timedelta, Interval),
+    (time, Time),
+    (bytes, LargeBinary),
+    (ipaddress.IPv4Address, AutoString),
+    (ipaddress.IPv4Network, AutoString),
+    (ipaddress.IPv6Address, AutoString),
+    (ipaddress.IPv6Network, AutoString),
+    (Path, AutoString),
+    (uuid.UUID, GUID),
+    (Json, JSON),
+):
+    register_sqlalchemy_type(_py_type, _sqlalchemy_type(_sa_type))
+register_sqlalchemy_type(Enum, _enum_type)
+register_sqlalchemy_type(Decimal, _numeric_type)
 
 
 def get_column_from_field(field: FieldInfo) -> Column:  # type: ignore
@@ -538,7 +683,11 @@ def get_column_from_field(field: FieldInfo) -> Column:  # type: ignore
     if isinstance(sa_column, MappedColumn):
         return sa_column.column
     if isinstance(sa_column, types.FunctionType):
-        col = sa_column()
+        col = getattr(field, "sa_column_from_lambda", None)
+        field.sa_column_from_lambda = None
+        # Each table needs its own column
+        if col is None or getattr(col, "table", None) is not None:
+            col = sa_column()
         assert isinstance(col, Column)
         return col
     sa_type = get_sqlalchemy_type(field)
@@ -582,6 +731,96 @@ def get_column_from_field(field: FieldInfo) -> Column:  # type: ignore
     return Column(sa_type, *args, **kwargs)  # type: ignore
 
 
+class _EmptyFieldsSet(set):  # type: ignore
+    """
+    Empty __pydantic_fields_set__ shared by instances that haven't had any field set
+    yet, e.g. the ones loaded from the database. It's replaced by a new set before
+    the first write, it can't be modified in place.
+
+    Copies (e.g. in model_copy()) and unpickled instances get a new plain set.
+    """
+
+    def _read_only(self, *args: Any, **kwargs: Any) -> Any:
+        raise TypeError("The shared empty fields set can't be modified")
+
+    add = update = discard = remove = pop = clear = _read_only
+    intersection_update = difference_update = symmetric_difference_update = _read_only
+    __ior__ = __iand__ = __isub__ = __ixor__ = _read_only
+
+    def __repr__(self) -> str:
+        return "set()"
+
+    def __copy__(self) -> Set[str]:
+        return set()
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> Set[str]:
+        return set()
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        return (set, ())
+
+
+_EMPTY_FIELDS_SET = _EmptyFieldsSet()
+
+_AttributeSetter = Callable[["SQLModel", str, Any], None]
+# Defaults of the fields to copy and the ones to get for each instance
+_ConstructSpec = Tuple[Dict[str, Any], List[Tuple[str, Callable[..., Any]]]]
+
+
+def _set_instance_state(self: SQLModel, name: str, value: Any) -> None:
+    self.__dict__[name] = value
+
+
+def _set_pydantic_attribute(self: SQLModel, name: str, value: Any) -> None:
+    if self.__pydantic_fields_set__ is _EMPTY_FIELDS_SET:
+        object.__setattr__(self, "__pydantic_fields_set__", set())
+    BaseModel.__setattr__(self, name, value)
+
+
+def _set_instrumented_attribute(self: SQLModel, name: str, value: Any) -> None:
+    # Set in SQLAlchemy, before Pydantic to trigger events and updates, only once
+    # there's SQLAlchemy state (e.g. not yet in validators during model_validate_many)
+    if "_sa_instance_state" in self.__dict__:
+        set_attribute(self, name, value)
+    if self.__pydantic_fields_set__ is _EMPTY_FIELDS_SET:
+        object.__setattr__(self, "__pydantic_fields_set__", set())
+    # Set in Pydantic model to trigger possible validation changes
+    BaseModel.__setattr__(self, name, value)
+
+
+def _set_relationship_attribute(self: SQLModel, name: str, value: Any) -> None:
+    set_attribute(self, name, value)
+
+
+def _set_attribute_fallback(self: SQLModel, name: str, value: Any) -> None:
+    # Attributes not in the dispatch table, e.g. Pydantic private attributes or
+    # anything instrumented after the class was created
+    if (
+        self.model_config.get("table", False)
+        and is_instrumented(self, name)  # type: ignore
+        and "_sa_instance_state" in self.__dict__
+    ):
+        set_attribute(self, name, value)
+    if name not in self.__sqlmodel_relationships__:
+        if self.__pydantic_fields_set__ is _EMPTY_FIELDS_SET:
+            object.__setattr__(self, "__pydantic_fields_set__", set())
+        BaseModel.__setattr__(self, name, value)
+
+
+def _build_setattr_dispatch(cls: Type[SQLModel]) -> Dict[str, _AttributeSetter]:
+    dispatch: Dict[str, _AttributeSetter] = {"_sa_instance_state": _set_instance_state}
+    manager = manager_of_class(cls) if cls.model_config.get("table", False) else None
+    for name in cls.model_fields:
+        if manager is not None and manager.is_instrumented(name, search=True):
+            dispatch[name] = _set_instrumented_attribute
+        else:
+            dispatch[name] = _set_pydantic_attribute
+    for name in cls.__sqlmodel_relationships__:
+        if manager is not None and manager.is_instrumented(name, search=True):
+            dispatch[name] = _set_relationship_attribute
+    return dispatch
+
+
 class_registry = weakref.WeakValueDictionary()  # type: ignore
 
 default_registry = registry()
@@ -593,6 +832,9 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
     __slots__ = ("__weakref__",)
     __tablename__: ClassVar[Union[str, Callable[..., str]]]
     __sqlmodel_relationships__: ClassVar[Dict[str, RelationshipProperty[Any]]]
+    __sqlmodel_relationship_keys__: ClassVar[AbstractSet[str]]
+    __sqlmodel_field_names__: ClassVar[AbstractSet[str]]
+    __sqlmodel_setattr_dispatch__: ClassVar[Dict[str, _AttributeSetter]]
     __name__: ClassVar[str]
     metadata: ClassVar[MetaData]
     __allow_unmapped__ = True  # https://docs.sqlalchemy.org/en/20/changelog/migration_20.html#migration-20-step-six
@@ -605,39 +847,117 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
         # Set __fields_set__ here, that would have been set when calling __init__
         # in the Pydantic model so that when SQLAlchemy sets attributes that are
         # added (e.g. when querying from DB) to the __fields_set__, this already exists
-        object.__setattr__(new_object, "__pydantic_fields_set__", set())
-        if not hasattr(new_object, "__pydantic_extra__"):
-            object.__setattr__(new_object, "__pydantic_extra__", None)
-        if not hasattr(new_object, "__pydantic_private__"):
-            object.__setattr__(new_object, "__pydantic_private__", None)
+        # Use the shared empty set, instances loaded from the DB don't need their own
+        # until an attribute is set, __init__ and validation replace it anyway
+        # The slots of a new object are always empty, set them directly, hasattr()
+        # would go through Pydantic's (slow) __getattr__
+        object.__setattr__(new_object, "__pydantic_fields_set__", _EMPTY_FIELDS_SET)
+        object.__setattr__(new_object, "__pydantic_extra__", None)
+        object.__setattr__(new_object, "__pydantic_private__", None)
         return new_object
 
     def __init__(__pydantic_self__, **data: Any) -> None:
-        old_dict = __pydantic_self__.__dict__.copy()
-        super().__init__(**data)
-        __pydantic_self__.__dict__ = {**old_dict, **__pydantic_self__.__dict__}
-        non_pydantic_keys = data.keys() - __pydantic_self__.model_fields
-        for key in non_pydantic_keys:
-            if key in __pydantic_self__.__sqlmodel_relationships__:
+        # Pydantic replaces __dict__ with a new dict holding the validated values,
+        # keep a reference to the current one (with the SQLAlchemy instance state for
+        # table models) and move its entries over, without copying either of them
+        old_dict = __pydantic_self__.__dict__
+        __pydantic_self__.__pydantic_validator__.validate_python(
+            data, self_instance=__pydantic_self__
+        )
+        if old_dict:
+            new_dict = __pydantic_self__.__dict__
+            for key, value in old_dict.items():
+                new_dict.setdefault(key, value)
+        relationship_keys = __pydantic_self__.__sqlmodel_relationship_keys__
+        if relationship_keys:
+            for key in relationship_keys.intersection(data):
                 setattr(__pydantic_self__, key, data[key])
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name in {"_sa_instance_state"}:
-            self.__dict__[name] = value
-            return
-        else:
-            # Set in SQLAlchemy, before Pydantic to trigger events and updates
-            if self.model_config.get("table", False) and is_instrumented(self, name):  # type: ignore
-                set_attribute(self, name, value)
-            # Set in Pydantic model to trigger possible validation changes, only for
-            # non relationship values
-            if name not in self.__sqlmodel_relationships__:
-                super(SQLModel, self).__setattr__(name, value)
+        setter = self.__sqlmodel_setattr_dispatch__.get(name, _set_attribute_fallback)
+        setter(self, name, value)
 
     def __repr_args__(self) -> Sequence[Tuple[Optional[str], Any]]:
+        _load_lazy_columns(self)
         # Don't show SQLAlchemy private attributes
         return [(k, v) for k, v in self.__dict__.items() if not k.startswith("_sa_")]
 
+    def __getstate__(self) -> Dict[Any, Any]:
+        _load_lazy_columns(self)
+        return super().__getstate__()
+
+    def __iter__(self) -> Generator[Tuple[str, Any], None, None]:
+        _load_lazy_columns(self)
+        return super().__iter__()
+
+    def __eq__(self, other: Any) -> bool:
+        _load_lazy_columns(self)
+        if isinstance(other, SQLModel):
+            _load_lazy_columns(other)
+        return super().__eq__(other)
+
+    def __copy__(self: _TSQLModel) -> _TSQLModel:
+        _load_lazy_columns(self)
+        return super().__copy__()
+
+    def __deepcopy__(
+        self: _TSQLModel, memo: Optional[Dict[int, Any]] = None
+    ) -> _TSQLModel:
+        _load_lazy_columns(self)
+        return super().__deepcopy__(memo)
+
+    def model_dump(
+        self,
+        *,
+        mode: Union[Literal["json", "python"], str] = "python",
+        include: IncEx = None,
+        exclude: IncEx = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+        warnings: bool = True,
+    ) -> Dict[str, Any]:
+        _load_lazy_columns(self)
+        return super().model_dump(
+            mode=mode,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+            warnings=warnings,
+        )
+
+    def model_dump_json(
+        self,
+        *,
+        indent: Optional[int] = None,
+        include: IncEx = None,
+        exclude: IncEx = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+        warnings: bool = True,
+    ) -> str:
+        _load_lazy_columns(self)
+        return super().model_dump_json(
+            indent=indent,
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+            warnings=warnings,
+        )
+
     @declared_attr  # type: ignore
     def __tablename__(cls) -> str:
         return cls.__name__.lower()
@@ -651,29 +971,514 @@ class SQLModel(BaseModel, metaclass=SQLModelMetaclass, registry=default_registry
         from_attributes: Optional[bool] = None,
         context: Optional[Dict[str, Any]] = None,
     ) -> _TSQLModel:
-        # Somehow model validate doesn't call __init__ so it would remove our init logic
-        validated = super().model_validate(
-            obj, strict=strict, from_attributes=from_attributes, context=context
+        if not cls.model_config.get("table", False):
+            return super().model_validate(
+                obj, strict=strict, from_attributes=from_attributes, context=context
+            )
+        # Pydantic's model_validate doesn't call __new__ nor __init__, so the instance
+        # wouldn't have SQLAlchemy state. Create it the same way the instrumented
+        # __init__ does and validate directly into it, in a single pass
+        new_object = cls.__new__(cls)
+        manager = manager_of_class(cls)
+        state = cast(InstanceState[Any], manager._new_state_if_none(new_object))
+        manager.dispatch.init(state, (), {})
+        try:
+            cls.__pydantic_validator__.validate_python(
+                obj,
+                strict=strict,
+                from_attributes=from_attributes,
+                context=context,
+                self_instance=new_object,
+            )
+        except BaseException:
+            manager.dispatch.init_failure(state, (), {})
+            raise
+        new_object.__dict__["_sa_instance_state"] = state
+        _restrict_fields_set(new_object, obj)
+        return new_object
+
+    @overload
+    @classmethod
+    def model_validate_many(
+        cls: Type[_TSQLModel],
+        objs: Iterable[Any],
+        *,
+        strict: Optional[bool] = None,
+        from_attributes: Optional[bool] = None,
+        context: Optional[Dict[str, Any]] = None,
+        collect_errors: Literal[False] = False,
+    ) -> List[_TSQLModel]:
+        ...
+
+    @overload
+    @classmethod
+    def model_validate_many(
+        cls: Type[_TSQLModel],
+        objs: Iterable[Any],
+        *,
+        strict: Optional[bool] = None,
+        from_attributes: Optional[bool] = None,
+        context: Optional[Dict[str, Any]] = None,
+        collect_errors: Literal[True],
+    ) -> Tuple[List[_TSQLModel], Dict[int, List[ErrorDetails]]]:
+        ...
+
+    @classmethod
+    def model_validate_many(
+        cls: Type[_TSQLModel],
+        objs: Iterable[Any],
+        *,
+        strict: Optional[bool] = None,
+        from_attributes: Optional[bool] = None,
+        context: Optional[Dict[str, Any]] = None,
+        collect_errors: bool = False,
+    ) -> Union[
+        List[_TSQLModel], Tuple[List[_TSQLModel], Dict[int, List[ErrorDetails]]]
+    ]:
+        """
+        Validate a sequence of objects (dicts or objects with attributes) in a single
+        call to pydantic-core, returning a list of models.
+
+        With `collect_errors=True`, invalid rows don't raise, instead a tuple is
+        returned with the valid models and a dict of the errors of each invalid row,
+        by its index.
+        """
+        validator = _get_list_validator(cls, collect_errors)
+        is_table = cls.model_config.get("table", False)
+        if is_table:
+            # Model validators could access instrumented attributes
+            configure_mappers()
+        if not isinstance(objs, list):
+            objs = list(objs)
+        errors: Dict[int, List[ErrorDetails]] = {}
+        models: List[_TSQLModel] = validator.validate_python(
+            objs, strict=strict, from_attributes=from_attributes, context=context
+        )
+        if collect_errors:
+            # Validated once, the invalid items are in the list with their errors
+            valid_models = []
+            valid_objs = []
+            for index, (model, obj) in enumerate(zip(models, objs)):
+                if isinstance(model, _InvalidItem):
+                    errors[index] = model.errors
+                else:
+                    valid_models.append(model)
+                    valid_objs.append(obj)
+            models, objs = valid_models, valid_objs
+        if is_table:
+            # pydantic-core creates the instances without calling __new__ nor
+            # __init__, add the SQLAlchemy state the instrumented __init__ would add
+            manager = manager_of_class(cls)
+            for model, obj in zip(models, objs):
+                model_dict = model.__dict__
+                if "_sa_instance_state" not in model_dict:
+                    manager.setup_instance(model)
+                    manager.dispatch.init(model_dict["_sa_instance_state"], (), {})
+                    _restrict_fields_set(model, obj)
+        if collect_errors:
+            return models, errors
+        return models
+
+    @classmethod
+    def model_construct(
+        cls: Type[_TSQLModel], _fields_set: Optional[Set[str]] = None, **values: Any
+    ) -> _TSQLModel:
+        if not cls.model_config.get("table", False):
+            return super().model_construct(_fields_set, **values)
+        manager = manager_of_class(cls)
+        spec = _get_construct_spec(cls)
+        relationship_keys = cls.__sqlmodel_relationship_keys__
+        if spec is None or (
+            relationship_keys and not relationship_keys.isdisjoint(values)
+        ):
+            return _construct_table_model(cls, manager, _fields_set, values)
+        return _construct_from_spec(cls, manager, spec, _fields_set, values)
+
+    @classmethod
+    def model_construct_many(
+        cls: Type[_TSQLModel], rows: Iterable[Mapping[str, Any]]
+    ) -> List[_TSQLModel]:
+        """
+        Create models from trusted or pre-validated data, without validation, like
+        `model_construct()` for each row. Table models are ready to be added to a
+        session.
+        """
+        if not cls.model_config.get("table", False):
+            construct = super().model_construct
+            return [construct(**row) for row in rows]
+        manager = manager_of_class(cls)
+        spec = _get_construct_spec(cls)
+        if spec is None:
+            return [
+                _construct_table_model(cls, manager, None, dict(row)) for row in rows
+            ]
+        relationship_keys = cls.__sqlmodel_relationship_keys__
+        models: List[_TSQLModel] = []
+        for row in rows:
+            if relationship_keys and not relationship_keys.isdisjoint(row):
+                models.append(_construct_table_model(cls, manager, None, dict(row)))
+            else:
+                models.append(_construct_from_spec(cls, manager, spec, None, row))
+        return models
+
+    @classmethod
+    def model_dump_json_many(
+        cls,
+        instances: Iterable[SQLModel],
+        *,
+        indent: Optional[int] = None,
+        by_alias: bool = False,
+        exclude_none: bool = False,
+    ) -> bytes:
+        """
+        Serialize instances of this model to a JSON array, as bytes, in a single call
+        to pydantic-core.
+
+        For table models the values are read directly from the SQLAlchemy instance
+        state, loading expired or deferred columns first.
+        """
+        values = _serializable_values(cls, instances)
+        return _get_json_serializers(cls).list_serializer.to_json(
+            values, indent=indent, by_alias=by_alias, exclude_none=exclude_none
         )
 
-        # remove defaults so they don't get validated
-        data = {}
-        for key, value in validated:
-            field = cls.model_fields.get(key)
 
-            if field is None:
-                continue
+class _JSONSerializers(NamedTuple):
+    list_serializer: SchemaSerializer
+    item_serializer: SchemaSerializer
+    from_dicts: bool
+
+
+def _serializable_values(cls: Type[SQLModel], instances: Iterable[Any]) -> List[Any]:
+    if not cls.model_config.get("table", False):
+        return list(instances)
+    from_dicts = _get_json_serializers(cls).from_dicts
+    field_names = cls.__sqlmodel_field_names__
+    values: List[Any] = []
+    for instance in instances:
+        instance_dict = instance.__dict__
+        if not field_names.issubset(instance_dict):
+            _load_fields(instance, field_names)
+        values.append(instance_dict if from_dicts else instance)
+    return values
+
+
+def _load_lazy_columns(instance: SQLModel) -> None:
+    # Columns not converted yet are not in __dict__, as with deferred columns, but
+    # they don't need a query, convert them before dumping the model
+    if instance.model_config.get("lazy_load_columns", False):
+        field_names = instance.__sqlmodel_field_names__
+        if not field_names.issubset(instance.__dict__):
+            _load_fields(instance, field_names)
+
+
+def _serialize_lazy_columns(
+    self: SQLModel, handler: SerializerFunctionWrapHandler
+) -> Any:
+    # Named self, Pydantic only accepts model serializers that look like methods
+    _load_lazy_columns(self)
+    return handler(self)
+
+
+def _load_fields(instance: SQLModel, field_names: AbstractSet[str]) -> None:
+    # Expired or deferred columns are not in __dict__, access them through
+    # SQLAlchemy to load them
+    instance_dict = instance.__dict__
+    for name in field_names:
+        if name not in instance_dict:
+            getattr(instance, name)
+
+
+def _get_model_schema(
+    schema: CoreSchema, definitions: List[CoreSchema]
+) -> Optional[CoreSchema]:
+    if schema["type"] == "definition-ref":
+        for definition in definitions:
+            if definition.get("ref") == schema["schema_ref"]:
+                schema = definition
+                break
+    if schema["type"] == "model":
+        return schema
+    if schema["type"] in ("function-before", "function-after", "function-wrap"):
+        return _get_model_schema(schema["schema"], definitions)
+    return None
+
+
+# Class attributes that don't change the schema of a subclass
+_SCHEMA_NEUTRAL_ATTRIBUTES = {"__module__", "__qualname__", "__doc__", "__classcell__"}
 
-            if (
-                hasattr(field, "default")
-                and field.default is not PydanticUndefined
-                and value == field.default
-            ):
-                continue
 
-            data[key] = value
+def _get_schema_parent(
+    bases: Tuple[Type[Any], ...], class_dict: Dict[str, Any]
+) -> Optional[Type[SQLModel]]:
+    if len(bases) != 1 or not isinstance(bases[0], SQLModelMetaclass):
+        return None
+    for key, value in class_dict.items():
+        if key in _SCHEMA_NEUTRAL_ATTRIBUTES or (
+            key == "__annotations__" and not value
+        ):
+            continue
+        # Plain methods, but not validators nor Pydantic or SQLModel hooks
+        if (
+            not isinstance(value, types.FunctionType)
+            or key.startswith("_")
+            or key.startswith("model_")
+        ):
+            return None
+    parent = cast(Type[SQLModel], bases[0])
+    if (
+        parent.model_config.get("table", False)
+        or not parent.__pydantic_complete__
+        or parent.__pydantic_generic_metadata__["parameters"]
+        or parent.__pydantic_generic_metadata__["origin"]
+    ):
+        return None
+    decorators = parent.__pydantic_decorators__
+    if any(getattr(decorators, f.name) for f in dataclasses.fields(decorators)):
+        return None
+    schema = parent.__dict__.get("__pydantic_core_schema__")
+    # Recursive models have definitions referencing the parent, keep those simple
+    if schema is None or schema["type"] != "model":
+        return None
+    return parent
+
+
+def _reuse_parent_schema(cls: Type[SQLModel], parent: Type[SQLModel]) -> None:
+    # Pydantic deferred the build, restore the config the class would have had
+    if "defer_build" in parent.model_config:
+        cls.model_config["defer_build"] = parent.model_config["defer_build"]
+    else:
+        cls.model_config.pop("defer_build", None)
+    parent_schema = cast(core_schema.ModelSchema, parent.__pydantic_core_schema__)
+    config = ConfigWrapper(cls.model_config, check=False).core_config(cls)
+    schema = core_schema.ModelSchema(
+        **{  # type: ignore
+            **parent_schema,
+            "cls": cls,
+            "config": config,
+            "ref": get_type_ref(cls),
+            "schema": {**parent_schema["schema"], "model_name": cls.__name__},
+        }
+    )
+    metadata = parent_schema.get("metadata")
+    if metadata:
+        # The JSON schema functions are bound to the class (e.g. for its docstring)
+        metadata = metadata.copy()
+        metadata["pydantic_js_functions"] = [
+            _rebind_to_class(function, parent, cls)
+            for function in metadata.get("pydantic_js_functions", [])
+        ]
+        schema["metadata"] = metadata
+    cls.__pydantic_core_schema__ = schema
+    cls.__pydantic_validator__ = SchemaValidator(schema, config)
+    cls.__pydantic_serializer__ = SchemaSerializer(schema, config)
+    cls.__pydantic_complete__ = True
+
+
+def _rebind_to_class(function: Any, parent: type, cls: type) -> Any:
+    if (
+        isinstance(function, functools.partial)
+        and function.keywords.get("cls") is parent
+    ):
+        return functools.partial(
+            function.func, *function.args, **{**function.keywords, "cls": cls}
+        )
+    if isinstance(function, types.MethodType) and function.__self__ is parent:
+        return getattr(cls, function.__name__)
+    return function
+
+
+def _get_core_schema(cls: Type[SQLModel]) -> CoreSchema:
+    if not cls.__pydantic_complete__:
+        # Deferred with model_config["defer_build"], until then
+        # __pydantic_core_schema__ would be the one of a parent class
+        cls.model_rebuild(_parent_namespace_depth=0)
+    return cls.__pydantic_core_schema__
+
+
+def _get_json_serializers(cls: Type[SQLModel]) -> _JSONSerializers:
+    serializers = cls.__dict__.get("__sqlmodel_json_serializers__")
+    if serializers is None:
+        schema = _get_core_schema(cls)
+        definitions: List[CoreSchema] = []
+        if schema["type"] == "definitions":
+            definitions = schema["definitions"]
+            schema = schema["schema"]
+        model_schema = _get_model_schema(schema, definitions)
+        # Table models without custom serialization are serialized from their
+        # __dict__ directly with the fields serializer, it skips the SQLAlchemy keys
+        from_dicts = bool(
+            cls.model_config.get("table", False)
+            and cls.model_config.get("extra") != "allow"
+            and model_schema is not None
+            and "serialization" not in model_schema
+            and model_schema["schema"]["type"] == "model-fields"
+            and not model_schema["schema"].get("computed_fields")
+        )
+        config: Optional[CoreConfig] = None
+        if from_dicts:
+            assert model_schema is not None
+            schema = model_schema["schema"]
+            config = model_schema.get("config")
+        list_schema = core_schema.list_schema(schema)
+        if definitions:
+            list_schema = core_schema.definitions_schema(list_schema, definitions)
+            schema = core_schema.definitions_schema(schema, definitions)
+        serializers = _JSONSerializers(
+            list_serializer=SchemaSerializer(list_schema, config),
+            item_serializer=SchemaSerializer(schema, config),
+            from_dicts=from_dicts,
+        )
+        type.__setattr__(cls, "__sqlmodel_json_serializers__", serializers)
+    return cast(_JSONSerializers, serializers)
+
+
+def _construct_table_model(
+    cls: Type[_TSQLModel],
+    manager: ClassManager[Any],
+    fields_set: Optional[Set[str]],
+    values: Dict[str, Any],
+) -> _TSQLModel:
+    # Pydantic would put the relationships in __dict__, set them through SQLAlchemy
+    relationships = {
+        key: values.pop(key)
+        for key in cls.__sqlmodel_relationship_keys__.intersection(values)
+    }
+    new_object = super(SQLModel, cls).model_construct(fields_set, **values)
+    # Pydantic replaces __dict__, add the SQLAlchemy state the instrumented
+    # __init__ would add
+    manager.setup_instance(new_object)
+    manager.dispatch.init(new_object.__dict__["_sa_instance_state"], (), {})
+    for key, value in relationships.items():
+        setattr(new_object, key, value)
+    return new_object
+
 
-        return cls(**data)
+def _construct_from_spec(
+    cls: Type[_TSQLModel],
+    manager: ClassManager[Any],
+    spec: _ConstructSpec,
+    fields_set: Optional[Set[str]],
+    row: Mapping[str, Any],
+) -> _TSQLModel:
+    template, dynamic_defaults = spec
+    # Same result as Pydantic's model_construct(), merging the row over the defaults
+    # (in field order) at once instead of field by field
+    values = {**template, **row}
+    for name, get_default in dynamic_defaults:
+        if name not in row:
+            values[name] = get_default(call_default_factory=True)
+    new_object = cls.__new__(cls)
+    object.__setattr__(new_object, "__dict__", values)
+    if fields_set is None:
+        fields_set = cls.model_fields.keys() & row
+    object.__setattr__(new_object, "__pydantic_fields_set__", fields_set)
+    if cls.__pydantic_post_init__:
+        new_object.model_post_init(None)
+    manager.setup_instance(new_object)
+    manager.dispatch.init(values["_sa_instance_state"], (), {})
+    return new_object
+
+
+def _get_construct_spec(
+    cls: Type[SQLModel],
+) -> Optional[_ConstructSpec]:
+    if "__sqlmodel_construct_spec__" not in cls.__dict__:
+        spec: Optional[_ConstructSpec]
+        template: Dict[str, Any] = {}
+        dynamic_defaults: List[Tuple[str, Callable[..., Any]]] = []
+        spec = (template, dynamic_defaults)
+        if cls.model_config.get("extra") == "allow":
+            spec = None
+        for name, field in cls.model_fields.items():
+            if field.alias or field.is_required():
+                spec = None
+                break
+            default = field.get_default(call_default_factory=False)
+            if field.default_factory is None and smart_deepcopy(default) is default:
+                template[name] = default
+            else:
+                # Mutable defaults are copied and factories called for each row
+                template[name] = None
+                dynamic_defaults.append((name, field.get_default))
+        type.__setattr__(cls, "__sqlmodel_construct_spec__", spec)
+    cached_spec: Optional[_ConstructSpec] = cls.__dict__["__sqlmodel_construct_spec__"]
+    return cached_spec
+
+
+def _restrict_fields_set(new_object: SQLModel, obj: Any) -> None:
+    if isinstance(obj, BaseModel) and obj is not new_object:
+        # Pydantic marks every attribute read from an object as set, keep only
+        # the ones that were also set in the original model
+        object.__setattr__(
+            new_object,
+            "__pydantic_fields_set__",
+            new_object.__pydantic_fields_set__ & obj.__pydantic_fields_set__,
+        )
+
+
+def _without_custom_init(
+    schema: CoreSchema, definitions: List[CoreSchema]
+) -> CoreSchema:
+    if schema["type"] == "definition-ref":
+        for definition in definitions:
+            if definition.get("ref") == schema["schema_ref"]:
+                # Inline a copy, the original definition keeps the ref
+                schema = definition.copy()
+                schema.pop("ref", None)
+                break
+    schema = schema.copy()
+    if schema["type"] == "model":
+        schema["custom_init"] = False
+    elif schema["type"] in ("function-before", "function-after", "function-wrap"):
+        schema["schema"] = _without_custom_init(schema["schema"], definitions)
+    return schema
+
+
+def _get_list_validator(
+    cls: Type[SQLModel], collect_errors: bool = False
+) -> SchemaValidator:
+    attribute = (
+        "__sqlmodel_collecting_list_validator__"
+        if collect_errors
+        else "__sqlmodel_list_validator__"
+    )
+    validator = cls.__dict__.get(attribute)
+    if validator is None:
+        # SQLModel defines its own __init__, so pydantic-core would call the class for
+        # each dict, with a copy of the schema that doesn't, it validates the whole
+        # list by itself
+        schema = _get_core_schema(cls)
+        definitions: List[CoreSchema] = []
+        if schema["type"] == "definitions":
+            definitions = schema["definitions"]
+            schema = schema["schema"]
+        item_schema = _without_custom_init(schema, definitions)
+        if collect_errors:
+            item_schema = core_schema.no_info_wrap_validator_function(
+                _collect_item_errors, item_schema
+            )
+        list_schema = core_schema.list_schema(item_schema)
+        if definitions:
+            list_schema = core_schema.definitions_schema(list_schema, definitions)
+        validator = SchemaValidator(list_schema)
+        type.__setattr__(cls, attribute, validator)
+    return validator
+
+
+class _InvalidItem:
+    __slots__ = ("errors",)
+
+    def __init__(self, errors: List[ErrorDetails]) -> None:
+        self.errors = errors
+
+
+def _collect_item_errors(value: Any, handler: Callable[[Any], Any]) -> Any:
+    # Keep validating the rest of the list, the invalid items are left in place
+    try:
+        return handler(value)
+    except ValidationError as e:
+        return _InvalidItem(e.errors())
 
 
 def _is_field_noneable(field: FieldInfo) -> bool:
@@ -704,10 +1509,13 @@ def _is_field_noneable(field: FieldInfo) -> bool:
     return False
 
 
+_NO_FIELD_METADATA = object()
+
+
 def _get_field_metadata(field: FieldInfo) -> object:
     for meta in field.metadata:
         if isinstance(meta, PydanticGeneralMetadata):
             return meta
         if isinstance(meta, MaxLen):
             return meta
-    return object()
+    return _NO_FIELD_METADATA
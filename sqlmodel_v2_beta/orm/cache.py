@@ -0,0 +1,428 @@
+import copy
+import datetime
+import itertools
+import sys
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from decimal import Decimal
+from enum import Enum
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Hashable,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+from sqlalchemy import Connection, Engine, event, inspect
+from sqlalchemy.orm.instrumentation import ClassManager
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.expression import TableClause
+
+from ..main import SQLModel, _load_lazy_columns
+
+# Key in the info of a connection with the tables written in its transaction
+_WRITTEN_TABLES = "sqlmodel_written_tables"
+
+_result_caches: "weakref.WeakSet[ResultCache]" = weakref.WeakSet()
+_pk_caches: "weakref.WeakKeyDictionary[Type[Any], Optional[PKCache]]" = (
+    weakref.WeakKeyDictionary()
+)
+_listening = False
+# Changed for a table each time its results are invalidated, to not cache the
+# results read before, a new value from the counter, next() is thread-safe
+_generations: Dict[str, int] = {}
+_generation_counter = itertools.count(1)
+
+# Values shared by the copies of the cached models, the rest (e.g. JSON) are copied
+_IMMUTABLE_TYPES = frozenset(
+    (
+        bool,
+        bytes,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        Decimal,
+        float,
+        int,
+        str,
+        type(None),
+        uuid.UUID,
+    )
+)
+
+
+class _CachedModel:
+    __slots__ = ("manager", "key", "values", "mutable_keys", "unloaded")
+
+    def __init__(
+        self,
+        manager: ClassManager[Any],
+        key: Any,
+        values: Dict[str, Any],
+        unloaded: FrozenSet[str],
+    ) -> None:
+        self.manager = manager
+        self.key = key
+        self.mutable_keys = tuple(
+            name for name, value in values.items() if not _is_immutable(value)
+        )
+        for name in self.mutable_keys:
+            values[name] = copy.deepcopy(values[name])
+        self.values = values
+        self.unloaded = unloaded
+
+    def restore(self) -> Any:
+        # Created as when loaded from the database, then detached with the identity,
+        # as make_transient_to_detached() does, with what it computes done once
+        instance = self.manager.new_instance()
+        state = instance.__dict__["_sa_instance_state"]
+        instance.__dict__.update(self.values)
+        # Each copy has its own, changing one doesn't change the cache
+        for name in self.mutable_keys:
+            instance.__dict__[name] = copy.deepcopy(self.values[name])
+        state.key = self.key
+        if self.unloaded:
+            state._expire_attributes(state.dict, self.unloaded)
+        return instance
+
+
+class _Entry(NamedTuple):
+    expires_at: float
+    keys: List[str]
+    rows: List[Tuple[Any, ...]]
+    tables: Set[str]
+    size: int
+
+
+class ResultCache:
+    """
+    Cache of the results of `select()` statements, shared by the sessions created
+    with it (of the same database), keyed by the statement and its parameters.
+
+    The entries expire after `ttl` seconds (or the `cache_ttl` of the statement),
+    and the least recently used are removed when there are more than `max_entries`
+    or they take more than `max_bytes` (approximately). The entries of a table are
+    removed when an `INSERT`, `UPDATE` or `DELETE` statement in the process writes
+    to it, and again when that transaction is committed. Textual SQL is not
+    detected.
+
+    The models are cached as their column values, and returned as new detached
+    models each time, with their own copies of mutable values (e.g. JSON).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float = 60,
+        max_entries: int = 1000,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._keys_by_table: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        _listen_for_writes()
+        _result_caches.add(self)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Tuple[List[str], List[Tuple[Any, ...]]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+        rows = [
+            tuple(
+                value.restore()
+                if isinstance(value, _CachedModel)
+                else _copy_value(value)
+                for value in row
+            )
+            for row in entry.rows
+        ]
+        return entry.keys, rows
+
+    def set(
+        self,
+        key: Hashable,
+        keys: List[str],
+        rows: List[Tuple[Any, ...]],
+        tables: Set[str],
+        ttl: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """
+        Cache the rows, unless the tables were written to (and invalidated) after
+        `generation`, the `get_generation()` of the tables before reading them.
+        """
+        cached_rows = [tuple(_cache_value(value) for value in row) for row in rows]
+        size = _estimate_size(cached_rows)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            # Checked with the lock, the invalidation comes after the new generation
+            if generation is not None and get_generation(tables) != generation:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(expires_at, keys, cached_rows, tables, size)
+            self.size += size
+            for table in tables:
+                self._keys_by_table.setdefault(table, set()).add(key)
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self.size > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tables: Iterable[str]) -> None:
+        with self._lock:
+            for table in tables:
+                for key in self._keys_by_table.pop(table, ()):
+                    self._remove(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_table.clear()
+            self.size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size -= entry.size
+        for table in entry.tables:
+            keys = self._keys_by_table.get(table)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_table[table]
+
+
+class PKCache:
+    """
+    Process-wide cache of the models of a table by identity, used by `get()` and
+    `get_many()` in every session, for models with `model_config["pk_cache"]`.
+
+    The column values are cached, each session gets its own copy of the model and
+    of its mutable values (e.g. JSON), the least recently used are removed when
+    there are more than `max_size`, and all of them when something is written to
+    the table, as with `ResultCache`.
+    """
+
+    def __init__(self, table: str, *, max_size: int = 1000, ttl: float = 60) -> None:
+        self.table = table
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Any, Tuple[float, _CachedModel]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, identity_key: Any) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(identity_key)
+            if entry is None:
+                return None
+            expires_at, cached_model = entry
+            if expires_at <= time.monotonic():
+                del self._entries[identity_key]
+                return None
+            self._entries.move_to_end(identity_key)
+        return cached_model.restore()
+
+    def set(self, instance: Any, generation: Optional[int] = None) -> None:
+        # Not if the table was invalidated after generation, when it was read
+        cached_model = _cache_value(instance)
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if generation is not None and get_generation((self.table,)) != generation:
+                return
+            self._entries[cached_model.key] = (expires_at, cached_model)
+            self._entries.move_to_end(cached_model.key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def get_pk_cache(cls: Type[Any]) -> Optional[PKCache]:
+    try:
+        return _pk_caches[cls]
+    except KeyError:
+        pass
+    config = getattr(cls, "model_config", {}).get("pk_cache")
+    pk_cache = None
+    if config:
+        table = _table_name(inspect(cls).local_table)
+        pk_cache = PKCache(table, **(config if isinstance(config, dict) else {}))
+        _listen_for_writes()
+    _pk_caches[cls] = pk_cache
+    return pk_cache
+
+
+def get_cache_key(
+    statement: Any, params: Optional[Any], execution_options: Any
+) -> Optional[Hashable]:
+    # None when the statement can't be cached, the cached rows are already buffered
+    if not getattr(statement, "is_select", False):
+        return None
+    # Only the column values of the models are cached, not what loader options
+    # load, and the row locks of FOR UPDATE need the query
+    if statement._for_update_arg is not None or statement._with_options:
+        return None
+    if (
+        set(execution_options)
+        .union(statement._execution_options)
+        .difference(("prebuffer_rows",))
+    ):
+        return None
+    cache_key = statement._generate_cache_key()
+    if cache_key is None:
+        return None
+    try:
+        values = tuple(
+            _hashable(bindparam.effective_value) for bindparam in cache_key.bindparams
+        )
+        if params is None:
+            extra_params: Hashable = None
+        elif isinstance(params, dict):
+            extra_params = tuple(sorted(_hashable(params).items()))
+        else:
+            return None
+        key = (cache_key.key, values, extra_params)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def get_tables(statement: Any) -> Set[str]:
+    return {
+        _table_name(element)
+        for element in visitors.iterate(statement)
+        if isinstance(element, TableClause)
+    }
+
+
+def get_generation(tables: Iterable[str]) -> int:
+    return sum(_generations.get(table, 0) for table in tables)
+
+
+def get_written_tables(connection: Connection) -> Set[str]:
+    return connection.info.get(_WRITTEN_TABLES, set())
+
+
+def _hashable(value: Any) -> Any:
+    if isinstance(value, (list, tuple)):
+        return tuple(_hashable(item) for item in value)
+    if isinstance(value, dict):
+        return {key: _hashable(item) for key, item in value.items()}
+    hash(value)
+    return value
+
+
+def _table_name(table: TableClause) -> str:
+    return getattr(table, "fullname", table.name)
+
+
+def _is_immutable(value: Any) -> bool:
+    return type(value) in _IMMUTABLE_TYPES or isinstance(value, Enum)
+
+
+def _copy_value(value: Any) -> Any:
+    return value if _is_immutable(value) else copy.deepcopy(value)
+
+
+def _cache_value(value: Any) -> Any:
+    state = getattr(value, "_sa_instance_state", None)
+    if state is None:
+        return _copy_value(value)
+    if isinstance(value, SQLModel):
+        # Converted, the copies are detached and couldn't convert them
+        _load_lazy_columns(value)
+    values = {
+        prop.key: state.dict[prop.key]
+        for prop in state.mapper.column_attrs
+        if prop.key in state.dict
+    }
+    unloaded = frozenset(state.manager).difference(values)
+    return _CachedModel(state.manager, state.key, values, unloaded)
+
+
+def _estimate_size(rows: List[Tuple[Any, ...]]) -> int:
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row:
+            if isinstance(value, _CachedModel):
+                size += sys.getsizeof(value.values)
+                size += sum(sys.getsizeof(item) for item in value.values.values())
+            else:
+                size += sys.getsizeof(value)
+    return size
+
+
+def _listen_for_writes() -> None:
+    global _listening
+    if _listening:
+        return
+    # All the engines, any transaction in the process can make the results stale
+    event.listen(Engine, "after_execute", _after_execute)
+    event.listen(Engine, "commit", _after_commit)
+    event.listen(Engine, "rollback", _after_rollback)
+    _listening = True
+
+
+def _invalidate(tables: Set[str]) -> None:
+    for table in tables:
+        _generations[table] = next(_generation_counter)
+    for cache in list(_result_caches):
+        cache.invalidate(tables)
+    for pk_cache in list(_pk_caches.values()):
+        if pk_cache is not None and pk_cache.table in tables:
+            pk_cache.clear()
+
+
+def _after_execute(
+    connection: Connection, clauseelement: Any, *args: Any, **kwargs: Any
+) -> None:
+    if not getattr(clauseelement, "is_dml", False):
+        return
+    table = _table_name(clauseelement.table)
+    connection.info.setdefault(_WRITTEN_TABLES, set()).add(table)
+    _invalidate({table})
+
+
+def _after_commit(connection: Connection) -> None:
+    # Read again by other transactions before it was committed
+    tables = connection.info.pop(_WRITTEN_TABLES, None)
+    if tables:
+        _invalidate(tables)
+
+
+def _after_rollback(connection: Connection) -> None:
+    connection.info.pop(_WRITTEN_TABLES, None)
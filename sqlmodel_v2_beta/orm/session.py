@@ -1,29 +1,179 @@
+import re
+import uuid
+from collections import OrderedDict
+from decimal import Decimal
 from typing import (
     Any,
     Dict,
+    Iterable,
+    Iterator,
+    List,
     Mapping,
+    NamedTuple,
     Optional,
     Sequence,
+    Set,
+    Tuple,
     Type,
     TypeVar,
     Union,
     overload,
 )
 
-from sqlalchemy import util
+from sqlalchemy import (
+    Boolean,
+    Column,
+    Connection,
+    bindparam,
+    event,
+    insert,
+    inspect,
+    literal_column,
+    select,
+    tuple_,
+    update,
+    util,
+)
+from sqlalchemy.engine.result import IteratorResult
+from sqlalchemy.engine.result import Result as _Result
+from sqlalchemy.engine.result import SimpleResultMetaData
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.orm import Mapper as _Mapper
+from sqlalchemy.orm import ORMExecuteState
 from sqlalchemy.orm import Session as _Session
+from sqlalchemy.orm import make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.base import LoaderCallableStatus, PassiveFlag, instance_state
+from sqlalchemy.orm.identity import WeakInstanceDict
+from sqlalchemy.orm.loading import get_from_identity
+from sqlalchemy.orm.state import InstanceState
 from sqlalchemy.sql.selectable import ForUpdateArg as _ForUpdateArg
 
 from sqlmodel_v2_beta.sql.expression import Select, SelectOfScalar
 
 from ..engine.result import Result, ScalarResult
 from ..sql.base import Executable
+from .cache import (
+    ResultCache,
+    get_cache_key,
+    get_generation,
+    get_pk_cache,
+    get_tables,
+    get_written_tables,
+)
 
 _TSelectParam = TypeVar("_TSelectParam")
 
+# SQLite versions before 3.32 allow up to 999 parameters per statement
+_MAX_BIND_PARAMETERS = 999
+
+# Primary key types that get_many() converts strings to, e.g. "2" to 2
+_COERCED_PK_TYPES = frozenset((int, float, Decimal, uuid.UUID))
+
+# Statements that write, for textual SQL executed in read-only sessions
+_WRITE_KEYWORDS = frozenset(
+    (
+        "ALTER",
+        "CREATE",
+        "DELETE",
+        "DROP",
+        "GRANT",
+        "INSERT",
+        "MERGE",
+        "REPLACE",
+        "REVOKE",
+        "TRUNCATE",
+        "UPDATE",
+        "UPSERT",
+    )
+)
+_FIRST_KEYWORD = re.compile(r"[\s(]*(\w+)")
+# Keywords after a parenthesis that aren't function calls, for the statement after
+# the common table expressions of WITH or in one of them
+_CLAUSE_KEYWORD = re.compile(r"[()]\s*(\w+)\b(?!\s*\()")
+_STRING_LITERAL = re.compile(r"'[^']*'")
+
+
+class UpsertResult(NamedTuple):
+    inserted: int
+    updated: int
+
+
+class IdentityMapStats(NamedTuple):
+    size: int
+    hits: int
+    misses: int
+    released: int
+
 
 class Session(_Session):
+    def __init__(
+        self,
+        bind: Optional[Any] = None,
+        *,
+        readonly: bool = False,
+        keep_recent: Optional[int] = None,
+        result_cache: Optional[ResultCache] = None,
+        **kw: Any,
+    ) -> None:
+        """
+        With `readonly=True`, for replicas and reports, the session doesn't
+        autoflush and doesn't expire the models on commit, and adding, deleting or
+        changing models raises an error, as does executing `INSERT`, `UPDATE`,
+        `DELETE` or DDL statements in its connections, including textual SQL and
+        statements executed with `session.connection()` directly (textual SQL is
+        detected by its first keyword, or for `WITH` by the statement after the
+        common table expressions and the statements in them).
+
+        With `keep_recent`, for long-lived sessions, the session holds references to
+        that many of the most recently used models (loaded or found), so they are
+        found again with `get()` without querying the database, even when nothing
+        else uses them. It doesn't limit the size of the identity map: it only
+        holds weak references, the models without changes are removed from it when
+        they are not used anymore (with or without this option), and the models
+        still used elsewhere stay in the session. The counters are in
+        `identity_map_stats`.
+
+        With a `result_cache`, shared by sessions of the same database, `exec()`
+        caches the results of `select()` statements.
+        """
+        if readonly:
+            kw["autoflush"] = False
+            kw["expire_on_commit"] = False
+        super().__init__(bind, **kw)
+        self.readonly = readonly
+        self._readonly_connections: List[Connection] = []
+        if readonly:
+            event.listen(self, "do_orm_execute", _reject_dml)
+            event.listen(self, "after_begin", _guard_connection)
+            event.listen(self, "after_transaction_end", _unguard_connections)
+        self.result_cache = result_cache
+        self.keep_recent = keep_recent
+        if keep_recent is not None:
+            self.identity_map = _RecentIdentityMap(keep_recent)
+
+    @property
+    def identity_map_stats(self) -> IdentityMapStats:
+        identity_map = self.identity_map
+        if not isinstance(identity_map, _RecentIdentityMap):
+            return IdentityMapStats(len(identity_map), 0, 0, 0)
+        return IdentityMapStats(
+            len(identity_map),
+            identity_map.hits,
+            identity_map.misses,
+            identity_map.released,
+        )
+
+    def expunge_all(self) -> None:
+        identity_map = self.identity_map
+        super().expunge_all()
+        if isinstance(identity_map, _RecentIdentityMap):
+            # Keep the counters
+            self.identity_map = _RecentIdentityMap(identity_map.keep_recent)
+            self.identity_map.hits = identity_map.hits
+            self.identity_map.misses = identity_map.misses
+            self.identity_map.released = identity_map.released
+
     @overload
     def exec(
         self,
@@ -34,6 +184,9 @@ class Session(_Session):
         bind_arguments: Optional[Dict[str, Any]] = None,
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
+        stream: bool = False,
+        batch_size: int = 1000,
+        cache_ttl: Optional[float] = None,
         **kw: Any,
     ) -> Result[_TSelectParam]:
         ...
@@ -48,6 +201,9 @@ class Session(_Session):
         bind_arguments: Optional[Dict[str, Any]] = None,
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
+        stream: bool = False,
+        batch_size: int = 1000,
+        cache_ttl: Optional[float] = None,
         **kw: Any,
     ) -> ScalarResult[_TSelectParam]:
         ...
@@ -65,8 +221,48 @@ class Session(_Session):
         bind_arguments: Optional[Dict[str, Any]] = None,
         _parent_execute_state: Optional[Any] = None,
         _add_event: Optional[Any] = None,
+        stream: bool = False,
+        batch_size: int = 1000,
+        cache_ttl: Optional[float] = None,
         **kw: Any,
     ) -> Union[Result[_TSelectParam], ScalarResult[_TSelectParam]]:
+        """
+        Execute a statement, with `select()` returning the models (or scalars)
+        directly and other `select()` statements returning rows.
+
+        With `stream=True` the rows are fetched from the database and loaded in
+        batches of `batch_size` (with the `yield_per` execution option), and the
+        models of each batch are removed from the session when the next one is
+        loaded, unless they have pending changes or were already in the session,
+        so iterating over any number of rows uses a bounded amount of memory.
+        Models kept after their batch was used are detached from the session.
+
+        With the `result_cache` of the session, the results of `select()` statements
+        are cached, for `cache_ttl` seconds if given (`0` to not cache them). When
+        they are not cached yet, the models are loaded in the session as usual,
+        when they come from the cache they are new detached models, not in the
+        session, use `merge()` to change them in the session.
+        """
+        if (
+            self.result_cache is not None
+            and not stream
+            and cache_ttl != 0
+            and bind_arguments is None
+            and _parent_execute_state is None
+            and _add_event is None
+            and not kw
+        ):
+            cached_results = _exec_cached(
+                self, statement, params, execution_options, cache_ttl
+            )
+            if cached_results is not None:
+                if isinstance(statement, SelectOfScalar):
+                    return ScalarResult(cached_results, 0)
+                return cached_results  # type: ignore
+        if stream:
+            execution_options = {**execution_options, "yield_per": batch_size}
+            # Only the models loaded by the stream are removed from the session
+            present_keys = set(self.identity_map.keys())
         results = super().execute(
             statement,
             params=params,
@@ -76,8 +272,14 @@ class Session(_Session):
             _add_event=_add_event,
             **kw,
         )
+        if stream:
+            results = IteratorResult(
+                SimpleResultMetaData(list(results.keys())),
+                _expunge_between_batches(self, results, batch_size, present_keys),
+                raw=results,
+            ).yield_per(batch_size)
         if isinstance(statement, SelectOfScalar):
-            return results.scalars()  # type: ignore
+            return ScalarResult(results, 0)
         return results  # type: ignore
 
     def get(
@@ -91,16 +293,717 @@ class Session(_Session):
         execution_options: Mapping[Any, Any] = util.EMPTY_DICT,
         bind_arguments: Optional[Dict[str, Any]] = None,
     ) -> Optional[_TSelectParam]:
-        return super().get(
-            entity,
-            ident,
-            options=options,
-            populate_existing=populate_existing,
-            with_for_update=with_for_update,
-            identity_token=identity_token,
-            execution_options=execution_options,
-            bind_arguments=bind_arguments,
+        """
+        For models with `model_config["pk_cache"]`, the models not in the session
+        are taken from the cache shared by all the sessions, without a query, and
+        added to the session. The models loaded are cached.
+        """
+        pk_cache = None
+        if not (
+            options
+            or populate_existing
+            or with_for_update
+            or identity_token is not None
+            or execution_options
+            or bind_arguments
+        ):
+            pk_cache = get_pk_cache(
+                entity if isinstance(entity, type) else entity.class_
+            )
+        if pk_cache is None:
+            return super().get(
+                entity,
+                ident,
+                options=options,
+                populate_existing=populate_existing,
+                with_for_update=with_for_update,
+                identity_token=identity_token,
+                execution_options=execution_options,
+                bind_arguments=bind_arguments,
+            )
+        mapper = inspect(entity)
+        pk_keys = [
+            mapper.get_property_by_column(column).key for column in mapper.primary_key
+        ]
+        identity_key = mapper.identity_key_from_primary_key(
+            _get_pk_values(ident, pk_keys)
         )
+        if identity_key not in self.identity_map:
+            instance = pk_cache.get(identity_key)
+            if instance is not None:
+                # Not a change, also in read-only sessions
+                _Session.add(self, instance)
+                return instance  # type: ignore
+        # Before reading, not cached if another transaction commits in between
+        generation = get_generation((pk_cache.table,))
+        instance = super().get(entity, ident)
+        if instance is not None and pk_cache.table not in _get_written_tables(self):
+            pk_cache.set(instance, generation)
+        return instance
+
+    def get_many(
+        self,
+        entity: Type[_TSelectParam],
+        idents: Iterable[Any],
+    ) -> List[Optional[_TSelectParam]]:
+        """
+        Like `get()` for each primary key in `idents`, returning the models in the
+        same order, with `None` for the ones not found.
+
+        Models already in the session are returned directly, the rest are loaded
+        with `IN` queries, in chunks within the bind parameter limits of SQLite.
+        Composite primary keys are passed as tuples (or dicts).
+        """
+        mapper = inspect(entity)
+        primary_key = mapper.primary_key
+        pk_keys = [mapper.get_property_by_column(column).key for column in primary_key]
+        pk_types = [_get_pk_type(column) for column in primary_key]
+        # As the loaded models have them, to find them by the identity they get
+        pk_values = [
+            _coerce_pk_values(_get_pk_values(ident, pk_keys), pk_types)
+            for ident in idents
+        ]
+        found: Dict[Tuple[Any, ...], Optional[_TSelectParam]] = {}
+        missing: Dict[Tuple[Any, ...], None] = {}
+        for pk in pk_values:
+            if pk in found or pk in missing:
+                continue
+            instance = get_from_identity(
+                self,
+                mapper,
+                mapper.identity_key_from_primary_key(pk),
+                PassiveFlag.PASSIVE_NO_FETCH,
+            )
+            if instance is LoaderCallableStatus.PASSIVE_NO_RESULT:
+                # Expired, load it again with the rest
+                missing[pk] = None
+            elif instance is LoaderCallableStatus.PASSIVE_CLASS_MISMATCH:
+                found[pk] = None
+            elif instance is not None:
+                found[pk] = instance  # type: ignore
+            else:
+                missing[pk] = None
+        pk_cache = get_pk_cache(mapper.class_)
+        if pk_cache is not None:
+            for pk in list(missing):
+                identity_key = mapper.identity_key_from_primary_key(pk)
+                # Not the expired ones in the session
+                if identity_key in self.identity_map:
+                    continue
+                instance = pk_cache.get(identity_key)
+                if instance is not None:
+                    _Session.add(self, instance)
+                    found[pk] = instance
+                    del missing[pk]
+            if pk_cache.table in _get_written_tables(self):
+                pk_cache = None
+            else:
+                generation = get_generation((pk_cache.table,))
+        if missing:
+            if len(primary_key) == 1:
+                in_column: Any = primary_key[0]
+            else:
+                in_column = tuple_(*primary_key)
+            chunk_size = max(1, _MAX_BIND_PARAMETERS // len(primary_key))
+            missing_pks = list(missing)
+            for start in range(0, len(missing_pks), chunk_size):
+                chunk = missing_pks[start : start + chunk_size]
+                if len(primary_key) == 1:
+                    values: List[Any] = [pk[0] for pk in chunk]
+                else:
+                    values = chunk
+                statement = select(entity).where(in_column.in_(values))
+                for instance in self.execute(statement).scalars():
+                    found[instance_state(instance).identity] = instance
+                    if pk_cache is not None:
+                        pk_cache.set(instance, generation)
+        return [found.get(pk) for pk in pk_values]
+
+    def add(self, instance: object, _warn: bool = True) -> None:
+        self._check_writable()
+        super().add(instance, _warn=_warn)
+
+    def delete(self, instance: object) -> None:
+        self._check_writable()
+        super().delete(instance)
+
+    def merge(
+        self,
+        instance: _TSelectParam,
+        *,
+        load: bool = True,
+        options: Optional[Sequence[Any]] = None,
+    ) -> _TSelectParam:
+        self._check_writable()
+        return super().merge(instance, load=load, options=options)
+
+    def flush(self, objects: Optional[Sequence[Any]] = None) -> None:
+        # Changed attributes of loaded models are found here
+        if self.readonly and not self._is_clean():
+            self._check_writable()
+        super().flush(objects)
+
+    def _check_writable(self) -> None:
+        if self.readonly:
+            raise InvalidRequestError("This session is read-only")
+
+    def bulk_add(
+        self,
+        instances: Iterable[Any],
+        *,
+        return_defaults: bool = False,
+        batch_size: int = 1000,
+    ) -> None:
+        """
+        Insert new table models with multi-row `INSERT` statements, grouped by
+        model, in batches of `batch_size`, without tracking them in the session.
+
+        Only the column values are inserted, relationships are not followed, set
+        the foreign keys instead. With `return_defaults=True` the primary keys
+        generated by the database are set in the models (with `RETURNING`, as
+        SQLite can't sort the returned rows, there it inserts them one by one).
+        The models with their primary key (given or returned) become detached, as
+        if they were loaded and expunged, `add()` them to work with them in the
+        session, the columns set by database defaults are loaded when accessed.
+        The others stay transient, use `get()` to load them.
+        """
+        self._check_writable()
+        models_by_mapper: Dict[_Mapper[Any], List[Any]] = {}
+        for instance in instances:
+            mapper = instance_state(instance).mapper
+            models_by_mapper.setdefault(mapper, []).append(instance)
+        if not models_by_mapper:
+            return
+        # Insert the tables referenced by foreign keys first
+        metadata = next(iter(models_by_mapper)).local_table.metadata
+        table_order = {table: i for i, table in enumerate(metadata.sorted_tables)}
+        for mapper in sorted(
+            models_by_mapper, key=lambda mapper: table_order.get(mapper.local_table, 0)
+        ):
+            _bulk_insert(
+                self, mapper, models_by_mapper[mapper], return_defaults, batch_size
+            )
+
+    def upsert(
+        self,
+        instances: Iterable[Any],
+        *,
+        conflict_on: Optional[Sequence[str]] = None,
+        update: Optional[Sequence[str]] = None,
+        batch_size: int = 1000,
+    ) -> UpsertResult:
+        """
+        Insert table models, updating the rows that already exist, with
+        `INSERT ... ON CONFLICT` statements (SQLite and PostgreSQL), in batches of
+        `batch_size`, returning the number of rows inserted and updated.
+
+        `conflict_on` has the fields of the unique constraint to check, by default
+        the primary key. `update` has the fields to update in the existing rows, by
+        default all the others, if it's empty the existing rows are left as they
+        are. Models with the same `conflict_on` values in a batch are written once,
+        with the values of the last one, as a statement can't change a row twice.
+        As with `bulk_add()`, the models are not tracked in the session, and models
+        already in the session are not refreshed.
+        """
+        self._check_writable()
+        models_by_mapper: Dict[_Mapper[Any], List[Any]] = {}
+        for instance in instances:
+            mapper = instance_state(instance).mapper
+            models_by_mapper.setdefault(mapper, []).append(instance)
+        inserted = updated = 0
+        for mapper, models in models_by_mapper.items():
+            result = _upsert(self, mapper, models, conflict_on, update, batch_size)
+            inserted += result.inserted
+            updated += result.updated
+        return UpsertResult(inserted, updated)
+
+    def bulk_update(
+        self,
+        entity: Type[Any],
+        rows: Iterable[Any],
+        *,
+        key: Union[str, Sequence[str], None] = None,
+        batch_size: int = 1000,
+    ) -> Optional[int]:
+        """
+        Update rows of a table model by `key`, the field (or fields) to find them,
+        by default the primary key, without loading them, returning the number of
+        rows matched, or `None` when the database driver doesn't report it for
+        `executemany` (`supports_sane_multi_rowcount`, e.g. asyncpg).
+
+        Each row is a dict or a model with the key and the fields to update, for
+        models only the fields that were set (`__pydantic_fields_set__`). Rows with
+        the same fields are updated with the same statement, with `executemany`,
+        in batches of `batch_size`. The changes pending in the session are flushed
+        first, and the models in the session updated by primary key are expired,
+        to load the new values when used.
+        """
+        self._check_writable()
+        # As executing an update() in the session would
+        self._autoflush()
+        mapper = inspect(entity)
+        if key is None:
+            key_columns = list(mapper.primary_key)
+        else:
+            key_names = [key] if isinstance(key, str) else key
+            key_columns = [mapper.columns[name] for name in key_names]
+        key_props = [mapper.get_property_by_column(column) for column in key_columns]
+        column_keys = {
+            prop.key: prop.columns[0].key
+            for prop in mapper.column_attrs
+            if prop not in key_props
+        }
+        key_params = [f"_key_{i}" for i in range(len(key_columns))]
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for row in rows:
+            if isinstance(row, dict):
+                values, fields = row, row.keys()
+            else:
+                values, fields = row.__dict__, row.__pydantic_fields_set__
+            names = tuple(sorted(name for name in fields if name in column_keys))
+            if not names:
+                continue
+            try:
+                params = {
+                    param: values[prop.key]
+                    for param, prop in zip(key_params, key_props)
+                }
+            except KeyError:
+                raise ValueError(f"The key is missing in {row!r}") from None
+            for name in names:
+                params[column_keys[name]] = values[name]
+            groups.setdefault(names, []).append(params)
+        connection = self.connection(bind_arguments={"mapper": mapper})
+        where = [
+            column == bindparam(param) for column, param in zip(key_columns, key_params)
+        ]
+        dialect = connection.dialect
+        matched: Optional[int] = 0
+        for names, group in groups.items():
+            column_names = [column_keys[name] for name in names]
+            statement = (
+                update(mapper.local_table)
+                .where(*where)
+                .values({name: bindparam(name) for name in column_names})
+            )
+            for start in range(0, len(group), batch_size):
+                batch = group[start : start + batch_size]
+                rowcount = connection.execute(statement, batch).rowcount
+                if len(batch) == 1:
+                    reliable = dialect.supports_sane_rowcount
+                else:
+                    reliable = dialect.supports_sane_multi_rowcount
+                if matched is not None:
+                    matched = matched + rowcount if reliable else None
+            if key_columns == list(mapper.primary_key):
+                for params in group:
+                    pk = tuple(params[param] for param in key_params)
+                    identity_key = mapper.identity_key_from_primary_key(pk)
+                    instance = self.identity_map.get(identity_key)
+                    if instance is not None:
+                        self.expire(instance, list(names))
+        return matched
+
+
+class ReadOnlySession(Session):
+    def __init__(self, bind: Optional[Any] = None, **kw: Any) -> None:
+        super().__init__(bind, readonly=True, **kw)
+
+
+class _RecentIdentityMap(WeakInstanceDict):
+    """
+    Identity map that holds references to the `keep_recent` most recently used
+    models, counting the models found, the ones loaded and the references released.
+    Releasing a reference only lets the model be garbage collected once nothing
+    else uses it, as with any other model in the (weak) identity map.
+    """
+
+    def __init__(self, keep_recent: int) -> None:
+        super().__init__()
+        self.keep_recent = keep_recent
+        self._recent: "OrderedDict[Any, object]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+
+    def get(self, key: Any, default: Optional[Any] = None) -> Optional[Any]:
+        state = self._dict.get(key)
+        if state is not None:
+            instance = state.obj()
+            if instance is not None:
+                self._use(key, instance)
+                self.hits += 1
+                return instance
+        return default
+
+    def _add_unpresent(self, state: InstanceState[Any], key: Any) -> None:
+        # Loaded from the database, not found in the session
+        super()._add_unpresent(state, key)
+        self.misses += 1
+        instance = state.obj()
+        if instance is not None:
+            self._use(key, instance)
+
+    def safe_discard(self, state: InstanceState[Any]) -> None:
+        # Expunged or deleted, not kept alive by this map
+        super().safe_discard(state)
+        instance = self._recent.get(state.key)
+        if instance is not None and instance is state.obj():
+            del self._recent[state.key]
+
+    def _use(self, key: Any, instance: object) -> None:
+        recent = self._recent
+        recent[key] = instance
+        recent.move_to_end(key)
+        if len(recent) > self.keep_recent:
+            recent.popitem(last=False)
+            self.released += 1
+
+
+def _exec_cached(
+    session: Session,
+    statement: Any,
+    params: Optional[Any],
+    execution_options: Mapping[str, Any],
+    cache_ttl: Optional[float],
+) -> Optional[_Result[Any]]:
+    # None when it's not cached, to execute it as usual
+    assert session.result_cache is not None
+    key = get_cache_key(statement, params, execution_options)
+    if key is None:
+        return None
+    # As the execution would, before checking what this transaction wrote
+    session._autoflush()
+    tables: Optional[Set[str]] = None
+    written_tables = _get_written_tables(session)
+    if written_tables:
+        tables = get_tables(statement)
+        # Not committed, only this transaction sees them
+        if tables & written_tables:
+            return None
+    cached = session.result_cache.get(key)
+    if cached is None:
+        if tables is None:
+            tables = get_tables(statement)
+        # Before reading, not cached if another transaction commits in between
+        generation = get_generation(tables)
+        results = _Session.execute(session, statement, params)
+        keys = list(results.keys())
+        rows = [row._tuple() for row in results.all()]
+        session.result_cache.set(key, keys, rows, tables, cache_ttl, generation)
+    else:
+        keys, rows = cached
+    return IteratorResult(SimpleResultMetaData(keys), iter(rows))
+
+
+def _get_written_tables(session: Session) -> Set[str]:
+    tables: Set[str] = set()
+    transaction = session.get_transaction()
+    if transaction is not None:
+        for connection, *_ in transaction._connections.values():
+            tables.update(get_written_tables(connection))
+    return tables
+
+
+def _reject_dml(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.statement.is_dml:
+        raise InvalidRequestError("This session is read-only")
+
+
+def _guard_connection(
+    session: Session, transaction: Any, connection: Connection
+) -> None:
+    # Also called for the nested transactions of the same connection
+    if not event.contains(connection, "before_cursor_execute", _reject_writes):
+        event.listen(connection, "before_cursor_execute", _reject_writes)
+        session._readonly_connections.append(connection)
+
+
+def _unguard_connections(session: Session, transaction: Any) -> None:
+    # The connection could be used by others after the session, e.g. when bound to it
+    if transaction.parent is None:
+        for connection in session._readonly_connections:
+            event.remove(connection, "before_cursor_execute", _reject_writes)
+        session._readonly_connections.clear()
+
+
+def _reject_writes(
+    connection: Connection,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    if context is not None and (
+        context.isinsert or context.isupdate or context.isdelete or context.isddl
+    ):
+        raise InvalidRequestError("This session is read-only")
+    match = _FIRST_KEYWORD.match(statement)
+    if match is None:
+        return
+    keyword = match.group(1).upper()
+    if keyword == "WITH":
+        statement = _STRING_LITERAL.sub("''", statement)
+        if any(
+            word.upper() in _WRITE_KEYWORDS
+            for word in _CLAUSE_KEYWORD.findall(statement)
+        ):
+            raise InvalidRequestError("This session is read-only")
+    elif keyword in _WRITE_KEYWORDS:
+        raise InvalidRequestError("This session is read-only")
+
+
+def _get_insert_keys(mapper: _Mapper[Any]) -> Tuple[List[Tuple[str, str]], Set[str]]:
+    table = mapper.local_table
+    # Attribute key, column key
+    keys: List[Tuple[str, str]] = []
+    # None is left out for these, as the unit of work does, to use the defaults
+    default_keys = set()
+    for prop in mapper.column_attrs:
+        column = prop.columns[0]
+        if column.table is not table:
+            continue
+        keys.append((prop.key, column.key))
+        if (
+            column.primary_key
+            or column.server_default is not None
+            or column.default is not None
+        ):
+            default_keys.add(prop.key)
+    return keys, default_keys
+
+
+def _group_insert_rows(
+    models: List[Any], keys: List[Tuple[str, str]], default_keys: Set[str]
+) -> Iterator[Tuple[List[Any], List[Dict[str, Any]]]]:
+    # The rest of the None values are sent as NULL, so the rows usually have the
+    # same keys and are all inserted with the same multi-row statement
+    groups: Dict[Tuple[str, ...], Tuple[List[Any], List[Dict[str, Any]]]] = {}
+    for model in models:
+        values = model.__dict__
+        row = {
+            column_key: values[key]
+            for key, column_key in keys
+            if key in values and (values[key] is not None or key not in default_keys)
+        }
+        group_models, rows = groups.setdefault(tuple(row), ([], []))
+        group_models.append(model)
+        rows.append(row)
+    return iter(groups.values())
+
+
+def _bulk_insert(
+    session: Session,
+    mapper: _Mapper[Any],
+    models: List[Any],
+    return_defaults: bool,
+    batch_size: int,
+) -> None:
+    keys, default_keys = _get_insert_keys(mapper)
+    pk_keys = [
+        mapper.get_property_by_column(column).key for column in mapper.primary_key
+    ]
+    statement = insert(mapper.local_table)
+    if return_defaults:
+        statement = statement.returning(
+            *mapper.primary_key, sort_by_parameter_order=True
+        )
+    connection = session.connection(bind_arguments={"mapper": mapper})
+    for start in range(0, len(models), batch_size):
+        batch = models[start : start + batch_size]
+        for group_models, rows in _group_insert_rows(batch, keys, default_keys):
+            result = connection.execute(statement, rows)
+            if return_defaults:
+                for model, pk in zip(group_models, result):
+                    for key, value in zip(pk_keys, pk):
+                        set_committed_value(model, key, value)
+            # The rows of a group have the same keys, the values left out were set
+            # by the database, expired to load them if the model is added back
+            expired_keys = [
+                key
+                for key, column_key in keys
+                if column_key not in rows[0] and key not in pk_keys
+            ]
+            for model in group_models:
+                values = model.__dict__
+                if any(values.get(key) is None for key in pk_keys):
+                    continue
+                for key in expired_keys:
+                    values.pop(key, None)
+                make_transient_to_detached(model)
+
+
+def _upsert(
+    session: Session,
+    mapper: _Mapper[Any],
+    models: List[Any],
+    conflict_on: Optional[Sequence[str]],
+    update: Optional[Sequence[str]],
+    batch_size: int,
+) -> UpsertResult:
+    connection = session.connection(bind_arguments={"mapper": mapper})
+    dialect_name = connection.dialect.name
+    # Imported here, only the dialect used is loaded
+    if dialect_name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"upsert() is not supported in {dialect_name}")
+    if conflict_on is None:
+        conflict_columns = list(mapper.primary_key)
+    else:
+        conflict_columns = [mapper.columns[key] for key in conflict_on]
+    if update is None:
+        update_columns = [
+            column
+            for column in mapper.local_table.columns
+            if column not in conflict_columns and not column.primary_key
+        ]
+    else:
+        update_columns = [mapper.columns[key] for key in update]
+    conflict_keys = [
+        mapper.get_property_by_column(column).key for column in conflict_columns
+    ]
+    keys, default_keys = _get_insert_keys(mapper)
+    statement = dialect_insert(mapper.local_table)
+    if update_columns:
+        statement = statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={column: statement.excluded[column.key] for column in update_columns},
+        )
+    else:
+        statement = statement.on_conflict_do_nothing(index_elements=conflict_columns)
+    inserted = updated = 0
+    for start in range(0, len(models), batch_size):
+        batch = _deduplicate(models[start : start + batch_size], conflict_keys)
+        for _, rows in _group_insert_rows(batch, keys, default_keys):
+            if dialect_name == "postgresql":
+                # Rows inserted have no previous transaction, only the rows
+                # inserted or updated are returned
+                result = connection.execute(
+                    statement.returning(literal_column("xmax = 0", Boolean)), rows
+                )
+                for (is_inserted,) in result:
+                    inserted += 1 if is_inserted else 0
+                    updated += 0 if is_inserted else 1
+                continue
+            # SQLite doesn't tell them apart, check the existing rows first,
+            # in the same transaction
+            existing = _get_existing_keys(connection, conflict_columns, rows)
+            for row in rows:
+                key = tuple(row.get(column.key) for column in conflict_columns)
+                if key in existing:
+                    updated += 1 if update_columns else 0
+                else:
+                    inserted += 1
+            connection.execute(statement, rows)
+    return UpsertResult(inserted, updated)
+
+
+def _deduplicate(models: List[Any], conflict_keys: List[str]) -> List[Any]:
+    # PostgreSQL rejects a statement that would update the same row twice, the
+    # last model of each key is kept in all the dialects, NULL values don't conflict
+    keys = [tuple(model.__dict__.get(key) for key in conflict_keys) for model in models]
+    last_indexes = {key: index for index, key in enumerate(keys) if None not in key}
+    if len(last_indexes) == len(models):
+        return models
+    return [
+        model
+        for index, (model, key) in enumerate(zip(models, keys))
+        if None in key or last_indexes[key] == index
+    ]
+
+
+def _get_existing_keys(
+    connection: Connection, columns: List[Column[Any]], rows: List[Dict[str, Any]]
+) -> Set[Tuple[Any, ...]]:
+    # NULL values don't conflict
+    keys = list(
+        {
+            key
+            for key in (
+                tuple(row.get(column.key) for column in columns) for row in rows
+            )
+            if None not in key
+        }
+    )
+    if len(columns) == 1:
+        in_column: Any = columns[0]
+    else:
+        in_column = tuple_(*columns)
+    chunk_size = max(1, _MAX_BIND_PARAMETERS // len(columns))
+    existing: Set[Tuple[Any, ...]] = set()
+    for start in range(0, len(keys), chunk_size):
+        chunk = keys[start : start + chunk_size]
+        values = [key[0] for key in chunk] if len(columns) == 1 else chunk
+        statement = select(*columns).where(in_column.in_(values))
+        existing.update(tuple(row) for row in connection.execute(statement))
+    return existing
+
+
+def _get_pk_values(ident: Any, pk_keys: List[str]) -> Tuple[Any, ...]:
+    if isinstance(ident, dict):
+        return tuple(ident[key] for key in pk_keys)
+    if isinstance(ident, (tuple, list)):
+        return tuple(ident)
+    return (ident,)
+
+
+def _get_pk_type(column: Column[Any]) -> Optional[type]:
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return None
+    # Only the ones converted from strings without surprises (e.g. not bool)
+    return python_type if python_type in _COERCED_PK_TYPES else None
+
+
+def _coerce_pk_values(
+    values: Tuple[Any, ...], pk_types: List[Optional[type]]
+) -> Tuple[Any, ...]:
+    if not any(
+        pk_type is not None and isinstance(value, str)
+        for value, pk_type in zip(values, pk_types)
+    ):
+        return values
+    coerced = []
+    for value, pk_type in zip(values, pk_types):
+        if pk_type is not None and isinstance(value, str):
+            try:
+                value = pk_type(value)
+            except (TypeError, ValueError, ArithmeticError):
+                pass
+        coerced.append(value)
+    return tuple(coerced)
+
+
+def _expunge_between_batches(
+    session: Session,
+    results: _Result[Any],
+    batch_size: int,
+    present_keys: Set[Any],
+) -> Iterator[Tuple[Any, ...]]:
+    for batch in results.partitions(batch_size):
+        for row in batch:
+            yield row._tuple()
+        # The batch was used, remove it from the session before loading the next,
+        # at once, without the per object cascades of expunge()
+        identity_map = session.identity_map
+        states = []
+        for row in batch:
+            for value in row:
+                state = getattr(value, "_sa_instance_state", None)
+                if (
+                    state is not None
+                    and state.session_id == session.hash_key
+                    and not state.modified
+                    and state.key in identity_map
+                    and state.key not in present_keys
+                ):
+                    states.append(state)
+        session._expunge_states(states)
 
 
 Session.query.__doc__ = """
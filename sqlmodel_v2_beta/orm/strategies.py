@@ -0,0 +1,191 @@
+import weakref
+from typing import Any, Callable, Dict, FrozenSet, MutableMapping, Optional, Tuple
+
+from sqlalchemy import type_coerce, types
+from sqlalchemy.engine.interfaces import Dialect
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm.base import ATTR_EMPTY
+from sqlalchemy.orm.properties import ColumnProperty
+from sqlalchemy.orm.state import InstanceState
+from sqlalchemy.orm.strategies import ColumnLoader, _register_attribute
+from sqlalchemy.sql.type_api import TypeEngine
+
+# Strategy of the column properties of models with model_config["lazy_load_columns"]
+LAZY_COLUMN_STRATEGY_KEY = (
+    ("deferred", False),
+    ("instrument", True),
+    ("sqlmodel_lazy_column", True),
+)
+
+# Key in the InstanceState of the row with the raw values, and the getters and
+# result processors of the columns not converted yet
+_UNCONVERTED_ROW = "_sqlmodel_unconverted_row"
+
+_Getter = Callable[[Any], Any]
+_Processor = Callable[[Any], Any]
+
+
+class _UnconvertedType(types.TypeDecorator):  # type: ignore
+    """
+    Load the values of a column as they come from the driver, without the result
+    processor of its type, that is kept to convert them on attribute access.
+    """
+
+    impl = types.NullType
+    cache_ok = True
+
+    def __init__(self, impl: TypeEngine[Any]) -> None:
+        super().__init__()
+        self.impl = impl
+        # Shared with the dialect specific copies of this type
+        self.processors: MutableMapping[
+            Dialect, Optional[_Processor]
+        ] = weakref.WeakKeyDictionary()
+
+    def result_processor(self, dialect: Dialect, coltype: Any) -> None:
+        self.processors[dialect] = self.impl_instance.result_processor(dialect, coltype)
+        return None
+
+
+class _UnconvertedRowLoader:
+    """
+    Row populator shared by the lazy columns of a model in a query, it keeps the
+    row in the instance state instead of converting each column.
+    """
+
+    __slots__ = ("keys", "getters")
+
+    def __init__(self) -> None:
+        self.keys: FrozenSet[str] = frozenset()
+        self.getters: Dict[str, Tuple[_Getter, _Processor]] = {}
+
+    def add(self, key: str, getter: _Getter, process: _Processor) -> None:
+        self.keys = self.keys.union((key,))
+        self.getters[key] = (getter, process)
+
+    def __call__(self, state: InstanceState[Any], dict_: Any, row: Any) -> None:
+        keys = self.keys
+        if not keys.isdisjoint(dict_):
+            # The instance is being refreshed, discard the previous values, unless
+            # they have been modified
+            committed_state = state.committed_state
+            for key in keys:
+                if key not in committed_state:
+                    dict_.pop(key, None)
+        if state.expired_attributes:
+            state.expired_attributes.difference_update(keys)
+        state.__dict__[_UNCONVERTED_ROW] = (row, self.getters)
+
+
+@ColumnProperty.strategy_for(deferred=False, instrument=True, sqlmodel_lazy_column=True)
+class LazyColumnLoader(ColumnLoader):
+    """
+    Load a column with the raw value from the database driver, it's converted to
+    the Python value on the first attribute access.
+    """
+
+    __slots__ = ("unconverted_type", "unconverted_column")
+
+    def __init__(self, parent: Any, strategy_key: Any) -> None:
+        super().__init__(parent, strategy_key)
+        column = self.columns[0]
+        self.unconverted_type = _UnconvertedType(column.type)
+        self.unconverted_column = type_coerce(column, self.unconverted_type)
+
+    def init_class_attribute(self, mapper: Mapper[Any]) -> None:
+        self.is_class_level = True
+        _register_attribute(
+            self.parent_property,
+            mapper,
+            useobject=False,
+            compare_function=self.columns[0].type.compare_values,
+            callable_=self._load_unconverted,
+            active_history=self.parent_property.active_history,
+        )
+
+    def _load_unconverted(self, state: InstanceState[Any], passive: Any) -> Any:
+        unconverted_row = state.__dict__.get(_UNCONVERTED_ROW)
+        if unconverted_row is None:
+            return ATTR_EMPTY
+        row, getters = unconverted_row
+        getter_and_process = getters.get(self.key)
+        if getter_and_process is None:
+            return ATTR_EMPTY
+        getter, process = getter_and_process
+        return process(getter(row))
+
+    def setup_query(
+        self,
+        compile_state: Any,
+        query_entity: Any,
+        path: Any,
+        loadopt: Any,
+        adapter: Any,
+        column_collection: Any,
+        memoized_populators: Any,
+        check_for_adapt: bool = False,
+        **kwargs: Any,
+    ) -> None:
+        column = self.unconverted_column
+        if adapter:
+            if check_for_adapt:
+                column = adapter.adapt_check_present(column)
+                if column is None:
+                    return
+            else:
+                column = adapter.columns[column]
+        compile_state._append_dedupe_col_collection(column, column_collection)
+
+    def create_row_processor(
+        self,
+        context: Any,
+        query_entity: Any,
+        path: Any,
+        loadopt: Any,
+        mapper: Mapper[Any],
+        result: Any,
+        adapter: Any,
+        populators: Any,
+    ) -> None:
+        column = self.unconverted_column
+        if adapter:
+            column = adapter.columns[column]
+        getter = result._getter(column, False)
+        if getter is None:
+            populators["expire"].append((self.key, True))
+            return
+        process = self.unconverted_type.processors.get(result.context.dialect)
+        if process is None:
+            # The values from the driver are already the final ones
+            populators["quick"].append((self.key, getter))
+        elif context.refresh_state is not None:
+            # Refreshing or loading expired attributes of an instance, convert them
+            populators["quick"].append(
+                (self.key, lambda row: process(getter(row)))  # type: ignore
+            )
+        else:
+            for _, populator in populators["new"]:
+                if isinstance(populator, _UnconvertedRowLoader):
+                    break
+            else:
+                populator = _UnconvertedRowLoader()
+                populators["new"].append((self.key, populator))
+            populator.add(self.key, getter, process)
+
+
+def use_lazy_column_loading(mapper: Mapper[Any]) -> None:
+    # Primary keys, foreign keys and version counters are used by the ORM itself,
+    # keep loading them as usual
+    for prop in mapper._props.values():
+        if not isinstance(prop, ColumnProperty) or len(prop.columns) != 1:
+            continue
+        column = prop.columns[0]
+        if (
+            prop.deferred
+            or column.primary_key
+            or column.foreign_keys
+            or column is mapper.version_id_col
+            or column is mapper.polymorphic_on
+        ):
+            continue
+        prop.strategy_key = LAZY_COLUMN_STRATEGY_KEY
@@ -0,0 +1,63 @@
+import hashlib
+from typing import Optional
+
+from sqlalchemy import Column, MetaData, String, Table, delete, insert, select
+from sqlalchemy.engine import Dialect, Engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.schema import CreateIndex, CreateTable
+
+from ..main import SQLModel
+
+# Kept out of the metadata of the models, it's not one of their tables
+_fingerprint_metadata = MetaData()
+schema_fingerprint_table = Table(
+    "sqlmodel_schema_fingerprint",
+    _fingerprint_metadata,
+    Column("fingerprint", String(64), primary_key=True),
+)
+
+
+def get_schema_fingerprint(metadata: MetaData, dialect: Dialect) -> str:
+    """
+    Hash of the DDL that would create the tables and indexes of `metadata` in the
+    database of `dialect`.
+    """
+    fingerprint = hashlib.sha256(dialect.name.encode())
+    for table in metadata.sorted_tables:
+        fingerprint.update(str(CreateTable(table).compile(dialect=dialect)).encode())
+        for index in sorted(table.indexes, key=lambda index: str(index.name)):
+            fingerprint.update(
+                str(CreateIndex(index).compile(dialect=dialect)).encode()
+            )
+    return fingerprint.hexdigest()
+
+
+def create_all_if_changed(engine: Engine, metadata: Optional[MetaData] = None) -> bool:
+    """
+    Like `metadata.create_all(engine)`, but only when the tables changed since the
+    last call, as recorded by a fingerprint of the schema stored in the database.
+
+    When it didn't change, it only reads the fingerprint, instead of checking each
+    table. Returns whether `create_all()` was called.
+    """
+    if metadata is None:
+        metadata = SQLModel.metadata
+    fingerprint = get_schema_fingerprint(metadata, engine.dialect)
+    with engine.connect() as connection:
+        try:
+            stored_fingerprint = connection.execute(
+                select(schema_fingerprint_table.c.fingerprint)
+            ).scalar()
+        except DBAPIError:
+            # The table doesn't exist yet
+            stored_fingerprint = None
+    if stored_fingerprint == fingerprint:
+        return False
+    with engine.begin() as connection:
+        metadata.create_all(connection)
+        schema_fingerprint_table.create(connection, checkfirst=True)
+        connection.execute(delete(schema_fingerprint_table))
+        connection.execute(
+            insert(schema_fingerprint_table).values(fingerprint=fingerprint)
+        )
+    return True
@@ -2,7 +2,6 @@ import uuid
 from typing import Any, Optional, cast
 
 from sqlalchemy import CHAR, types
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.engine.interfaces import Dialect
 from sqlalchemy.sql.type_api import TypeEngine
 
@@ -34,6 +33,9 @@ class GUID(types.TypeDecorator):  # type: ignore
 
     def load_dialect_impl(self, dialect: Dialect) -> TypeEngine:  # type: ignore
         if dialect.name == "postgresql":
+            # Imported here, the PostgreSQL dialect is only loaded when used
+            from sqlalchemy.dialects.postgresql import UUID
+
             return dialect.type_descriptor(UUID())
         else:
             return dialect.type_descriptor(CHAR(32))
@@ -1,9 +1,17 @@
 from typing import Any, Optional
 
 from pydantic import ConfigDict
+from typing_extensions import TypedDict
+
+
+class PKCacheConfig(TypedDict, total=False):
+    max_size: int
+    ttl: float
 
 
 class SQLModelConfig(ConfigDict, total=False):
     table: Optional[bool]
     read_from_attributes: Optional[bool]
     registry: Optional[Any]
+    lazy_load_columns: Optional[bool]
+    pk_cache: Optional[PKCacheConfig]
@@ -0,0 +1,71 @@
+from typing import List, Optional
+
+from sqlalchemy import Column, Integer, event, inspect, text
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def test_bulk_add(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+        power: Optional[int] = Field(
+            default=None, sa_column=Column(Integer, server_default=text("7"))
+        )
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    statements: List[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    heroes = [
+        Hero(name=f"Hero {i}", age=i if i % 2 else None, team_id=1) for i in range(5)
+    ]
+    with Session(engine) as session:
+        # The teams are inserted first, for the foreign keys
+        session.bulk_add([*heroes, Team(id=1, name="Preventers")], batch_size=3)
+        assert len(session.identity_map) == 0
+        session.commit()
+        assert len(statements) == 3
+        assert statements[0].startswith("INSERT INTO team")
+        assert heroes[0].id is None
+        rows = session.exec(select(Hero.id, Hero.age, Hero.power)).all()
+        assert rows == [(1, None, 7), (2, 1, 7), (3, None, 7), (4, 3, 7), (5, None, 7)]
+
+
+def test_bulk_add_return_defaults(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        power: Optional[int] = Field(
+            default=None, sa_column=Column(Integer, server_default=text("7"))
+        )
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    heroes = [Hero(name=f"Hero {i}") for i in range(5)]
+    with Session(engine) as session:
+        session.bulk_add(heroes, return_defaults=True)
+        session.commit()
+        assert [hero.id for hero in heroes] == [1, 2, 3, 4, 5]
+        assert all(inspect(hero).detached for hero in heroes)
+        assert session.get(Hero, 4).name == "Hero 3"
+
+    # Added back without inserting them again
+    with Session(engine) as session:
+        session.add_all(heroes)
+        heroes[0].name = "Deadpond"
+        session.commit()
+        assert heroes[1].power == 7
+    with Session(engine) as session:
+        assert session.get(Hero, 1).name == "Deadpond"
+        assert len(session.exec(select(Hero)).all()) == 5
@@ -0,0 +1,85 @@
+from typing import List, Optional
+
+import pytest
+from sqlalchemy import event
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def test_bulk_update(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(unique=True)
+        age: Optional[int] = None
+        status: str = "active"
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.bulk_add([Hero(name=f"Hero {i}", age=i) for i in range(1, 6)])
+        session.commit()
+
+    statements: List[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        hero = session.get(Hero, 1)
+        statements.clear()
+        rows = [
+            {"id": 1, "status": "retired"},
+            Hero(id=3, name="Spider-Boy"),
+            {"id": 2, "status": "retired"},
+            {"id": 99, "status": "retired"},
+        ]
+        assert session.bulk_update(Hero, rows) == 3
+        assert statements == [
+            "UPDATE hero SET status=? WHERE hero.id = ?",
+            "UPDATE hero SET name=? WHERE hero.id = ?",
+        ]
+        assert session.bulk_update(Hero, [{"name": "Hero 4", "age": None}], key="name")
+        session.commit()
+        assert hero.status == "retired"
+        rows = session.exec(select(Hero.name, Hero.age, Hero.status)).all()
+        assert rows == [
+            ("Hero 1", 1, "retired"),
+            ("Hero 2", 2, "retired"),
+            ("Spider-Boy", 3, "active"),
+            ("Hero 4", None, "active"),
+            ("Hero 5", 5, "active"),
+        ]
+
+
+def test_bulk_update_missing_key(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        with pytest.raises(ValueError, match="The key is missing"):
+            session.bulk_update(Hero, [{"name": "Deadpond"}])
+
+
+def test_bulk_update_flushes_and_rowcount(clear_sqlmodel, monkeypatch):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        # Pending, flushed before the UPDATE
+        session.add(Hero(id=1, name="Deadpond"))
+        assert session.bulk_update(Hero, [{"id": 1, "age": 48}]) == 1
+        session.add(Hero(id=2, name="Spider-Boy"))
+        monkeypatch.setattr(engine.dialect, "supports_sane_multi_rowcount", False)
+        rows = [{"id": 1, "age": 49}, {"id": 2, "age": 16}]
+        # Not reported reliably by the driver for executemany
+        assert session.bulk_update(Hero, rows) is None
+        session.commit()
+        assert session.exec(select(Hero.age)).all() == [49, 16]
@@ -1,5 +1,6 @@
 import datetime
 import sys
+from typing import Optional
 
 import pytest
 from pydantic import AnyUrl, UrlConstraints
@@ -77,3 +78,27 @@ def test_field_resuse():
         fileSize=3234,
         beginTime=datetime.datetime.now(),
     )
+
+
+def test_sa_column_lambda_called_once_per_table(clear_sqlmodel):
+    calls = []
+
+    def code_column() -> Column:
+        column = Column(String(20), index=True)
+        calls.append(column)
+        return column
+
+    class Base(SQLModel):
+        code: str = Field(sa_column=code_column)
+
+    class Hero(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class Team(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    # The column built by Field() is used by the first table, the next one
+    # builds its own
+    assert len(calls) == 2
+    assert Hero.__table__.c.code is calls[0]
+    assert Team.__table__.c.code is calls[1]
@@ -0,0 +1,110 @@
+from typing import List, Optional
+
+from sqlalchemy import inspect
+
+from sqlmodel_v2_beta import (
+    Field,
+    Relationship,
+    Session,
+    SQLModel,
+    create_engine,
+    select,
+)
+
+
+def test_model_construct_table_model(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    team = Team.model_construct(name="Preventers")
+    hero = Hero.model_construct(name="Deadpond", age="not validated", team=team)
+    assert inspect(hero).transient
+    assert hero.age == "not validated"
+    assert hero.__pydantic_fields_set__ == {"name", "age"}
+    assert hero.team is team
+    assert team.heroes == [hero]
+    hero.age = 48
+    other_team = Team.model_construct({"id"}, name="Z-Force")
+    assert other_team.__pydantic_fields_set__ == {"id"}
+    assert (other_team.id, other_team.name) == (None, "Z-Force")
+    assert inspect(other_team).transient
+    assert other_team.heroes == []
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(hero)
+        session.commit()
+        db_hero = session.exec(select(Hero)).one()
+        assert db_hero.age == 48
+        assert db_hero.team.name == "Preventers"
+
+
+def test_model_construct_many(clear_sqlmodel):
+    codes = iter(["a", "b"])
+
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+        code: str = Field(default_factory=lambda: next(codes))
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    team = Team(name="Preventers")
+    rows = [
+        {"name": "Deadpond", "age": 48},
+        {"name": "Spider-Boy", "team": team},
+        {"name": "Rusty-Man", "code": "z"},
+    ]
+    heroes = Hero.model_construct_many(rows)
+    assert rows[0] == {"name": "Deadpond", "age": 48}
+    assert [(hero.name, hero.age, hero.code) for hero in heroes] == [
+        ("Deadpond", 48, "a"),
+        ("Spider-Boy", None, "b"),
+        ("Rusty-Man", None, "z"),
+    ]
+    assert [hero.__pydantic_fields_set__ for hero in heroes] == [
+        {"name", "age"},
+        {"name"},
+        {"name", "code"},
+    ]
+    assert list(heroes[0].model_dump()) == ["id", "name", "age", "code", "team_id"]
+    assert team.heroes == [heroes[1]]
+    assert all(inspect(hero).transient for hero in heroes)
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(heroes)
+        session.commit()
+        db_heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+    assert [(hero.id, hero.name, hero.team_id) for hero in db_heroes] == [
+        (1, "Deadpond", None),
+        (2, "Spider-Boy", 1),
+        (3, "Rusty-Man", None),
+    ]
+
+
+def test_model_construct_many_plain_model(clear_sqlmodel):
+    class Hero(SQLModel):
+        name: str
+        age: Optional[int] = None
+
+    heroes = Hero.model_construct_many([{"name": "Deadpond"}])
+    assert heroes == [Hero(name="Deadpond")]
+    assert heroes[0].__pydantic_fields_set__ == {"name"}
@@ -0,0 +1,37 @@
+from typing import List, Optional
+
+from sqlalchemy import event, inspect
+
+from sqlmodel_v2_beta import Field, SQLModel, create_all_if_changed, create_engine
+
+
+def test_create_all_if_changed(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    statements: List[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    assert create_all_if_changed(engine)
+    assert set(inspect(engine).get_table_names()) == {
+        "hero",
+        "sqlmodel_schema_fingerprint",
+    }
+
+    statements.clear()
+    assert not create_all_if_changed(engine)
+    # Only the fingerprint is read
+    assert len(statements) == 1
+
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(index=True)
+
+    assert create_all_if_changed(engine)
+    assert "team" in inspect(engine).get_table_names()
+    assert not create_all_if_changed(engine)
@@ -0,0 +1,60 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import ValidationError
+
+from sqlmodel_v2_beta import Field, Relationship, Session, SQLModel, create_engine
+from sqlmodel_v2_beta.typing import SQLModelConfig
+
+
+def test_defer_build(clear_sqlmodel):
+    class Team(SQLModel, table=True, defer_build=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True, defer_build=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    assert Hero.model_config["defer_build"] is True
+    assert not Team.__pydantic_complete__
+    assert not Hero.__pydantic_complete__
+    # The columns and the mapper don't need the Pydantic schema
+    assert "age" in Hero.__table__.c
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", team=Team(name="Preventers")))
+        session.commit()
+        assert Hero.__pydantic_complete__
+        assert Team.__pydantic_complete__
+
+    with pytest.raises(ValidationError):
+        Hero(name="Rusty-Man", age="old")
+
+
+def test_defer_build_many(clear_sqlmodel):
+    class Base(SQLModel):
+        model_config = SQLModelConfig(defer_build=True)
+
+    class Hero(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    assert not Hero.__pydantic_complete__
+    heroes = [Hero.model_construct(id=1, name="Deadpond")]
+    assert Hero.model_dump_json_many(heroes) == b'[{"id":1,"name":"Deadpond"}]'
+    assert Hero.__pydantic_complete__
+
+    class Team(Base, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    assert not Team.__pydantic_complete__
+    teams = Team.model_validate_many([{"name": "Preventers"}])
+    assert teams[0].name == "Preventers"
@@ -0,0 +1,64 @@
+from typing import Optional
+
+from sqlalchemy import inspect
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def create_heroes(number: int):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(name=f"Hero {i}") for i in range(number)])
+        session.commit()
+    return Hero, engine
+
+
+def test_exec_stream(clear_sqlmodel):
+    Hero, engine = create_heroes(25)
+    with Session(engine) as session:
+        heroes = []
+        identity_map_sizes = []
+        for hero in session.exec(select(Hero), stream=True, batch_size=10):
+            heroes.append(hero)
+            identity_map_sizes.append(len(session.identity_map))
+        assert [hero.name for hero in heroes] == [f"Hero {i}" for i in range(25)]
+        assert max(identity_map_sizes) == 10
+        assert inspect(heroes[0]).detached
+
+        statement = select(Hero)
+        partitions = session.exec(statement, stream=True, batch_size=10).partitions()
+        assert [len(partition) for partition in partitions] == [10, 10, 5]
+
+        rows = session.exec(select(Hero.id, Hero.name), stream=True, batch_size=10)
+        assert rows.all()[-1].name == "Hero 24"
+        names = session.exec(select(Hero.name), stream=True, batch_size=10)
+        assert names.all()[:2] == ["Hero 0", "Hero 1"]
+
+
+def test_exec_stream_keeps_changes(clear_sqlmodel):
+    Hero, engine = create_heroes(5)
+    with Session(engine) as session:
+        for hero in session.exec(select(Hero), stream=True, batch_size=2):
+            if hero.id == 1:
+                hero.name = "Deadpond"
+        session.commit()
+        assert session.exec(select(Hero.name).where(Hero.id == 1)).one() == "Deadpond"
+
+
+def test_exec_stream_keeps_models_already_in_session(clear_sqlmodel):
+    Hero, engine = create_heroes(5)
+    with Session(engine) as session:
+        hero_1 = session.get(Hero, 1)
+        heroes = list(session.exec(select(Hero), stream=True, batch_size=2))
+        assert heroes[0] is hero_1
+        assert not inspect(hero_1).detached
+        assert inspect(heroes[1]).detached
+        hero_1.name = "changed"
+        session.commit()
+    with Session(engine) as session:
+        assert session.get(Hero, 1).name == "changed"
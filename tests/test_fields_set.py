@@ -1,6 +1,12 @@
+import copy
+import pickle
+import tracemalloc
 from datetime import datetime, timedelta
+from typing import Optional
 
-from sqlmodel_v2_beta import Field, SQLModel
+import pytest
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
 
 
 def test_fields_set():
@@ -19,3 +25,86 @@ def test_fields_set():
         last_updated=datetime.now() - timedelta(days=1),
     )
     assert user.__fields_set__ == {"username", "email", "last_updated"}
+
+
+def test_fields_set_shared_for_loaded_instances(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(name="Deadpond"), Hero(name="Spider-Boy", age=16)])
+        session.commit()
+
+    with Session(engine) as session:
+        hero_1, hero_2 = session.exec(select(Hero).order_by(Hero.id)).all()
+        assert hero_1.__pydantic_fields_set__ is hero_2.__pydantic_fields_set__
+        assert hero_1.__pydantic_fields_set__ == set()
+        assert hero_1.model_dump(exclude_unset=True) == {}
+        with pytest.raises(TypeError):
+            hero_1.__pydantic_fields_set__.add("name")
+
+        hero_copy = hero_1.model_copy(update={"name": "Deadpond Copy"})
+        assert hero_copy.__pydantic_fields_set__ == {"name"}
+        assert hero_2.__pydantic_fields_set__ == set()
+
+        hero_1.age = 48
+        assert hero_1.__pydantic_fields_set__ == {"age"}
+        assert hero_2.__pydantic_fields_set__ == set()
+        assert hero_2.__pydantic_fields_set__ is not hero_1.__pydantic_fields_set__
+        session.commit()
+        session.refresh(hero_1)
+        assert hero_1.age == 48
+
+        for fields_set in [
+            copy.copy(hero_2.__pydantic_fields_set__),
+            pickle.loads(pickle.dumps(hero_2.__pydantic_fields_set__)),
+        ]:
+            assert type(fields_set) is set
+            fields_set.add("name")
+        assert hero_2.__pydantic_fields_set__ == set()
+
+
+def test_fields_set_memory_for_loaded_instances(clear_sqlmodel, monkeypatch):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    number = 5_000
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(name=f"Hero {i}") for i in range(number)])
+        session.commit()
+
+    def load_size() -> int:
+        with Session(engine) as session:
+            # Compile the statement first, only the loaded instances are measured
+            session.exec(select(Hero).limit(1)).all()
+            tracemalloc.start()
+            try:
+                heroes = session.exec(select(Hero)).all()
+                size, _ = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            assert len(heroes) == number
+            return size
+
+    shared_size = load_size()
+
+    # What each instance used to hold, its own empty set
+    sqlmodel_new = SQLModel.__new__
+
+    def new_with_own_set(cls, *args, **kwargs):
+        new_object = sqlmodel_new(cls, *args, **kwargs)
+        object.__setattr__(new_object, "__pydantic_fields_set__", set())
+        return new_object
+
+    monkeypatch.setattr(SQLModel, "__new__", staticmethod(new_with_own_set))
+    own_sets_size = load_size()
+    engine.dispose()
+    # An empty set takes around 200 bytes
+    assert (own_sets_size - shared_size) / number > 150
@@ -0,0 +1,77 @@
+from typing import List, Optional
+
+from sqlalchemy import event
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine
+
+
+def test_get_many(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(name=f"Hero {i}") for i in range(1, 2001)])
+        session.commit()
+
+    statements: List[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        cached = session.get(Hero, 3)
+        statements.clear()
+        heroes = session.get_many(Hero, [5, 3, 9999, 5, 1])
+        assert [hero and hero.name for hero in heroes] == [
+            "Hero 5",
+            "Hero 3",
+            None,
+            "Hero 5",
+            "Hero 1",
+        ]
+        assert heroes[1] is cached
+        assert heroes[0] is heroes[3]
+        assert len(statements) == 1
+
+        statements.clear()
+        heroes = session.get_many(Hero, range(1, 2001))
+        assert [hero and hero.id for hero in heroes] == list(range(1, 2001))
+        # Chunked within the SQLite limit, skipping the ones already loaded
+        assert len(statements) == 2
+
+        session.expire_all()
+        statements.clear()
+        assert session.get_many(Hero, [1, 2])[1] is heroes[1]
+        assert len(statements) == 1
+
+    with Session(engine) as session:
+        # Converted as the identity of the models, as get() finds them
+        heroes = session.get_many(Hero, ["2", "x", 3])
+        assert heroes[0] is session.get(Hero, "2")
+        assert heroes[0].name == "Hero 2"
+        assert heroes[1] is None
+        assert heroes[2].name == "Hero 3"
+
+
+def test_get_many_composite_key(clear_sqlmodel):
+    class HeroTeam(SQLModel, table=True):
+        hero_id: int = Field(primary_key=True)
+        team_id: int = Field(primary_key=True)
+        role: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(HeroTeam(hero_id=1, team_id=2, role="leader"))
+        session.add(HeroTeam(hero_id=2, team_id=2, role="member"))
+        session.commit()
+
+    with Session(engine) as session:
+        links = session.get_many(
+            HeroTeam, [(2, 2), {"hero_id": 1, "team_id": 2}, (1, 1)]
+        )
+        assert [link and link.role for link in links] == ["member", "leader", None]
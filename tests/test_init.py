@@ -0,0 +1,57 @@
+from typing import List, Optional
+
+from sqlalchemy import inspect
+
+from sqlmodel_v2_beta import Field, Relationship, Session, SQLModel, create_engine
+
+
+def test_init_keeps_instance_state_and_values(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    hero = Hero(name="Deadpond")
+    assert "_sa_instance_state" in hero.__dict__
+    assert inspect(hero).transient
+    assert hero.__dict__["name"] == "Deadpond"
+    assert hero.__dict__["age"] is None
+    assert hero.__pydantic_fields_set__ == {"name"}
+    assert Hero.__sqlmodel_relationship_keys__ == frozenset()
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(hero)
+        session.commit()
+        session.refresh(hero)
+    assert hero.id == 1
+
+
+def test_init_sets_relationships(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    assert Team.__sqlmodel_relationship_keys__ == frozenset({"heroes"})
+    team = Team(name="Preventers")
+    hero = Hero(name="Deadpond", team=team)
+    assert hero.team is team
+    assert team.heroes == [hero]
+    assert "team" not in hero.__pydantic_fields_set__
+
+
+def test_init_plain_model_dict_only_has_fields(clear_sqlmodel):
+    class Hero(SQLModel):
+        name: str
+        age: Optional[int] = None
+
+    hero = Hero(name="Deadpond")
+    assert hero.__dict__ == {"name": "Deadpond", "age": None}
@@ -0,0 +1,67 @@
+from typing import Optional
+
+from sqlalchemy import inspect
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def test_keep_recent(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.bulk_add([Hero(name=f"Hero {i}") for i in range(1, 21)])
+        session.commit()
+
+    with Session(engine) as session:
+        for hero_id in range(1, 6):
+            session.get(Hero, hero_id)
+        # Not used anywhere else, garbage collected
+        assert session.identity_map_stats == (0, 0, 0, 0)
+
+    with Session(engine, keep_recent=3) as session:
+        # Not used anywhere else, kept by the session while recently used
+        for hero_id in range(1, 6):
+            session.get(Hero, hero_id)
+        assert {hero.id for hero in session.identity_map.values()} == {3, 4, 5}
+        assert session.identity_map_stats == (3, 0, 5, 2)
+        # Used again, the most recently used now
+        session.get(Hero, 3)
+        session.exec(select(Hero).where(Hero.id > 18)).all()
+        assert {hero.id for hero in session.identity_map.values()} == {3, 19, 20}
+        assert session.identity_map_stats == (3, 1, 7, 4)
+
+        session.close()
+        assert session.identity_map_stats.size == 0
+        assert session.identity_map_stats.misses == 7
+
+
+def test_keep_recent_keeps_used_models(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.bulk_add([Hero(name=f"Hero {i}") for i in range(1, 21)])
+        session.commit()
+
+    with Session(engine, keep_recent=2) as session:
+        heroes = session.exec(select(Hero).where(Hero.id <= 5)).all()
+        # Released but still used, not detached, the changes are saved
+        assert session.identity_map_stats.released == 3
+        assert session.identity_map_stats.size == 5
+        assert all(inspect(hero).persistent for hero in heroes)
+        assert session.get(Hero, 1) is heroes[0]
+        heroes[1].name = "Deadpond"
+        session.add(Hero(name="Rusty-Man"))
+        session.commit()
+        statement = select(Hero.name).where(Hero.id.in_([2, 21]))
+        assert session.exec(statement).all() == ["Deadpond", "Rusty-Man"]
+
+        del heroes
+        assert len(session.identity_map) == 2
@@ -0,0 +1,155 @@
+import copy
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import inspect
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def test_lazy_load_columns(clear_sqlmodel):
+    class Hero(SQLModel, table=True, lazy_load_columns=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        born: datetime
+        power: Decimal = Decimal(0)
+
+    assert Hero.model_config["lazy_load_columns"] is True
+    born = datetime(2000, 1, 2, 3, 4, 5)
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond", born=born, power=Decimal("1.5")))
+        session.commit()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        # Columns without conversion are loaded as usual
+        assert hero.__dict__["name"] == "Deadpond"
+        assert "born" not in hero.__dict__
+        assert "power" not in hero.__dict__
+        assert hero.born == born
+        assert hero.__dict__["born"] == born
+        assert "power" not in hero.__dict__
+        assert hero.model_dump() == {
+            "id": 1,
+            "name": "Deadpond",
+            "born": born,
+            "power": Decimal("1.5"),
+        }
+        assert session.exec(select(Hero.born)).all() == [born]
+        assert not session.dirty
+
+        hero.power = Decimal("2")
+        session.commit()
+        # Expired attributes are reloaded and converted
+        assert hero.power == Decimal("2")
+        assert hero.born == born
+
+
+def test_lazy_load_columns_refresh(clear_sqlmodel):
+    class Hero(SQLModel, table=True, lazy_load_columns=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        born: datetime
+
+    born = datetime(2000, 1, 2)
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(born=born))
+        session.commit()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        assert hero.born == born
+        with Session(engine) as other_session:
+            other_hero = other_session.get(Hero, 1)
+            assert other_hero
+            other_hero.born = datetime(2001, 1, 2)
+            other_session.commit()
+        statement = select(Hero).execution_options(populate_existing=True)
+        assert session.exec(statement).one() is hero
+        assert "born" not in hero.__dict__
+        assert hero.born == datetime(2001, 1, 2)
+
+        session.expire(hero, ["born"])
+        assert hero.born == datetime(2001, 1, 2)
+        session.refresh(hero)
+        assert hero.born == datetime(2001, 1, 2)
+
+
+def test_lazy_load_columns_getstate(clear_sqlmodel):
+    class Hero(SQLModel, table=True, lazy_load_columns=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        born: datetime
+
+    born = datetime(2000, 1, 2)
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(born=born))
+        session.commit()
+
+    with Session(engine) as session:
+        hero = session.exec(select(Hero)).one()
+        assert "born" not in hero.__dict__
+        # The values not converted yet are not kept in the pickled instance state
+        assert hero.__getstate__()["__dict__"]["born"] == born
+
+
+def test_lazy_load_columns_converted_when_read(clear_sqlmodel):
+    class Hero(SQLModel, table=True, lazy_load_columns=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        born: datetime
+
+    class Wrapper(SQLModel):
+        hero: Hero
+
+    born = datetime(2000, 1, 2)
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(born=born))
+        session.commit()
+
+    def load_hero() -> Hero:
+        with Session(engine) as session:
+            hero = session.exec(select(Hero)).one()
+            assert "born" not in hero.__dict__
+            return hero
+
+    assert repr(load_hero()) == f"Hero(id=1, born={born!r})"
+    assert dict(load_hero()) == {"id": 1, "born": born}
+    assert load_hero().model_copy().__dict__["born"] == born
+    assert copy.deepcopy(load_hero()).__dict__["born"] == born
+    hero = load_hero()
+    assert hero == hero
+    assert hero.__dict__["born"] == born
+    # Serialized by the serializer of the other model
+    assert Wrapper(hero=load_hero()).model_dump() == {"hero": {"id": 1, "born": born}}
+    data = json.loads(Wrapper(hero=load_hero()).model_dump_json())
+    assert data == {"hero": {"id": 1, "born": born.isoformat()}}
+
+
+def test_lazy_load_columns_keeps_keys(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class Hero(SQLModel, table=True, lazy_load_columns=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        born: datetime
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+
+    mapper = inspect(Hero)
+    assert mapper.attrs.born.strategy_key == (
+        ("deferred", False),
+        ("instrument", True),
+        ("sqlmodel_lazy_column", True),
+    )
+    assert mapper.attrs.id.strategy_key == (("deferred", False), ("instrument", True))
+    assert mapper.attrs.team_id.strategy_key == (
+        ("deferred", False),
+        ("instrument", True),
+    )
@@ -0,0 +1,141 @@
+import threading
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, Column, event, inspect
+
+from sqlmodel_v2_beta import Field, ReadOnlySession, Session, SQLModel, create_engine
+
+
+def test_pk_cache(clear_sqlmodel):
+    class Team(SQLModel, table=True, pk_cache={"max_size": 2}):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Team(name="Preventers"), Team(name="Z-Force")])
+        session.add(Team(name="Avengers"))
+        session.commit()
+    statements: List[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    with Session(engine) as session:
+        assert session.get(Team, 1).name == "Preventers"
+        assert session.get(Team, 99) is None
+    assert len(statements) == 2
+
+    with ReadOnlySession(engine) as session:
+        team = session.get(Team, 1)
+        assert team.name == "Preventers"
+        assert inspect(team).persistent
+        assert session.get(Team, 1) is team
+    assert len(statements) == 2
+
+    with Session(engine) as session:
+        teams = session.get_many(Team, [2, 1, 3])
+        assert [team.name for team in teams] == ["Z-Force", "Preventers", "Avengers"]
+        assert len(statements) == 3
+        teams[0].name = "Sharks"
+        session.commit()
+    # Invalidated by the UPDATE of the table
+    with Session(engine) as session:
+        assert session.get(Team, 2).name == "Sharks"
+        assert session.get(Team, 2).name == "Sharks"
+    assert len(statements) == 5
+
+
+def test_pk_cache_threads(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+        model_config = {"pk_cache": {"ttl": 60}}
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Team(name="Preventers"))
+        session.commit()
+        session.get(Team, 1)
+    teams = []
+
+    def get_team() -> None:
+        with Session(engine) as session:
+            teams.append(session.get(Team, 1))
+
+    threads = [threading.Thread(target=get_team) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [team.name for team in teams] == ["Preventers"] * 4
+    assert len({id(team) for team in teams}) == 4
+
+
+def test_pk_cache_copies(clear_sqlmodel):
+    class Profile(SQLModel, table=True, pk_cache=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        data: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Profile(data={"tags": ["a"]}))
+        session.commit()
+
+    # Not tracked in place, there's no UPDATE to invalidate the cache
+    with Session(engine) as session:
+        p1 = session.get(Profile, 1)
+        p1.data["tags"].append("loaded")
+    with Session(engine) as session:
+        p1 = session.get(Profile, 1)
+        assert p1.data == {"tags": ["a"]}
+        p1.data["tags"].append("cached")
+    with Session(engine) as session:
+        assert session.get(Profile, 1).data == {"tags": ["a"]}
+
+
+def test_pk_cache_written_while_reading(clear_sqlmodel):
+    class Team(SQLModel, table=True, pk_cache=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Team(name="Preventers"), Team(name="Z-Force")])
+        session.commit()
+    # Another database with the same table, as another process would write to it
+    other_engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(other_engine)
+    statements: List[str] = []
+    written: List[bool] = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+        if written:
+            return
+        written.append(True)
+        with Session(other_engine) as other_session:
+            other_session.add(Team(name="Avengers"))
+            other_session.commit()
+
+    # Read before the commit, not cached
+    with Session(engine) as session:
+        assert session.get(Team, 1).name == "Preventers"
+    with Session(engine) as session:
+        assert session.get(Team, 1).name == "Preventers"
+    assert len(statements) == 2
+    written.clear()
+    with Session(engine) as session:
+        teams = session.get_many(Team, [1, 2])
+        assert [team.name for team in teams] == ["Preventers", "Z-Force"]
+    with Session(engine) as session:
+        teams = session.get_many(Team, [1, 2])
+        assert [team.name for team in teams] == ["Preventers", "Z-Force"]
+    assert len(statements) == 4
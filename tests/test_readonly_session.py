@@ -0,0 +1,104 @@
+from typing import Optional
+
+import pytest
+from sqlalchemy.exc import InvalidRequestError
+
+from sqlmodel_v2_beta import (
+    Field,
+    ReadOnlySession,
+    Session,
+    SQLModel,
+    create_engine,
+    delete,
+    select,
+    text,
+)
+
+
+def test_readonly_session(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(name="Deadpond"), Hero(name="Spider-Boy")])
+        session.commit()
+
+    with ReadOnlySession(engine) as session:
+        assert session.readonly
+        heroes = session.exec(select(Hero)).all()
+        session.commit()
+        # Not expired, no queries to use them
+        assert "name" in heroes[0].__dict__
+        assert session.get(Hero, 2) is heroes[1]
+
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.add(Hero(name="Rusty-Man"))
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.delete(heroes[0])
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.exec(delete(Hero))
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.bulk_add([Hero(name="Rusty-Man")])
+        heroes[0].name = "Deadpool"
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.commit()
+        session.rollback()
+        assert heroes[0].name == "Deadpond"
+
+    with Session(engine, readonly=True) as session:
+        assert not session.autoflush
+        assert len(session.exec(select(Hero)).all()) == 2
+
+
+def test_readonly_session_rejects_writes_in_connection(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(name="Deadpond"))
+        session.commit()
+
+    with ReadOnlySession(engine) as session:
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.exec(text("DELETE FROM hero"))
+        session.rollback()
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.connection().execute(Hero.__table__.delete())
+        session.rollback()
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.connection().exec_driver_sql(" update hero set name = 'x'")
+        session.rollback()
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.exec(text("WITH x AS (SELECT 1) DELETE FROM hero"))
+        session.rollback()
+        with pytest.raises(InvalidRequestError, match="read-only"):
+            session.connection().exec_driver_sql(
+                "WITH x AS (SELECT id FROM hero)\nUPDATE hero SET name = 'x'"
+            )
+        session.rollback()
+        assert session.exec(text("SELECT name FROM hero")).scalars().all() == [
+            "Deadpond"
+        ]
+        # Functions and strings with the keywords aren't writes
+        statement = text(
+            "WITH x AS (SELECT replace(name, 'D', ') delete') AS name FROM hero) "
+            "SELECT name FROM x"
+        )
+        assert session.exec(statement).scalars().all() == [") deleteeadpond"]
+
+    # Not kept in a connection used by the session
+    with engine.connect() as connection:
+        with ReadOnlySession(bind=connection) as session:
+            with pytest.raises(InvalidRequestError, match="read-only"):
+                session.exec(text("DELETE FROM hero"))
+        connection.rollback()
+        connection.execute(Hero.__table__.delete())
+        connection.commit()
+    with Session(engine) as session:
+        assert session.exec(select(Hero)).all() == []
@@ -0,0 +1,210 @@
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import JSON, Column, event, inspect
+from sqlalchemy.orm import selectinload
+
+from sqlmodel_v2_beta import (
+    Field,
+    Relationship,
+    ResultCache,
+    Session,
+    SQLModel,
+    create_engine,
+    select,
+    update,
+)
+
+
+def create_heroes():
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(name="Deadpond"), Hero(name="Spider-Boy", age=16)])
+        session.commit()
+    statements: List[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    return Hero, engine, statements
+
+
+def test_result_cache(clear_sqlmodel):
+    Hero, engine, statements = create_heroes()
+    cache = ResultCache()
+    with Session(engine, result_cache=cache) as session:
+        heroes = session.exec(select(Hero).where(Hero.age > 10)).all()
+        cached_heroes = session.exec(select(Hero).where(Hero.age > 10)).all()
+        assert len(statements) == 1
+        assert [hero.model_dump() for hero in cached_heroes] == [
+            hero.model_dump() for hero in heroes
+        ]
+        assert cached_heroes[0] is not heroes[0]
+        assert inspect(cached_heroes[0]).detached
+        assert session.exec(select(Hero.name).where(Hero.age > 10)).all() == [
+            "Spider-Boy"
+        ]
+        # Different parameters
+        assert session.exec(select(Hero).where(Hero.age > 20)).all() == []
+        assert len(statements) == 3
+        assert len(cache) == 3
+        session.exec(select(Hero).where(Hero.age > 20), cache_ttl=0).all()
+        assert len(statements) == 4
+
+    with Session(engine) as session:
+        session.exec(update(Hero).values(age=17))
+        session.commit()
+    assert len(cache) == 0
+
+    with Session(engine, result_cache=cache) as session:
+        heroes = session.exec(select(Hero).where(Hero.age > 10)).all()
+        assert [hero.age for hero in heroes] == [17, 17]
+
+
+def test_result_cache_own_changes(clear_sqlmodel):
+    Hero, engine, statements = create_heroes()
+    cache = ResultCache()
+    with Session(engine, result_cache=cache) as session:
+        assert len(session.exec(select(Hero)).all()) == 2
+        session.add(Hero(name="Rusty-Man"))
+        # Autoflushed, not committed yet, not cached
+        assert len(session.exec(select(Hero)).all()) == 3
+        assert len(session.exec(select(Hero)).all()) == 3
+        session.rollback()
+        assert len(session.exec(select(Hero)).all()) == 2
+        assert len(session.exec(select(Hero)).all()) == 2
+        assert [statement.split()[0] for statement in statements] == [
+            "SELECT",
+            "INSERT",
+            "SELECT",
+            "SELECT",
+            "SELECT",
+        ]
+
+
+def test_result_cache_eviction(clear_sqlmodel):
+    Hero, engine, statements = create_heroes()
+    cache = ResultCache(max_entries=2, ttl=0.05)
+    with Session(engine, result_cache=cache) as session:
+        for age in (1, 2, 1, 3):
+            session.exec(select(Hero.name).where(Hero.age > age)).all()
+        # The least recently used removed
+        assert len(statements) == 3
+        session.exec(select(Hero.name).where(Hero.age > 1)).all()
+        session.exec(select(Hero.name).where(Hero.age > 2)).all()
+        assert len(statements) == 4
+        time.sleep(0.05)
+        # Expired, cached again for longer
+        session.exec(select(Hero.name).where(Hero.age > 1), cache_ttl=10).all()
+        time.sleep(0.05)
+        session.exec(select(Hero.name).where(Hero.age > 1)).all()
+        assert len(statements) == 5
+
+    cache = ResultCache(max_bytes=1000)
+    with Session(engine, result_cache=cache) as session:
+        session.exec(select(Hero)).all()
+        session.exec(select(Hero.name)).all()
+        assert len(cache) == 1
+        assert cache.size <= 1000
+
+
+def test_result_cache_copies(clear_sqlmodel):
+    class Hero(SQLModel, table=True, lazy_load_columns=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        born: datetime
+        data: Dict[str, Any] = Field(default_factory=dict, sa_column=Column(JSON))
+
+    born = datetime(2000, 1, 2)
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Hero(born=born, data={"powers": ["speed"]}))
+        session.commit()
+
+    cache = ResultCache()
+    with Session(engine, result_cache=cache) as session:
+        hero = session.exec(select(Hero)).one()
+        hero.data["powers"].append("loaded")
+        cached_hero = session.exec(select(Hero)).one()
+        # Converted before caching, the detached copy has it
+        assert cached_hero.born == born
+        assert cached_hero.data == {"powers": ["speed"]}
+        cached_hero.data["powers"].append("cached")
+        data = session.exec(select(Hero.data)).one()
+        data["powers"].append("scalar")
+
+    with Session(engine, result_cache=cache) as session:
+        assert session.exec(select(Hero)).one().data == {"powers": ["speed"]}
+        assert session.exec(select(Hero.data)).one() == {"powers": ["speed"]}
+
+
+def test_result_cache_not_cached(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Team(name="Preventers", heroes=[Hero(name="Deadpond")]))
+        session.commit()
+    statements: List[str] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def before_cursor_execute(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    cache = ResultCache()
+    with Session(engine, result_cache=cache) as session:
+        # Loaded by the options, not in the cached column values
+        statement = select(Team).options(selectinload(Team.heroes))
+        for _ in range(2):
+            team = session.exec(statement).all()[0]
+            assert [hero.name for hero in team.heroes] == ["Deadpond"]
+        # The rows have to be locked by the database
+        for _ in range(2):
+            session.exec(select(Hero).with_for_update()).all()
+        session.exec(select(Hero).execution_options(populate_existing=True)).all()
+        assert len(cache) == 0
+        assert len(statements) == 7
+
+
+def test_result_cache_written_while_reading(clear_sqlmodel):
+    Hero, engine, statements = create_heroes()
+    # Another database with the same table, as another process would write to it
+    other_engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(other_engine)
+    cache = ResultCache()
+    written: List[bool] = []
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def after_cursor_execute(*args):
+        if written:
+            return
+        written.append(True)
+        with Session(other_engine) as other_session:
+            other_session.exec(update(Hero).values(age=17))
+            other_session.commit()
+
+    with Session(engine, result_cache=cache) as session:
+        session.exec(select(Hero)).all()
+        # Read before the commit, not cached
+        assert len(cache) == 0
+        session.exec(select(Hero)).all()
+        assert len(cache) == 1
+        assert len(statements) == 2
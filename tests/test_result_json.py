@@ -0,0 +1,108 @@
+import asyncio
+import json
+from typing import Optional
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from sqlalchemy.pool import StaticPool
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def test_iter_json_array(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Hero(name=f"Hero {i}", age=i) for i in range(5))
+        session.commit()
+
+    with Session(engine) as session:
+        statement = select(Hero).execution_options(yield_per=2)
+        chunks = list(session.exec(statement).iter_json(chunk_size=2))
+        assert len(chunks) == 4
+        assert chunks[-1] == b"]"
+        assert json.loads(b"".join(chunks)) == [
+            {"id": i + 1, "name": f"Hero {i}", "age": i} for i in range(5)
+        ]
+
+        empty = select(Hero).where(Hero.age > 10)
+        assert list(session.exec(empty).iter_json()) == [b"[]"]
+
+        names = session.exec(select(Hero.name).where(Hero.age < 2)).iter_json()
+        assert json.loads(b"".join(names)) == ["Hero 0", "Hero 1"]
+
+
+def test_iter_json_ndjson(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(Hero(name=f"Hero {i}", age=i) for i in range(3))
+        session.commit()
+
+    with Session(engine) as session:
+        result = session.exec(select(Hero)).iter_json(format="ndjson", chunk_size=2)
+        data = b"".join(result)
+        assert data.endswith(b"\n")
+        assert [json.loads(line) for line in data.splitlines()] == [
+            {"id": i + 1, "name": f"Hero {i}", "age": i} for i in range(3)
+        ]
+        empty = select(Hero).where(Hero.age > 10)
+        assert list(session.exec(empty).iter_json(format="ndjson")) == []
+        with pytest.raises(ValueError):
+            list(session.exec(select(Hero)).iter_json(format="csv"))  # type: ignore
+
+
+def test_iter_json_streaming_response(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all([Hero(name="Deadpond"), Hero(name="Spider-Boy")])
+        session.commit()
+
+    app = FastAPI()
+
+    @app.get("/heroes/")
+    def read_heroes():
+        def stream():
+            with Session(engine) as session:
+                yield from session.exec(select(Hero)).iter_json()
+
+        return StreamingResponse(stream(), media_type="application/json")
+
+    # Run the app in this thread, a TestClient imports the event loop modules in
+    # its own thread, where a SQLite connection left to the garbage collector by
+    # another test can be finalized during the import and fail it
+    async def get_heroes() -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://testserver"
+        ) as client:
+            return await client.get("/heroes/")
+
+    response = asyncio.run(get_heroes())
+    assert response.status_code == 200
+    assert response.json() == [
+        {"id": 1, "name": "Deadpond"},
+        {"id": 2, "name": "Spider-Boy"},
+    ]
+    engine.dispose()
@@ -0,0 +1,66 @@
+from typing import Optional
+
+import pytest
+from pydantic import ValidationError, field_validator
+
+from sqlmodel_v2_beta import Field, SQLModel
+
+
+class TeamBase(SQLModel):
+    name: str
+
+
+class HeroBase(SQLModel):
+    name: str = Field(index=True)
+    age: Optional[int] = None
+    team: Optional[TeamBase] = None
+
+
+def test_reuse_parent_schema():
+    class HeroCreate(HeroBase):
+        """Data to create a hero"""
+
+        def display_name(self) -> str:
+            return self.name.title()
+
+    parent_schema = HeroBase.__pydantic_core_schema__
+    schema = HeroCreate.__pydantic_core_schema__
+    assert schema["schema"]["fields"] is parent_schema["schema"]["fields"]
+    assert schema["cls"] is HeroCreate
+    assert "defer_build" not in HeroCreate.model_config
+
+    hero = HeroCreate(name="deadpond", team={"name": "Preventers"})
+    assert type(hero) is HeroCreate
+    assert hero.display_name() == "Deadpond"
+    assert hero.team == TeamBase(name="Preventers")
+    assert HeroCreate.model_validate(hero.model_dump()) == hero
+    with pytest.raises(ValidationError) as exc_info:
+        HeroCreate(name="Rusty-Man", age="old")
+    assert exc_info.value.title == "HeroCreate"
+
+    json_schema = HeroCreate.model_json_schema()
+    assert json_schema["title"] == "HeroCreate"
+    assert json_schema["description"] == "Data to create a hero"
+    assert json_schema["properties"] == HeroBase.model_json_schema()["properties"]
+
+
+def test_schema_not_reused():
+    class HeroRead(HeroBase):
+        id: int
+
+    class HeroUpdate(HeroBase):
+        @field_validator("name")
+        @classmethod
+        def strip_name(cls, v: str) -> str:
+            return v.strip()
+
+    class HeroStrict(HeroBase, extra="forbid"):
+        pass
+
+    parent_fields = HeroBase.__pydantic_core_schema__["schema"]["fields"]
+    for model in (HeroRead, HeroUpdate, HeroStrict):
+        assert model.__pydantic_core_schema__["schema"]["fields"] is not parent_fields
+    assert HeroRead(id=1, name="Deadpond").id == 1
+    assert HeroUpdate(name=" Deadpond ").name == "Deadpond"
+    with pytest.raises(ValidationError):
+        HeroStrict(name="Deadpond", power="fly")
@@ -0,0 +1,86 @@
+import json
+from typing import Optional
+
+from pydantic import computed_field, field_serializer
+from sqlalchemy.orm import defer
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def test_dump_json_many_loaded_instances(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        secret_name: str
+        age: Optional[int] = None
+
+        @field_serializer("name")
+        def upper_name(self, name: str) -> str:
+            return name.upper()
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        hero_1 = Hero(name="Deadpond", secret_name="Dive Wilson")
+        hero_2 = Hero(name="Spider-Boy", secret_name="Pedro Parqueador", age=16)
+        session.add_all([hero_1, hero_2])
+        session.commit()
+        # Expired after the commit
+        assert json.loads(Hero.model_dump_json_many([hero_1, hero_2])) == [
+            {"id": 1, "name": "DEADPOND", "secret_name": "Dive Wilson", "age": None},
+            {
+                "id": 2,
+                "name": "SPIDER-BOY",
+                "secret_name": "Pedro Parqueador",
+                "age": 16,
+            },
+        ]
+
+    with Session(engine) as session:
+        heroes = session.exec(select(Hero).options(defer(Hero.age))).all()
+        assert "age" not in heroes[0].__dict__
+        data = Hero.model_dump_json_many(heroes, exclude_none=True)
+        assert isinstance(data, bytes)
+        assert json.loads(data) == [
+            {"id": 1, "name": "DEADPOND", "secret_name": "Dive Wilson"},
+            {
+                "id": 2,
+                "name": "SPIDER-BOY",
+                "secret_name": "Pedro Parqueador",
+                "age": 16,
+            },
+        ]
+        assert Hero.model_dump_json_many([]) == b"[]"
+
+
+def test_dump_json_many_computed_field(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+        @computed_field
+        @property
+        def title(self) -> str:
+            return f"The {self.name}"
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        hero = Hero(name="Deadpond")
+        session.add(hero)
+        session.commit()
+        assert json.loads(Hero.model_dump_json_many([hero], indent=2)) == [
+            {"id": 1, "name": "Deadpond", "title": "The Deadpond"}
+        ]
+
+
+def test_dump_json_many_plain_model(clear_sqlmodel):
+    class HeroRead(SQLModel):
+        id: int
+        name: str
+
+    heroes = [HeroRead(id=1, name="Deadpond"), HeroRead(id=2, name="Spider-Boy")]
+    assert (
+        HeroRead.model_dump_json_many(heroes)
+        == b'[{"id":1,"name":"Deadpond"},{"id":2,"name":"Spider-Boy"}]'
+    )
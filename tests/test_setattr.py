@@ -0,0 +1,80 @@
+from typing import List, Optional
+
+from pydantic import PrivateAttr
+from sqlalchemy import inspect
+
+from sqlmodel_v2_beta import Field, Relationship, Session, SQLModel, create_engine
+from sqlmodel_v2_beta.main import (
+    _set_instance_state,
+    _set_instrumented_attribute,
+    _set_pydantic_attribute,
+    _set_relationship_attribute,
+)
+
+
+def test_setattr_dispatch_table(clear_sqlmodel):
+    class Team(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        heroes: List["Hero"] = Relationship(back_populates="team")
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        team_id: Optional[int] = Field(default=None, foreign_key="team.id")
+        team: Optional[Team] = Relationship(back_populates="heroes")
+
+    class HeroRead(SQLModel):
+        id: int
+        name: str
+
+    assert Hero.__sqlmodel_setattr_dispatch__ == {
+        "_sa_instance_state": _set_instance_state,
+        "id": _set_instrumented_attribute,
+        "name": _set_instrumented_attribute,
+        "team_id": _set_instrumented_attribute,
+        "team": _set_relationship_attribute,
+    }
+    assert HeroRead.__sqlmodel_setattr_dispatch__ == {
+        "_sa_instance_state": _set_instance_state,
+        "id": _set_pydantic_attribute,
+        "name": _set_pydantic_attribute,
+    }
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        team = Team(name="Preventers")
+        hero = Hero(name="Deadpond")
+        session.add(hero)
+        session.commit()
+        session.refresh(hero)
+
+        hero.name = "Deadpond Jr."
+        hero.team = team
+        assert "name" in hero.__pydantic_fields_set__
+        assert "team" not in hero.__pydantic_fields_set__
+        assert "team" not in hero.__dict__ or hero.__dict__["team"] is team
+        assert inspect(hero).attrs.name.history.added == ["Deadpond Jr."]
+        assert team.heroes == [hero]
+        session.commit()
+        session.refresh(hero)
+        assert hero.name == "Deadpond Jr."
+        assert hero.team_id == team.id
+
+    hero_read = HeroRead(id=1, name="Deadpond")
+    hero_read.name = "Spider-Boy"
+    assert hero_read.name == "Spider-Boy"
+
+
+def test_setattr_private_attribute_uses_fallback(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        _secret: str = PrivateAttr(default="Dive Wilson")
+
+    hero = Hero(name="Deadpond")
+    assert "_secret" not in Hero.__sqlmodel_setattr_dispatch__
+    hero._secret = "Pedro Parqueador"
+    assert hero._secret == "Pedro Parqueador"
+    assert "_secret" not in hero.__pydantic_fields_set__
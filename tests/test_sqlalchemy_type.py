@@ -0,0 +1,69 @@
+from enum import Enum
+from typing import Any, Optional
+
+import pytest
+from sqlalchemy import Boolean, Integer, String
+
+from sqlmodel_v2_beta import Field, SQLModel, register_sqlalchemy_type
+from sqlmodel_v2_beta.main import get_sqlalchemy_type
+
+
+class Color:
+    def __init__(self, value: str) -> None:
+        self.value = value
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: Any) -> Any:
+        from pydantic_core import core_schema
+
+        return core_schema.no_info_plain_validator_function(cls)
+
+
+class DarkColor(Color):
+    pass
+
+
+def test_register_sqlalchemy_type(clear_sqlmodel):
+    with pytest.raises(ValueError):
+
+        class Paint(SQLModel, table=True):
+            id: Optional[int] = Field(default=None, primary_key=True)
+            color: Color
+
+    calls = []
+
+    def color_type(annotation: Any, metadata: Any) -> Any:
+        calls.append(annotation)
+        return String(getattr(metadata, "max_length", None) or 7)
+
+    register_sqlalchemy_type(Color, color_type)
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        color: Color
+        cape_color: Optional[Color] = None
+        eyes_color: DarkColor = Field(max_length=20)
+
+    columns = Hero.__table__.c
+    assert isinstance(columns.color.type, String)
+    assert columns.color.type.length == 7
+    assert columns.cape_color.nullable
+    assert columns.eyes_color.type.length == 20
+    # Memoized by annotation and metadata
+    assert columns.color.type is columns.cape_color.type
+    assert calls == [Color, DarkColor]
+
+
+def test_sqlalchemy_type_from_mro():
+    class Flag(int, Enum):
+        on = 1
+
+    class Visible(SQLModel):
+        visible: bool
+        count: int
+        flag: Flag
+
+    fields = Visible.model_fields
+    assert get_sqlalchemy_type(fields["visible"]) is Boolean
+    assert get_sqlalchemy_type(fields["count"]) is Integer
+    assert get_sqlalchemy_type(fields["flag"]) is Integer
@@ -0,0 +1,74 @@
+from typing import Optional
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def test_upsert(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str = Field(unique=True)
+        age: Optional[int] = None
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        result = session.upsert([Hero(name="Deadpond", age=48), Hero(name="Rusty-Man")])
+        assert result == (2, 0)
+        heroes = [
+            Hero(name="Deadpond", age=49),
+            Hero(name="Spider-Boy", age=16),
+            Hero(name="Spider-Boy", age=17),
+        ]
+        # The last Spider-Boy is written, the same in all the dialects
+        result = session.upsert(heroes, conflict_on=["name"])
+        assert (result.inserted, result.updated) == (1, 1)
+        session.commit()
+        assert len(session.identity_map) == 0
+        rows = session.exec(select(Hero.id, Hero.name, Hero.age)).all()
+        assert rows == [
+            (1, "Deadpond", 49),
+            (2, "Rusty-Man", None),
+            (3, "Spider-Boy", 17),
+        ]
+
+        result = session.upsert([Hero(id=2, name="Tarantula", age=32)], update=[])
+        assert result == (0, 0)
+        result = session.upsert([Hero(id=2, name="Tarantula", age=32)], update=["age"])
+        assert result == (0, 1)
+        result = session.upsert([Hero(id=4, name="Tarantula", age=32)], update=["age"])
+        assert result == (1, 0)
+        rows = session.exec(select(Hero.id, Hero.name, Hero.age)).all()
+        assert rows[1:] == [
+            (2, "Rusty-Man", 32),
+            (3, "Spider-Boy", 17),
+            (4, "Tarantula", 32),
+        ]
+
+
+def test_upsert_composite_key(clear_sqlmodel):
+    class HeroTeam(SQLModel, table=True):
+        hero_id: int = Field(primary_key=True)
+        team_id: int = Field(primary_key=True)
+        role: str
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(HeroTeam(hero_id=1, team_id=2, role="member"))
+        session.commit()
+        links = [
+            HeroTeam(hero_id=1, team_id=2, role="leader"),
+            HeroTeam(hero_id=2, team_id=2, role="member"),
+        ]
+        assert session.upsert(links, batch_size=1) == (1, 1)
+        roles = session.exec(select(HeroTeam.role).order_by(HeroTeam.hero_id)).all()
+        assert roles == ["leader", "member"]
+
+        links = [
+            HeroTeam(hero_id=3, team_id=2, role="member"),
+            HeroTeam(hero_id=1, team_id=2, role="member"),
+            HeroTeam(hero_id=3, team_id=2, role="leader"),
+        ]
+        assert session.upsert(links) == (1, 1)
+        roles = session.exec(select(HeroTeam.role).order_by(HeroTeam.hero_id)).all()
+        assert roles == ["member", "member", "leader"]
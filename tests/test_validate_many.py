@@ -0,0 +1,121 @@
+from typing import List, Optional
+
+import pytest
+from pydantic import ValidationError, model_validator
+from sqlalchemy import inspect
+
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
+
+
+def test_validate_many_table_model(clear_sqlmodel):
+    class HeroBase(SQLModel):
+        name: str
+        age: Optional[int] = None
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class HeroCreate(HeroBase):
+        pass
+
+    heroes = Hero.model_validate_many(
+        [
+            {"name": "Deadpond", "age": "48"},
+            HeroCreate(name="Spider-Boy"),
+            {"name": "Rusty-Man"},
+        ]
+    )
+    assert [hero.name for hero in heroes] == ["Deadpond", "Spider-Boy", "Rusty-Man"]
+    assert heroes[0].age == 48
+    assert heroes[0].__pydantic_fields_set__ == {"name", "age"}
+    assert heroes[1].__pydantic_fields_set__ == {"name"}
+    for hero in heroes:
+        assert isinstance(hero, Hero)
+        assert inspect(hero).transient
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add_all(heroes)
+        session.commit()
+        db_heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+    assert [hero.name for hero in db_heroes] == ["Deadpond", "Spider-Boy", "Rusty-Man"]
+
+
+def test_validate_many_accepts_iterables(clear_sqlmodel):
+    class Hero(SQLModel):
+        name: str
+
+    heroes = Hero.model_validate_many({"name": name} for name in ["a", "b"])
+    assert heroes == [Hero(name="a"), Hero(name="b")]
+
+
+def test_validate_many_raises_with_row_index(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+    with pytest.raises(ValidationError) as exc_info:
+        Hero.model_validate_many([{"name": "Deadpond"}, {"name": "x", "age": "old"}])
+    assert [error["loc"] for error in exc_info.value.errors()] == [(1, "age")]
+
+
+def test_validate_many_collect_errors(clear_sqlmodel):
+    validated = []
+
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+        age: Optional[int] = None
+
+        @model_validator(mode="after")
+        def check_age(self):
+            validated.append(self.name)
+            assert self.age is None or self.age >= 0
+            return self
+
+    heroes, errors = Hero.model_validate_many(
+        [
+            {"name": "Deadpond"},
+            {"name": "Spider-Boy", "age": "young"},
+            {"name": "Rusty-Man", "age": 48},
+            {"name": "Tarantula", "age": -1},
+        ],
+        collect_errors=True,
+    )
+    assert [hero.name for hero in heroes] == ["Deadpond", "Rusty-Man"]
+    assert all(inspect(hero).transient for hero in heroes)
+    assert list(errors) == [1, 3]
+    assert errors[1][0]["loc"] == ("age",)
+    assert errors[1][0]["type"] == "int_parsing"
+    assert errors[3][0]["type"] == "assertion_error"
+    # The valid rows are not validated again
+    assert validated == ["Deadpond", "Rusty-Man", "Tarantula"]
+
+
+def test_validate_many_model_validator_sets_attribute(clear_sqlmodel):
+    class Hero(SQLModel, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+        name: str
+
+        @model_validator(mode="after")
+        def upper_name(self):
+            self.name = self.name.upper()
+            return self
+
+    heroes = Hero.model_validate_many([{"name": "Deadpond"}])
+    assert heroes[0].name == "DEADPOND"
+    assert inspect(heroes[0]).transient
+
+
+def test_validate_many_recursive_model(clear_sqlmodel):
+    class Node(SQLModel):
+        name: str
+        children: List["Node"] = []
+
+    nodes = Node.model_validate_many(
+        [{"name": "a", "children": [{"name": "b"}]}, {"name": "c"}]
+    )
+    assert nodes[0].children[0].name == "b"
+    assert nodes[1].children == []
@@ -3,8 +3,9 @@ from typing import Optional
 import pytest
 from pydantic import field_validator
 from pydantic.error_wrappers import ValidationError
+from sqlalchemy import inspect
 
-from sqlmodel_v2_beta import SQLModel
+from sqlmodel_v2_beta import Field, Session, SQLModel, create_engine, select
 
 
 def test_validation(clear_sqlmodel):
@@ -32,3 +33,44 @@ def test_validation(clear_sqlmodel):
 
     with pytest.raises(ValidationError):
         Hero.model_validate({"name": None, "age": 25})
+
+
+def test_model_validate_table_model_validates_once(clear_sqlmodel):
+    calls = []
+
+    class HeroBase(SQLModel):
+        name: str
+        age: Optional[int] = None
+
+        @field_validator("name")
+        def count_calls(cls, v):
+            calls.append(v)
+            return v
+
+    class Hero(HeroBase, table=True):
+        id: Optional[int] = Field(default=None, primary_key=True)
+
+    class HeroCreate(HeroBase):
+        pass
+
+    hero_create = HeroCreate(name="Deadpond")
+    calls.clear()
+    hero = Hero.model_validate(hero_create)
+    assert calls == ["Deadpond"]
+    assert hero.__pydantic_fields_set__ == {"name"}
+    assert inspect(hero).transient
+
+    hero_2 = Hero.model_validate({"name": "Spider-Boy", "age": None})
+    assert hero_2.__pydantic_fields_set__ == {"name", "age"}
+
+    with pytest.raises(ValidationError):
+        Hero.model_validate({"age": 25})
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(hero)
+        session.add(hero_2)
+        session.commit()
+        heroes = session.exec(select(Hero).order_by(Hero.id)).all()
+    assert [(h.id, h.name) for h in heroes] == [(1, "Deadpond"), (2, "Spider-Boy")]